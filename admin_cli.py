@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Admin commands for the BPM cache: add, list and delete entries.
+
+Usage:
+    python admin_cli.py add <artist> <title> <bpm>
+    python admin_cli.py list <artist>
+    python admin_cli.py delete <artist> [<title>]
+"""
+
+import argparse
+import functools
+from datetime import datetime, timezone
+
+from config.settings import settings
+from pymongo import MongoClient
+from src.cache.mongodb_cache import CASE_INSENSITIVE
+
+# Fields shown when listing entries; skips the metadata sub-document
+LIST_PROJECTION = {"artist": 1, "title": 1, "bpm": 1}
+
+
+@functools.lru_cache(maxsize=1)
+def _client() -> MongoClient:
+    """Return the process-wide MongoClient, created on first use.
+
+    All admin commands share this client so a run that performs several
+    operations pays for one connection handshake and topology scan. The
+    client is left open and torn down at interpreter exit.
+    """
+    return MongoClient(
+        settings.MONGODB_URI,
+        maxPoolSize=50,
+        minPoolSize=5,
+        maxIdleTimeMS=300_000,
+        serverSelectionTimeoutMS=5000
+    )
+
+
+def _collection():
+    """Return the bpm_cache collection."""
+    return _client()[settings.MONGODB_DATABASE].bpm_cache
+
+
+def add(artist: str, title: str, bpm: float):
+    """Add or update a cache entry."""
+    artist_lc, title_lc = artist.lower(), title.lower()
+    _collection().update_one(
+        {
+            "artist": artist_lc,
+            "title": title_lc
+        },
+        {
+            "$set": {
+                "artist": artist_lc,
+                "title": title_lc,
+                "bpm": bpm,
+                "last_updated": datetime.now(timezone.utc),
+                "metadata": {
+                    "source": "manual",
+                    "original_artist": artist,
+                    "original_title": title
+                }
+            }
+        },
+        upsert=True
+    )
+
+    print(f"Added to cache: {artist} - {title} = {bpm} BPM")
+
+
+def list_entries(artist: str) -> list:
+    """Print all cache entries for an artist and return their _ids.
+
+    Entries are streamed from the cursor in batches rather than loaded into
+    memory at once.
+    """
+    cursor = _collection().find(
+        {"artist": artist},
+        LIST_PROJECTION,
+        collation=CASE_INSENSITIVE
+    ).batch_size(50)
+
+    ids = []
+    for entry in cursor:
+        print(f"Found: {entry['artist']} - {entry['title']}")
+        print(f"  BPM: {entry.get('bpm')}")
+        print(f"  ID: {entry.get('_id')}")
+        print()
+        ids.append(entry["_id"])
+
+    return ids
+
+
+def delete_ids(ids: list) -> int:
+    """Delete entries by _id (as returned by list_entries)."""
+    if not ids:
+        return 0
+    return _collection().delete_many({"_id": {"$in": ids}}).deleted_count
+
+
+def delete_entry(artist: str, title: str):
+    """Delete a single entry and return it, or None if it was not cached.
+
+    Uses find_one_and_delete so the lookup and the delete are one atomic
+    round trip.
+    """
+    return _collection().find_one_and_delete(
+        {
+            "artist": artist.lower(),
+            "title": title.lower()
+        },
+        projection={"bpm": 1}
+    )
+
+
+def delete(artist: str, title: str = None) -> int:
+    """Delete one entry, or every entry for an artist when no title is given."""
+    if title:
+        return 1 if delete_entry(artist, title) else 0
+
+    result = _collection().delete_many(
+        {"artist": artist},
+        collation=CASE_INSENSITIVE
+    )
+    return result.deleted_count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage the MetroMatch BPM cache")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    add_parser = subparsers.add_parser('add', help='Add a song to the cache')
+    add_parser.add_argument('artist', help='Artist name')
+    add_parser.add_argument('title', help='Song title')
+    add_parser.add_argument('bpm', type=float, help='BPM value')
+
+    list_parser = subparsers.add_parser('list', help='List cache entries for an artist')
+    list_parser.add_argument('artist', help='Artist name (case-insensitive)')
+
+    delete_parser = subparsers.add_parser('delete', help='Delete cache entries')
+    delete_parser.add_argument('artist', help='Artist name')
+    delete_parser.add_argument('title', nargs='?', help='Song title (omit to delete all for artist)')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'add':
+        add(args.artist, args.title, args.bpm)
+    elif args.command == 'list':
+        if not list_entries(args.artist):
+            print(f"No {args.artist} entries found in cache")
+    elif args.command == 'delete':
+        deleted = delete(args.artist, args.title)
+        print(f"Deleted {deleted} entries")
+
+
+if __name__ == "__main__":
+    main()
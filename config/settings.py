@@ -1,36 +1,88 @@
 """MetroMatch Configuration - Load settings from environment variables."""
 
 import os
+from dataclasses import dataclass
+from functools import cache
 from dotenv import load_dotenv
 
-load_dotenv()
 
-# API Configuration
-GETSONGBPM_API_KEY = os.getenv('GETSONGBPM_API_KEY', '')
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Application settings parsed once from the environment."""
 
-# Spotify API (for album covers)
-SPOTIFY_CLIENT_ID = os.getenv('SPOTIFY_CLIENT_ID', '')
-SPOTIFY_CLIENT_SECRET = os.getenv('SPOTIFY_CLIENT_SECRET', '')
+    # API Configuration
+    GETSONGBPM_API_KEY: str
 
-# Album Cover Settings
-ENABLE_ALBUM_COVERS = os.getenv('ENABLE_ALBUM_COVERS', 'true').lower() == 'true'
+    # Spotify API (for album covers)
+    SPOTIFY_CLIENT_ID: str
+    SPOTIFY_CLIENT_SECRET: str
 
-# MongoDB Configuration
-MONGODB_URI = os.getenv('MONGODB_URI', 'mongodb://localhost:27017')
-MONGODB_DATABASE = os.getenv('MONGODB_DATABASE', 'metromatch')
+    # Album Cover Settings
+    ENABLE_ALBUM_COVERS: bool
 
-# Application Settings
-USE_SCRAPER = os.getenv('USE_SCRAPER', 'true').lower() == 'true'
-AUTO_SYNC = os.getenv('AUTO_SYNC', 'false').lower() == 'true'
-DEFAULT_BPM = int(os.getenv('DEFAULT_BPM', '120'))
+    # MongoDB Configuration
+    MONGODB_URI: str
+    MONGODB_DATABASE: str
 
-# Rate Limiting
-API_RATE_LIMIT = float(os.getenv('API_RATE_LIMIT', '0.5'))
-SCRAPER_RATE_LIMIT = float(os.getenv('SCRAPER_RATE_LIMIT', '1.5'))
+    # Application Settings
+    USE_SCRAPER: bool
+    AUTO_SYNC: bool
+    DEFAULT_BPM: int
 
-# Logging
-LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
-LOG_FILE = os.getenv('LOG_FILE', 'metromatch.log')
+    # Rate Limiting
+    API_RATE_LIMIT: float
+    SCRAPER_RATE_LIMIT: float
 
-# Metronome Settings
-SOUND_BACKEND = os.getenv('SOUND_BACKEND', 'auto')
\ No newline at end of file
+    # Logging
+    LOG_LEVEL: str
+    LOG_FILE: str
+
+    # Metronome Settings
+    SOUND_BACKEND: str
+
+
+@cache
+def load_settings() -> Settings:
+    """Load .env and parse the environment once per process.
+
+    Set METROMATCH_SKIP_DOTENV=1 when the environment is already populated
+    (containers, CI) to skip searching for and parsing a .env file.
+    """
+    if not os.getenv('METROMATCH_SKIP_DOTENV'):
+        load_dotenv()
+
+    return Settings(
+        GETSONGBPM_API_KEY=os.getenv('GETSONGBPM_API_KEY', ''),
+        SPOTIFY_CLIENT_ID=os.getenv('SPOTIFY_CLIENT_ID', ''),
+        SPOTIFY_CLIENT_SECRET=os.getenv('SPOTIFY_CLIENT_SECRET', ''),
+        ENABLE_ALBUM_COVERS=os.getenv('ENABLE_ALBUM_COVERS', 'true').lower() == 'true',
+        MONGODB_URI=os.getenv('MONGODB_URI', 'mongodb://localhost:27017'),
+        MONGODB_DATABASE=os.getenv('MONGODB_DATABASE', 'metromatch'),
+        USE_SCRAPER=os.getenv('USE_SCRAPER', 'true').lower() == 'true',
+        AUTO_SYNC=os.getenv('AUTO_SYNC', 'false').lower() == 'true',
+        DEFAULT_BPM=int(os.getenv('DEFAULT_BPM', '120')),
+        API_RATE_LIMIT=float(os.getenv('API_RATE_LIMIT', '0.5')),
+        SCRAPER_RATE_LIMIT=float(os.getenv('SCRAPER_RATE_LIMIT', '1.5')),
+        LOG_LEVEL=os.getenv('LOG_LEVEL', 'INFO'),
+        LOG_FILE=os.getenv('LOG_FILE', 'metromatch.log'),
+        SOUND_BACKEND=os.getenv('SOUND_BACKEND', 'auto'),
+    )
+
+
+settings = load_settings()
+
+# Module-level names kept for existing `from config.settings import X` callers
+GETSONGBPM_API_KEY = settings.GETSONGBPM_API_KEY
+SPOTIFY_CLIENT_ID = settings.SPOTIFY_CLIENT_ID
+SPOTIFY_CLIENT_SECRET = settings.SPOTIFY_CLIENT_SECRET
+ENABLE_ALBUM_COVERS = settings.ENABLE_ALBUM_COVERS
+MONGODB_URI = settings.MONGODB_URI
+MONGODB_DATABASE = settings.MONGODB_DATABASE
+USE_SCRAPER = settings.USE_SCRAPER
+AUTO_SYNC = settings.AUTO_SYNC
+DEFAULT_BPM = settings.DEFAULT_BPM
+API_RATE_LIMIT = settings.API_RATE_LIMIT
+SCRAPER_RATE_LIMIT = settings.SCRAPER_RATE_LIMIT
+LOG_LEVEL = settings.LOG_LEVEL
+LOG_FILE = settings.LOG_FILE
+SOUND_BACKEND = settings.SOUND_BACKEND
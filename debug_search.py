@@ -1,30 +1,37 @@
 #!/usr/bin/env python3
 """Debug the search page HTML structure."""
 
+import functools
 import requests
 from bs4 import BeautifulSoup
 
-def main():
+SEARCH_URL = "https://songbpm.com/search"
+
+
+@functools.lru_cache(maxsize=1)
+def _session() -> requests.Session:
+    """Return a shared keep-alive session so repeated searches reuse one connection."""
     session = requests.Session()
     session.headers.update({
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
     })
+    return session
 
-    # Search for CZARFACE
-    url = "https://songbpm.com/search"
-    params = {"q": "CZARFACE Break in the Action"}
 
-    response = session.get(url, params=params, timeout=10)
-    soup = BeautifulSoup(response.content, 'html.parser')
+def fetch_search_page(query: str) -> requests.Response:
+    """Fetch the songbpm.com search page for a query."""
+    return _session().get(SEARCH_URL, params={"q": query}, timeout=10)
+
+
+def main():
+    # Search for CZARFACE
+    response = fetch_search_page("CZARFACE Break in the Action")
+    soup = BeautifulSoup(response.content, 'lxml')
 
     # Look for all links with "czarface" in them
     print("Looking for CZARFACE links...\n")
 
-    all_links = soup.find_all('a', href=True)
-    czarface_links = [
-        link for link in all_links
-        if 'czarface' in link.get('href', '').lower()
-    ]
+    czarface_links = soup.select('a[href*="czarface" i]')
 
     if czarface_links:
         print(f"Found {len(czarface_links)} CZARFACE links:\n")
@@ -38,10 +45,7 @@ def main():
         print("No CZARFACE links found!")
         print("\nSearching for any /@.../ links with 'break' in them:")
 
-        break_links = [
-            link for link in all_links
-            if 'break' in link.get('href', '').lower() and '/@' in link.get('href', '')
-        ]
+        break_links = soup.select('a[href*="break" i][href*="/@"]')
 
         for link in break_links[:10]:
             href = link.get('href')
@@ -51,7 +55,7 @@ def main():
 
     # Save HTML for inspection
     with open('search_page.html', 'w') as f:
-        f.write(soup.prettify())
+        f.write(response.text)
     print("\nSaved full HTML to search_page.html for inspection")
 
 if __name__ == "__main__":
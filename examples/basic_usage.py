@@ -1,17 +1,33 @@
 """Basic usage example for MetroMatch."""
 
-import sys
-from pathlib import Path
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from src.manager import BPMManager
 
-import time
+import threading
 from config import settings
 
 
+def wait_for_beats(metronome, beats: int):
+    """Block until the metronome has played the given number of beats.
+
+    Uses the metronome's on_beat callback, so the wait ends exactly on a beat
+    boundary instead of after a wall-clock sleep.
+    """
+    remaining = [beats]
+    done = threading.Event()
+
+    def on_beat(beat_count, bpm):
+        remaining[0] -= 1
+        if remaining[0] <= 0:
+            done.set()
+
+    metronome.on_beat = on_beat
+    try:
+        # Generous timeout in case the metronome thread dies
+        done.wait(timeout=beats * 60.0 / metronome.bpm + 5)
+    finally:
+        metronome.on_beat = None
+
+
 def main():
     """Basic usage example."""
     print("="*50)
@@ -49,9 +65,9 @@ def main():
 
     manager.start_metronome(120)
     print("Metronome started at 120 BPM")
-    print("Playing for 5 seconds...\n")
+    print("Playing for 10 beats...\n")
 
-    time.sleep(5)
+    wait_for_beats(manager.metronome, 10)
 
     manager.stop_metronome()
     print("Metronome stopped\n")
@@ -62,11 +78,11 @@ def main():
 
     manager.start_metronome(100)
     print("Metronome started at 100 BPM")
-    time.sleep(3)
+    wait_for_beats(manager.metronome, 5)
 
     manager.metronome.set_bpm(140)
     print("Changed to 140 BPM")
-    time.sleep(3)
+    wait_for_beats(manager.metronome, 7)
 
     manager.stop_metronome()
     print("Metronome stopped\n")
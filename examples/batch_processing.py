@@ -1,13 +1,9 @@
 """Example showing batch BPM detection for multiple songs."""
 
-import sys
-from pathlib import Path
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from src.manager import BPMManager
-import time
+from time import perf_counter_ns
+
+import numpy as np
 
 
 def main():
@@ -42,32 +38,23 @@ def main():
     print(f"Processing {len(songs)} songs...")
     print("="*50 + "\n")
 
-    results = []
+    # Look up all songs at once: cache hits are fetched in a single query,
+    # only misses go to the API/scraper
+    start_ns = perf_counter_ns()
+    bpms = manager.get_bpm_many(songs)
+    elapsed = (perf_counter_ns() - start_ns) / 1e9
 
-    # Process each song
-    for i, (artist, title) in enumerate(songs, 1):
-        print(f"[{i}/{len(songs)}] {artist} - {title}")
+    # Results are kept as parallel arrays (artists[i], titles[i], bpms[i])
+    artists = [artist for artist, _ in songs]
+    titles = [title for _, title in songs]
 
-        start_time = time.time()
-        bpm = manager.get_bpm(artist, title)
-        elapsed = time.time() - start_time
+    for i, (artist, title, bpm) in enumerate(zip(artists, titles, bpms), 1):
+        print(f"[{i}/{len(songs)}] {artist} - {title}")
 
         if bpm:
-            print(f"  ✓ Found: {bpm} BPM (took {elapsed:.2f}s)")
-            results.append({
-                "artist": artist,
-                "title": title,
-                "bpm": bpm,
-                "success": True
-            })
+            print(f"  ✓ Found: {bpm} BPM")
         else:
-            print(f"  ✗ Not found (took {elapsed:.2f}s)")
-            results.append({
-                "artist": artist,
-                "title": title,
-                "bpm": None,
-                "success": False
-            })
+            print(f"  ✗ Not found")
 
         print()
 
@@ -76,40 +63,35 @@ def main():
     print("Batch Processing Summary")
     print("="*50)
 
-    successful = sum(1 for r in results if r["success"])
-    failed = len(results) - successful
+    found = [i for i, bpm in enumerate(bpms) if bpm]
+    successful = len(found)
+    failed = len(bpms) - successful
 
-    print(f"Total songs processed: {len(results)}")
+    print(f"Total songs processed: {len(bpms)} (took {elapsed:.2f}s)")
     print(f"Successfully found: {successful}")
     print(f"Not found: {failed}")
-    print(f"Success rate: {(successful/len(results)*100):.1f}%\n")
+    print(f"Success rate: {(successful/len(bpms)*100):.1f}%\n")
 
     # Display results sorted by BPM
     print("Results sorted by BPM:")
     print("-" * 50)
 
-    sorted_results = sorted(
-        [r for r in results if r["success"]],
-        key=lambda x: x["bpm"]
-    )
+    found_idx = np.fromiter(found, dtype=np.intp, count=len(found))
+    bpm_array = np.fromiter((bpms[i] for i in found), dtype=np.float32, count=len(found))
+    order = np.argsort(bpm_array, kind="stable")
 
-    for result in sorted_results:
-        print(f"{result['bpm']:6.1f} BPM - {result['artist']} - {result['title']}")
+    for i, bpm in zip(found_idx[order], bpm_array[order]):
+        print(f"{bpm:6.1f} BPM - {artists[i]} - {titles[i]}")
 
     print()
 
     # BPM statistics
-    if sorted_results:
-        bpms = [r["bpm"] for r in sorted_results]
-        avg_bpm = sum(bpms) / len(bpms)
-        min_bpm = min(bpms)
-        max_bpm = max(bpms)
-
+    if found:
         print("BPM Statistics:")
         print("-" * 50)
-        print(f"Average BPM: {avg_bpm:.1f}")
-        print(f"Slowest: {min_bpm} BPM")
-        print(f"Fastest: {max_bpm} BPM")
+        print(f"Average BPM: {bpm_array.mean():.1f}")
+        print(f"Slowest: {bpm_array.min():g} BPM")
+        print(f"Fastest: {bpm_array.max():g} BPM")
         print()
 
     # Cleanup
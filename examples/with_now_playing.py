@@ -1,15 +1,10 @@
 """Example showing integration with now playing detection."""
 
-import sys
-from pathlib import Path
 import logging
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(name)s: %(message)s')
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from src.manager import BPMManager
 from config.settings import MONGODB_URI, GETSONGBPM_API_KEY
 import time
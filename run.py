@@ -1,12 +1,6 @@
 #!/usr/bin/env python3
 """Launch the MetroMatch application."""
 
-import sys
-from pathlib import Path
-
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent))
-
 from src.gui.main_app import main
 
 if __name__ == "__main__":
@@ -0,0 +1 @@
+"""Database maintenance scripts for MetroMatch."""
@@ -1,15 +1,14 @@
 """Script to seed the database with sample BPM data."""
 
 import sys
-from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateOne
+from pymongo.errors import DuplicateKeyError
 from datetime import datetime
 import logging
 
+from src.cache.mongodb_cache import BPM_CACHE_INDEXES, create_missing_indexes
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -59,32 +58,35 @@ def seed_database(connection_string: str = "mongodb://localhost:27017", database
         db = client[database_name]
         collection = db.bpm_cache
 
-        # Insert sample data
-        inserted_count = 0
-        updated_count = 0
-
-        for song in SAMPLE_DATA:
-            song_with_metadata = {
-                **song,
-                "last_updated": datetime.now(),
-                "metadata": {
-                    "source": "seed_data",
-                    "verified": True
-                }
-            }
-
-            result = collection.update_one(
+        # Same indexes MongoDBCache creates on startup. The unique (artist, title)
+        # index lets each upsert below resolve with an index scan instead of a
+        # collection scan.
+        try:
+            create_missing_indexes(collection, BPM_CACHE_INDEXES)
+        except DuplicateKeyError as e:
+            logger.warning(f"Could not create unique index, duplicate entries exist: {e}")
+
+        # Upsert all sample data in a single unordered bulk write
+        now = datetime.now()
+        operations = [
+            UpdateOne(
                 {"artist": song["artist"], "title": song["title"]},
-                {"$set": song_with_metadata},
+                {"$set": {
+                    **song,
+                    "last_updated": now,
+                    "metadata": {
+                        "source": "seed_data",
+                        "verified": True
+                    }
+                }},
                 upsert=True
             )
+            for song in SAMPLE_DATA
+        ]
 
-            if result.upserted_id:
-                inserted_count += 1
-                logger.info(f"Inserted: {song['artist']} - {song['title']} ({song['bpm']} BPM)")
-            else:
-                updated_count += 1
-                logger.info(f"Updated: {song['artist']} - {song['title']} ({song['bpm']} BPM)")
+        result = collection.bulk_write(operations, ordered=False)
+        inserted_count = result.upserted_count
+        updated_count = result.modified_count
 
         logger.info("Database seeding completed!")
 
@@ -1,15 +1,13 @@
 """Script to initialize MongoDB database for MetroMatch."""
 
 import sys
-from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from pymongo import MongoClient
+from pymongo import ASCENDING, DESCENDING, IndexModel, MongoClient
 from pymongo.errors import ConnectionFailure
 import logging
 
+from src.cache.mongodb_cache import BPM_CACHE_INDEXES, create_missing_indexes
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -37,8 +35,9 @@ def setup_database(connection_string: str = "mongodb://localhost:27017", databas
         # Create collections
         collections = ["bpm_cache", "search_history"]
 
+        existing = set(db.list_collection_names())
         for collection_name in collections:
-            if collection_name not in db.list_collection_names():
+            if collection_name not in existing:
                 db.create_collection(collection_name)
                 logger.info(f"Created collection: {collection_name}")
             else:
@@ -46,15 +45,23 @@ def setup_database(connection_string: str = "mongodb://localhost:27017", databas
 
         # Create indexes on bpm_cache
         bpm_cache = db.bpm_cache
-        bpm_cache.create_index([("artist", 1), ("title", 1)], unique=True)
-        bpm_cache.create_index("last_updated")
-        logger.info("Created indexes on bpm_cache collection")
+        create_missing_indexes(bpm_cache, BPM_CACHE_INDEXES)
+
+        # Databases set up before artist_title_updated have a single-field
+        # last_updated index it makes redundant; drop it rather than keep
+        # paying for it on every write
+        if "last_updated_1" in bpm_cache.index_information():
+            bpm_cache.drop_index("last_updated_1")
+            logger.info("bpm_cache: dropped redundant index last_updated_1")
 
         # Create indexes on search_history
         search_history = db.search_history
-        search_history.create_index("timestamp")
-        search_history.create_index([("artist", 1), ("title", 1)])
-        logger.info("Created indexes on search_history collection")
+        create_missing_indexes(search_history, [
+            IndexModel(
+                [("artist", ASCENDING), ("title", ASCENDING), ("timestamp", DESCENDING)],
+                name="artist_title_timestamp"
+            ),
+        ])
 
         logger.info("Database setup completed successfully!")
 
@@ -1 +1,6 @@
 """API clients for BPM detection."""
+
+from .getsongbpm import GetSongBPMClient
+from .scraper import SongBPMScraper
+
+__all__ = ['GetSongBPMClient', 'SongBPMScraper']
@@ -5,13 +5,33 @@ API Documentation: https://getsongbpm.com/api
 - Endpoints: /search/ (search by artist/song) and /song/ (get by ID)
 """
 
+import functools
 import requests
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Iterable, List, Tuple
 import logging
 
+from .session import create_session
+
+# orjson's C decoder is noticeably faster than the stdlib one; both accept
+# the raw response bytes and raise ValueError subclasses on bad input
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _shared_session() -> requests.Session:
+    """Return the process-wide API session, created on first use."""
+    session = create_session()
+    session.headers.update(GetSongBPMClient.DEFAULT_HEADERS)
+    return session
+
+
 class GetSongBPMClient:
     """Simplified client for GetSongBPM API.
 
@@ -24,91 +44,106 @@ class GetSongBPMClient:
 
     BASE_URL = "https://api.getsongbpm.com"
 
-    def __init__(self, api_key: str):
-        """Initialize with API key from https://getsongbpm.com/api"""
+    # Use realistic browser headers to avoid Cloudflare blocking
+    # Note: Don't request brotli (br) encoding - requests doesn't decompress it automatically
+    DEFAULT_HEADERS = MappingProxyType({
+        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
+        "Accept": "application/json, text/plain, */*",
+        "Accept-Language": "en-US,en;q=0.9",
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+        "Referer": "https://getsongbpm.com/",
+        "Origin": "https://getsongbpm.com",
+        "Sec-Fetch-Dest": "empty",
+        "Sec-Fetch-Mode": "cors",
+        "Sec-Fetch-Site": "same-site",
+        "Sec-Ch-Ua": '"Google Chrome";v="131", "Chromium";v="131", "Not_A Brand";v="24"',
+        "Sec-Ch-Ua-Mobile": "?0",
+        "Sec-Ch-Ua-Platform": '"macOS"',
+    })
+
+    def __init__(self, api_key: str, cache=None, keep_raw: bool = False):
+        """Initialize with API key from https://getsongbpm.com/api
+
+        Args:
+            api_key: GetSongBPM API key
+            cache: Optional MongoDBCache checked before any API request.
+                BPMManager does its own cache lookups and leaves this unset.
+            keep_raw: Include the full upstream song payload as 'raw_data'
+                in results. Off by default: results are stored as cache
+                metadata, and the payload roughly doubles document size.
+        """
         self.api_key = api_key
-        self.session = requests.Session()
-        # Use realistic browser headers to avoid Cloudflare blocking
-        # Note: Don't request brotli (br) encoding - requests doesn't decompress it automatically
-        self.session.headers.update({
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
-            "Accept": "application/json, text/plain, */*",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate",
-            "Connection": "keep-alive",
-            "Referer": "https://getsongbpm.com/",
-            "Origin": "https://getsongbpm.com",
-            "Sec-Fetch-Dest": "empty",
-            "Sec-Fetch-Mode": "cors",
-            "Sec-Fetch-Site": "same-site",
-            "Sec-Ch-Ua": '"Google Chrome";v="131", "Chromium";v="131", "Not_A Brand";v="24"',
-            "Sec-Ch-Ua-Mobile": "?0",
-            "Sec-Ch-Ua-Platform": '"macOS"',
-        })
+        self.cache = cache
+        self.keep_raw = keep_raw
+        # One keep-alive pool shared by every client in the process
+        self.session = _shared_session()
 
     def search(self, artist: str, title: str) -> Optional[Dict[str, Any]]:
         """Search for song BPM by artist and title.
 
-        Two-step process:
-        1. Search to find song ID
-        2. Get song details (including BPM) by ID
+        Uses the tempo from the search result when present; otherwise
+        falls back to fetching the song details (including BPM) by ID.
+        When a cache is configured it is checked first and filled on success.
         """
+        if self.cache:
+            cached = self.cache.get(artist, title)
+            if cached and cached.get("bpm"):
+                logger.debug(f"Cache hit for {artist} - {title}")
+                return {
+                    "bpm": cached["bpm"],
+                    "artist": artist,
+                    "title": title,
+                    "source": "cache"
+                }
+
+        result = self._search_remote(artist, title)
+
+        if result and result.get("bpm") and self.cache:
+            self.cache.set(artist, title, result["bpm"], result)
+
+        return result
+
+    def _search_remote(self, artist: str, title: str) -> Optional[Dict[str, Any]]:
+        """Search the GetSongBPM API (no cache)."""
         try:
             # Search for song directly with artist and title
             # Format: song:{title} artist:{artist} (spaces become + in URL)
-            # Use lowercase for better matching
-            lookup = f"song:{title.lower()} artist:{artist.lower()}"
+            # Casefold for better matching (handles e.g. German ß, unlike lower())
+            lookup = f"song:{title.casefold()} artist:{artist.casefold()}"
             params = {"api_key": self.api_key, "type": "both", "lookup": lookup}
             response = self.session.get(f"{self.BASE_URL}/search/", params=params, timeout=10)
 
-            # Log response details for debugging
-            logger.debug(f"Search response status: {response.status_code}")
-            logger.debug(f"Search response headers: {dict(response.headers)}")
-            print(f"[GetSongBPM] Response status: {response.status_code}, length: {len(response.text)}")
+            # Log response details for debugging (lazy args: only formatted at DEBUG)
+            logger.debug("Search response status: %s", response.status_code)
+            logger.debug("Search response headers: %s", response.headers)
 
             response.raise_for_status()
 
             # Check for empty response
-            if not response.text:
+            if not response.content:
                 logger.warning(f"Empty response from API for: {artist} - {title}")
-                print(f"[GetSongBPM] Empty response for: {artist} - {title}")
                 return None
 
             try:
-                data = response.json()
-            except ValueError as e:
-                logger.error(f"Invalid JSON response: {response.text[:200]}")
-                print(f"[GetSongBPM] Invalid JSON: {response.text[:100]}")
+                data = _json_loads(response.content)
+            except ValueError:
+                logger.error("Invalid JSON response: %.200r", response.content)
                 return None
 
-            # Debug: print the actual response
-            print(f"[GetSongBPM] Response data: {data}")
-
-            search_results = data.get("search")
-
-            # Handle different response formats:
-            # Success: {'search': [{'id': '...', ...}]} - list of results
-            # No results: {'search': {'error': 'no result'}} - dict with error
-            if not search_results:
+            first = self._first_search_result(data)
+            if first is None:
                 logger.warning(f"No results for: {artist} - {title}")
                 return None
 
-            # Check if it's an error response (dict instead of list)
-            if isinstance(search_results, dict):
-                if "error" in search_results:
-                    logger.warning(f"API returned error for {artist} - {title}: {search_results.get('error')}")
-                    print(f"[GetSongBPM] No results found")
-                    return None
-                else:
-                    logger.warning(f"Unexpected search format: {search_results}")
-                    return None
-
-            if not isinstance(search_results, list) or len(search_results) == 0:
-                logger.warning(f"No results for: {artist} - {title}")
-                return None
+            # Search results usually carry the tempo already; only fall back
+            # to the /song/ lookup (a second round trip) when they don't
+            if first.get("tempo"):
+                logger.info(f"Tempo found in search result for {artist} - {title}")
+                return self._parse_song(first)
 
             # Get the first result's ID
-            song_id = search_results[0].get("id")
+            song_id = first.get("id")
             if not song_id:
                 logger.warning(f"No song ID in search result for: {artist} - {title}")
                 return None
@@ -125,6 +160,31 @@ class GetSongBPMClient:
             logger.error(f"Error parsing search response: {e}")
             return None
 
+    def search_many(
+        self,
+        pairs: Iterable[Tuple[str, str]],
+        max_workers: int = 8
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Search for several songs concurrently.
+
+        Each lookup is I/O bound, so the requests run on a thread pool and
+        share the session's keep-alive connections instead of waiting on
+        each other's round trips.
+
+        Args:
+            pairs: (artist, title) tuples
+            max_workers: Maximum number of lookups in flight
+
+        Returns:
+            Search results (or None) in the same order as pairs
+        """
+        pairs = list(pairs)
+        if not pairs:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pairs))) as executor:
+            return list(executor.map(lambda pair: self.search(*pair), pairs))
+
     def get_by_id(self, song_id: str) -> Optional[Dict[str, Any]]:
         """Get song data by GetSongBPM ID."""
         try:
@@ -132,7 +192,7 @@ class GetSongBPMClient:
             response = self.session.get(f"{self.BASE_URL}/song/", params=params, timeout=10)
             response.raise_for_status()
 
-            data = response.json()
+            data = _json_loads(response.content)
             song_data = data.get("song")
 
             if song_data:
@@ -148,12 +208,28 @@ class GetSongBPMClient:
             logger.error(f"Error parsing song response: {e}")
             return None
 
+    @staticmethod
+    def _first_search_result(data: Dict) -> Optional[Dict]:
+        """Return the first search hit, or None if there were no results.
+
+        Success responses look like {'search': [{'id': '...', ...}]}; "no
+        result" comes back as {'search': {'error': 'no result'}}.
+        """
+        results = data.get("search")
+        if isinstance(results, list) and results:
+            return results[0]
+
+        logger.debug("Search returned no list of results: %r", results)
+        return None
+
     def _parse_song(self, song: Dict) -> Dict[str, Any]:
         """Parse song data into standard format."""
-        return {
+        parsed = {
             "bpm": float(song.get("tempo", 0)),
             "artist": song.get("artist", {}).get("name"),
             "title": song.get("song_title"),
-            "source": "getsongbpm",
-            "raw_data": song
+            "source": "getsongbpm"
         }
+        if self.keep_raw:
+            parsed["raw_data"] = song
+        return parsed
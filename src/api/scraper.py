@@ -1,33 +1,261 @@
 """Web scraper for SongBPM.com as fallback when API is unavailable."""
 
+import codecs
+import functools
 import requests
+import threading
 from bs4 import BeautifulSoup
-from typing import Optional, Dict, Any
+from lxml import etree, html as lxml_html
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from html import unescape
+from itertools import islice
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Iterable, Iterator, List
 import logging
 import re
 
+import numpy as np
+
+from .session import create_session
+
 logger = logging.getLogger(__name__)
 
+# Patterns used on every scraped page, compiled once at import
+_BPM_RE = re.compile(r'(\d+(?:\.\d+)?)\s*BPM', re.I)
+_BPM_WORD_RE = re.compile(r'BPM', re.I)
+_NUM_RE = re.compile(r'(\d+(?:\.\d+)?)')
+_FEAT_PAREN_RE = re.compile(r'\s*\(feat\.?[^)]+\)', re.I)
+_FEAT_BRACKET_RE = re.compile(r'\s*\[feat\.?[^\]]+\]', re.I)
+# Direct-URL slug variants for titles with featured artists
+_FEAT_OPEN_RE = re.compile(r'\(feat\.?\s*', re.I)
+_FEAT_OPEN_DASH_RE = re.compile(r'-?\(feat\.?\s*', re.I)
+_FEAT_SINGLE_DASH_RE = re.compile(r'feat-([^-])')
+_DASH_COLLAPSE = re.compile(r'-+')
+
+
+class _SlugTable(dict):
+    """str.translate table: lowercase ASCII letters, keep digits and '-',
+    turn spaces into '-', and delete every other character."""
+
+    def __missing__(self, key):
+        return None
+
+
+_SLUG_TABLE = _SlugTable({ord(c): c for c in 'abcdefghijklmnopqrstuvwxyz0123456789-'})
+_SLUG_TABLE.update({ord(c.upper()): c for c in 'abcdefghijklmnopqrstuvwxyz'})
+_SLUG_TABLE[ord(' ')] = '-'
+
+# Same, but keeping periods (for "feat.-artist" style song slugs)
+_SLUG_TABLE_DOT = _SlugTable(_SLUG_TABLE)
+_SLUG_TABLE_DOT[ord('.')] = '.'
+
+
+@functools.lru_cache(maxsize=4096)
+def _slugify(text: str) -> str:
+    """Build a songbpm.com URL slug in a single pass over the string.
+
+    Memoized: batch lookups repeat the same artist for many tracks.
+    """
+    return text.translate(_SLUG_TABLE)
+
+
+def _realistic_bpms(text: str) -> Iterator[float]:
+    """Yield "<number> BPM" values from text, skipping unrealistic ones.
+
+    Lazy, so callers that only need the first couple of labels stop
+    scanning there.
+    """
+    for match in _BPM_RE.finditer(text):
+        bpm = float(match.group(1))
+        # Filter out unrealistic BPM values (typically 40-240)
+        if 40 <= bpm <= 240:
+            yield bpm
+
+
+def _strip_featuring(title: str) -> str:
+    """Drop '(feat. ...)' / '[feat. ...]' credits from a song title."""
+    return _FEAT_BRACKET_RE.sub('', _FEAT_PAREN_RE.sub('', title))
+
+
+# Used to approximate soup.get_text() without building a tree: drop the
+# bodies of non-text elements (which get_text() skips), then all tags
+_NON_TEXT_RE = re.compile(r'<(script|style|template)\b.*?</\1\s*>', re.I | re.S)
+_TAG_RE = re.compile(r'<[^>]*>')
+_NON_TEXT_OPEN_RE = re.compile(r'<(script|style|template)\b', re.I)
+_NON_TEXT_CLOSE_RES = {
+    name: re.compile(rf'</{name}\s*>', re.I) for name in ('script', 'style', 'template')
+}
+# Cheap pre-check for _extract_bpm's DOM strategies: a "BPM" element or a
+# [data-tempo]/.tempo/#tempo element
+_PARSE_HINT_RE = re.compile(r'BPM|tempo', re.I)
+
+
+def _close_response(future) -> None:
+    """Close the response of a finished request future nobody will read."""
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+def _cancelled(cancel: Optional[threading.Event]) -> bool:
+    """Whether the caller has given up on a search (see SongBPMScraper.search)."""
+    return cancel is not None and cancel.is_set()
+
+
+def _page_text(html: str) -> str:
+    """Approximate soup.get_text() of a page, decoding entities like it does."""
+    return unescape(_TAG_RE.sub('', _NON_TEXT_RE.sub('', html)))
+
+
+class _StreamedPageText:
+    """
+    Collect the "<number> BPM" labels of a page's text as its HTML arrives.
+
+    HTML is consumed up to the last safe offset: the end of the last complete
+    tag outside any script/style/template block. Only what comes after that
+    offset is looked at again when more HTML arrives, so a page is scanned
+    in time linear in its size rather than once per chunk.
+    """
+
+    # Characters of consumed text kept so a label split across chunks
+    # ("1" + "20 BPM") is still found
+    LABEL_CARRY = 32
+    # Characters kept while looking for the end of a script/style block
+    CLOSE_TAG_CARRY = 64
+
+    def __init__(self):
+        # Realistic label values so far, in page order
+        self.bpms: List[float] = []
+        # Consumed HTML, with non-text blocks removed
+        self._html: List[str] = []
+        # HTML after the last safe offset
+        self._tail = ''
+        # End of the consumed text, where a label may continue
+        self._text = ''
+        # Closing-tag pattern of the unfinished non-text block _tail is in
+        self._block_close = None
+
+    @property
+    def html(self) -> str:
+        """HTML read so far, up to any unfinished script/style block."""
+        return ''.join(self._html) + ('' if self._block_close else self._tail)
+
+    def feed(self, html: str):
+        """Scan the next piece of the page's HTML."""
+        tail = self._tail + html
+        if self._block_close is not None:
+            close = self._block_close.search(tail)
+            if not close:
+                # The block's content is never needed; keep only what could
+                # be the start of its closing tag (which is short)
+                start = tail.rfind('<', max(len(tail) - self.CLOSE_TAG_CARRY, 0))
+                self._tail = tail[start:] if start >= 0 else ''
+                return
+            tail = tail[close.end():]
+            self._block_close = None
+
+        tail = _NON_TEXT_RE.sub('', tail)
+        block = _NON_TEXT_OPEN_RE.search(tail)
+        if block:
+            # Everything before an unfinished block is complete
+            self._scan(tail[:block.start()])
+            self._block_close = _NON_TEXT_CLOSE_RES[block.group(1).lower()]
+            self._tail = ''
+            self.feed(tail[block.end():])
+            return
+
+        end = tail.rfind('>') + 1
+        self._scan(tail[:end])
+        self._tail = tail[end:]
+
+    def _scan(self, html: str):
+        """Collect the labels in consumed HTML and carry its text's end over."""
+        if not html:
+            return
+        self._html.append(html)
+        text = self._text + unescape(_TAG_RE.sub('', html))
+        last = 0
+        for match in _BPM_RE.finditer(text):
+            bpm = float(match.group(1))
+            if 40 <= bpm <= 240:
+                self.bpms.append(bpm)
+            last = match.end()
+
+        start = max(last, len(text) - self.LABEL_CARRY)
+        # Never carry half a number
+        while start > last and (text[start - 1].isdigit() or text[start - 1] == '.'):
+            start -= 1
+        self._text = text[start:]
+
+
+# Song pages are read in chunks of this size so the download can stop as
+# soon as the BPM labels have been seen
+_STREAM_CHUNK_SIZE = 8192
+# ...and reading gives up after this many bytes: the labels sit near the top,
+# so anything past this is scripts, ads and related-song lists
+_STREAM_READ_LIMIT = 256 * 1024
+# After an early stop, unread bodies up to this many bytes are drained so the
+# keep-alive connection can be reused instead of discarded
+_DRAIN_LIMIT = 64 * 1024
+
+# lxml's C parser builds the tree several times faster than 'html.parser'
+_HTML_PARSER = 'lxml'
+
+# Song links on artist pages look like /@artist/song-slug
+_SONG_HREFS_XPATH = etree.XPath('//a[contains(@href, "/@")]/@href')
+# Artist page pagination: /@artist?after=<cursor>
+_NEXT_PAGE_XPATH = etree.XPath('//a[contains(@href, $needle)]/@href')
+# Song versions never picked as a match (one scan instead of three)
+_EXCLUDE_RE = re.compile(r'-(?:instrumental|remix|cover)')
+
 
 class SongBPMScraper:
     """Scraper for SongBPM.com website."""
 
     BASE_URL = "https://songbpm.com"
 
-    def __init__(self):
-        """Initialize the scraper."""
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        })
+    DEFAULT_HEADERS = MappingProxyType({
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+    })
+
+    # Successful Playwright lookups remembered per scraper instance
+    PLAYWRIGHT_MEMO_SIZE = 2048
 
-    def search(self, artist: str, title: str) -> Optional[Dict[str, Any]]:
+    def __init__(self, cache_path: Optional[str] = None):
+        """
+        Initialize the scraper.
+
+        Args:
+            cache_path: Optional on-disk HTTP cache (e.g. ".songbpm_cache").
+                Artist and song pages, and 404s, are then reused for 7 days
+                instead of re-fetched; needs the optional requests-cache.
+        """
+        self.session = create_session(cache_path=cache_path)
+        self.session.headers.update(self.DEFAULT_HEADERS)
+        self._playwright_memo: OrderedDict = OrderedDict()
+
+        # Shared headless browser, started on the first Playwright search
+        self._playwright_lock = threading.Lock()
+        self._playwright_thread: Optional[ThreadPoolExecutor] = None
+        self._playwright = None
+        self._browser = None
+        self._context = None
+
+    def search(
+        self,
+        artist: str,
+        title: str,
+        cancel: Optional[threading.Event] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Search for song BPM by artist and title.
 
         Args:
             artist: Artist name
             title: Song title
+            cancel: Optional event; once set, the search gives up before its
+                next stage (Playwright, direct URLs, artist pages) and
+                returns None
 
         Returns:
             Song data including BPM or None if not found
@@ -35,7 +263,7 @@ class SongBPMScraper:
         try:
             # Use search directly - it's more reliable than guessing URLs
             # Search format: "artist title" (e.g., "the weeknd can't feel my face")
-            return self._search_page(artist, title)
+            return self._search_page(artist, title, cancel)
 
         except requests.RequestException as e:
             logger.error(f"Scraping request failed: {e}")
@@ -44,325 +272,523 @@ class SongBPMScraper:
             logger.error(f"Error during scraping: {e}")
             return None
 
-    def _search_page(self, artist: str, title: str) -> Optional[Dict[str, Any]]:
+    def _search_page(
+        self,
+        artist: str,
+        title: str,
+        cancel: Optional[threading.Event] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Search using the search page.
 
+        Strategies are tried cheapest-first once Playwright has failed: a
+        direct song URL costs one request per pattern, while browsing the
+        artist page can take up to 15.
+
         Args:
             artist: Artist name
             title: Song title
+            cancel: Optional event checked between strategies
 
         Returns:
             Song data including BPM or None if not found
         """
         try:
             logger.info(f"Scraper searching for: {artist} - {title}")
-            print(f"[Scraper] Looking for: {artist} - {title}")
+
+            # Create artist slug
+            artist_slug = _slugify(artist)
 
             # Strategy 1: Try Playwright UI search first (most reliable ~85-95% success)
-            print(f"[Scraper] Trying Playwright UI search (most reliable)...")
-            playwright_result = self._search_via_playwright(artist, title)
+            logger.debug("Trying Playwright UI search")
+            playwright_result = self._search_via_playwright(artist, title, cancel)
             if playwright_result:
                 return playwright_result
+            if _cancelled(cancel):
+                return None
 
-            print(f"[Scraper] Playwright search failed, falling back to artist page browsing...")
+            logger.debug("Playwright search failed, trying direct song URLs")
 
-            # Create artist slug
-            artist_slug = artist.lower().replace(' ', '-')
-            artist_slug = re.sub(r'[^a-z0-9-]', '', artist_slug)
+            # Fetch the artist page (strategy 3) while the direct URLs are
+            # probed, so it is ready if they all miss
+            artist_url = f"{self.BASE_URL}/@{artist_slug}"
+            prefetch = ThreadPoolExecutor(max_workers=1)
+            try:
+                artist_page = prefetch.submit(self.session.get, artist_url, timeout=10)
+
+                # Strategy 2: Guess the song URL from the title
+                direct_result = self._search_direct_urls(artist, title, artist_slug)
+                if direct_result or _cancelled(cancel):
+                    # The artist page isn't needed; give its connection back
+                    artist_page.add_done_callback(_close_response)
+                    return direct_result
+
+                # Strategy 3: Browse the artist page and find the song (~40-60% success)
+                logger.debug("Trying artist page: %s", artist_url)
+                return self._search_artist_page(
+                    artist, title, artist_slug, artist_page.result(), cancel
+                )
+            finally:
+                prefetch.shutdown(wait=False, cancel_futures=True)
 
-            # Clean the title for matching
-            clean_title = re.sub(r'\s*\(feat\.?[^)]+\)', '', title, flags=re.IGNORECASE)
-            clean_title = re.sub(r'\s*\[feat\.?[^\]]+\]', '', clean_title, flags=re.IGNORECASE)
-            title_words = clean_title.lower().split()
+        except Exception as e:
+            logger.error(f"Search page scraping failed: {e}")
+            return None
 
-            # Strategy 2: Browse the artist page and find the song (~40-60% success)
-            artist_url = f"{self.BASE_URL}/@{artist_slug}"
-            print(f"[Scraper] Trying artist page: {artist_url}")
+    def _search_direct_urls(self, artist: str, title: str, artist_slug: str) -> Optional[Dict[str, Any]]:
+        """
+        Try song URLs built directly from the title.
 
-            response = self.session.get(artist_url, timeout=10)
-            print(f"[Scraper] Artist page status: {response.status_code}")
+        Args:
+            artist: Artist name
+            title: Song title
+            artist_slug: URL slug for the artist
 
-            if response.status_code != 200:
-                print(f"[Scraper] Artist page not found")
-                return None
+        Returns:
+            Song data including BPM or None if no candidate URL has a BPM
+        """
+        # Construct song slug from title
+        song_slug = _slugify(_strip_featuring(title))
+
+        # Also try with featured artists if present
+        # Pattern varies: "feat.-artist" or "feat--artist" (period or double dash)
+
+        # Version with period: "feat.-duke-deuce"
+        # Each variant rewrites the "(feat." marker on the raw title, then one
+        # translate pass lowercases, turns spaces into dashes and drops
+        # everything else (including the closing parenthesis)
+        full_title_with_period = _FEAT_OPEN_RE.sub('feat.-', title).translate(_SLUG_TABLE_DOT)
+        full_title_with_period = _DASH_COLLAPSE.sub('-', full_title_with_period).strip('-')
+
+        # Version with double dash: "feat--duke-deuce"
+        full_title_double_dash = _FEAT_OPEN_DASH_RE.sub('-feat--', title).translate(_SLUG_TABLE)
+        full_title_double_dash = _DASH_COLLAPSE.sub('-', full_title_double_dash)  # Collapse multiple dashes except feat--
+        full_title_double_dash = _FEAT_SINGLE_DASH_RE.sub(r'feat--\1', full_title_double_dash)  # Ensure double dash after feat
+        full_title_double_dash = full_title_double_dash.strip('-')
+
+        # Version with single dash: "feat-kodak-black"
+        full_title_single_dash = _FEAT_OPEN_RE.sub('feat-', title).translate(_SLUG_TABLE)
+        full_title_single_dash = _DASH_COLLAPSE.sub('-', full_title_single_dash).strip('-')  # Collapse multiple dashes
+
+        # Try direct URLs with all patterns
+        direct_urls = [
+            f"{self.BASE_URL}/@{artist_slug}/{full_title_with_period}",
+            f"{self.BASE_URL}/@{artist_slug}/{full_title_double_dash}",
+            f"{self.BASE_URL}/@{artist_slug}/{full_title_single_dash}",
+            f"{self.BASE_URL}/@{artist_slug}/{song_slug}",
+        ]
+
+        logger.debug(
+            "Trying URL patterns: period=%r, double=%r, single=%r",
+            full_title_with_period, full_title_double_dash, full_title_single_dash
+        )
+
+        # The variants coincide when the title has no featured artist
+        direct_urls = list(dict.fromkeys(direct_urls))
+
+        # Probe all candidates at once; results are still taken in
+        # priority order, so the first pattern with a BPM wins
+        executor = ThreadPoolExecutor(max_workers=len(direct_urls))
+        try:
+            probes = [executor.submit(self._probe_direct_url, url) for url in direct_urls]
+            for direct_url, probe in zip(direct_urls, probes):
+                bpm = probe.result()
+                if bpm:
+                    return {
+                        "bpm": bpm,
+                        "artist": artist,
+                        "title": title,
+                        "source": "songbpm_scraper",
+                        "url": direct_url
+                    }
+        finally:
+            # Lower-priority probes still in flight are abandoned
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return None
+
+    def _search_artist_page(
+        self,
+        artist: str,
+        title: str,
+        artist_slug: str,
+        response: requests.Response,
+        cancel: Optional[threading.Event] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find the song among the links on the artist's pages.
 
-            response.raise_for_status()
-            print(f"[Scraper] Response URL: {response.url}")
-            print(f"[Scraper] Response status: {response.status_code}")
+        Args:
+            artist: Artist name
+            title: Song title
+            artist_slug: URL slug for the artist
+            response: Response for the first artist page
+            cancel: Optional event checked before each further page
 
-            # Debug: Show redirect history
-            if response.history:
-                print(f"[Scraper] Redirects: {[r.url for r in response.history]}")
-            else:
-                print(f"[Scraper] No redirects occurred")
+        Returns:
+            Song data including BPM or None if not found
+        """
+        logger.debug("Artist page status: %s", response.status_code)
 
-            # Pagination loop - collect songs from multiple pages if needed
-            all_links = []
-            pages_checked = 0
-            max_pages = 15  # Increased to handle artists with many songs (A-Z)
-            current_url = artist_url
+        if response.status_code != 200:
+            logger.debug("Artist page not found")
+            return None
 
-            while current_url and pages_checked < max_pages:
-                pages_checked += 1
+        response.raise_for_status()
+        logger.debug("Artist page URL: %s", response.url)
+
+        # Debug: Show redirect history
+        if response.history and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Redirects: %s", [r.url for r in response.history])
+
+        artist_compact = artist.lower().replace(' ', '')
+
+        # Clean the title for matching
+        clean_title = _strip_featuring(title)
+        title_words = clean_title.lower().split()
+        title_slug = _slugify(clean_title)
+
+        # Title-match markers are the same for every link on every page
+        significant_markers = tuple(f'-{w}-' for w in title_words if len(w) > 2)
+
+        # Pagination loop - collect songs from multiple pages if needed.
+        # Only hrefs are kept: song_hrefs[i] is the link as found and
+        # song_hrefs_lower[i] its lowercased form used for matching.
+        song_hrefs = []
+        song_hrefs_lower = []
+        seen_hrefs = set()
+        links_checked = 0
+        pages_checked = 0
+        max_pages = 15  # Increased to handle artists with many songs (A-Z)
+        current_url = f"{self.BASE_URL}/@{artist_slug}"
+
+        while current_url and pages_checked < max_pages:
+            pages_checked += 1
+            # Page 1 is the artist page response passed in
+            if pages_checked > 1:
+                if _cancelled(cancel):
+                    return None
                 response = self.session.get(current_url, timeout=10)
 
                 if response.status_code != 200:
                     break
 
-                soup = BeautifulSoup(response.content, 'html.parser')
-
-                if pages_checked == 1:
-                    # Debug info on first page only
-                    page_title = soup.find('title')
-                    all_page_links = soup.find_all('a', href=True)
-                    print(f"[Scraper] Page title: {page_title.text if page_title else 'No title'}")
-                    print(f"[Scraper] Total links on page: {len(all_page_links)}")
-
-                # Find all potential song links on this page
-                selectors = [
-                    'a[href*="/@"]',  # Links containing /@artist/
-                    'main a[href*="/@"]',
-                ]
-
-                print(f"[Scraper] Checking page {pages_checked}: {current_url}")
-
-                for selector in selectors:
-                    links = soup.select(selector)
-                    for link in links:
-                        href = link.get('href', '')
-                        # Only match song links (/@artist/song format, not just /@artist)
-                        if isinstance(href, str) and href.startswith('/@') and href.count('/') >= 2:
-                            # Verify the link contains the artist name
-                            href_lower = href.lower()
-                            if artist_slug in href_lower or artist.lower().replace(' ', '') in href_lower:
-                                # Avoid duplicates
-                                if link not in all_links:
-                                    all_links.append(link)
-
-                # Check if we found a match for the title on this page
-                # Use strict matching: require the title slug to appear in the URL
-                title_slug = clean_title.lower().replace(' ', '-')
-                title_slug = re.sub(r'[^a-z0-9-]', '', title_slug)
-
-                found_match = False
-                for link in all_links:
-                    href = link.get('href', '').lower()
-                    # Check if the title slug (or most of it) appears in the URL
-                    if title_slug in href:
-                        found_match = True
-                        print(f"[Scraper] Found exact match for '{title_slug}' in {href}")
-                        break
-                    # Also check if all significant words match at word boundaries
-                    significant_words = [w for w in title_words if len(w) > 2]
-                    if significant_words:
-                        # Extract the song name part from the URL (after artist)
-                        url_parts = href.split('/')
-                        if len(url_parts) >= 3:
-                            song_part = url_parts[-1]
-                            word_matches = sum(1 for w in significant_words if f'-{w}-' in f'-{song_part}-')
-                            if word_matches == len(significant_words):
-                                found_match = True
-                                print(f"[Scraper] Found word match for {title_words} in {href}")
-                                break
-
-                if found_match:
-                    print(f"[Scraper] Found potential match, stopping pagination")
+            if not response.content:
+                break  # lxml refuses to parse an empty document
+
+            # Only hrefs are needed here, so query lxml's tree directly
+            # rather than going through bs4 Tag objects
+            tree = lxml_html.fromstring(response.content)
+
+            if pages_checked == 1 and logger.isEnabledFor(logging.DEBUG):
+                # Debug info on first page only; the extra tree walks are
+                # skipped unless someone is listening
+                logger.debug("Page title: %s", tree.findtext('.//title') or 'No title')
+                logger.debug("Total links on page: %d", len(tree.xpath('//a[@href]')))
+
+            logger.debug("Checking page %d: %s", pages_checked, current_url)
+
+            # Find all potential song links (/@artist/song) on this page.
+            # One query is enough: 'main a[href*="/@"]' only ever matched a
+            # subset of these.
+            for href in _SONG_HREFS_XPATH(tree):
+                # XPath string results keep the whole tree alive; copy them
+                href = str(href)
+                # Only match song links (/@artist/song format, not just /@artist)
+                if href.startswith('/@') and href.count('/') >= 2:
+                    # Verify the link contains the artist name
+                    href_lower = href.lower()
+                    if artist_slug in href_lower or artist_compact in href_lower:
+                        # Avoid duplicates
+                        if href not in seen_hrefs:
+                            seen_hrefs.add(href)
+                            song_hrefs.append(href)
+                            song_hrefs_lower.append(href_lower)
+
+            # Check if we found a match for the title on this page
+            # Use strict matching: require the title slug to appear in the URL.
+            # Links from earlier pages were already checked, so only the
+            # ones added by this page need looking at.
+            found_match = False
+            for href in song_hrefs_lower[links_checked:]:
+                # Check if the title slug (or most of it) appears in the URL
+                if title_slug in href:
+                    found_match = True
+                    logger.debug("Found exact match for %r in %s", title_slug, href)
                     break
+                # Also check if all significant words match at word boundaries
+                if significant_markers:
+                    # Extract the song name part from the URL (after artist)
+                    url_parts = href.split('/')
+                    if len(url_parts) >= 3:
+                        song_part = f'-{url_parts[-1]}-'
+                        if all(marker in song_part for marker in significant_markers):
+                            found_match = True
+                            logger.debug("Found word match for %s in %s", title_words, href)
+                            break
+            links_checked = len(song_hrefs)
+
+            if found_match:
+                logger.debug("Found potential match, stopping pagination")
+                break
+
+            # Find next page link
+            next_hrefs = _NEXT_PAGE_XPATH(tree, needle=f'/@{artist_slug}?after=')
+            if next_hrefs:
+                current_url = f"{self.BASE_URL}{next_hrefs[0]}"
+            else:
+                current_url = None
 
-                # Find next page link
-                next_link = soup.find('a', href=lambda h: bool(h and f'/@{artist_slug}?after=' in h))
-                if next_link:
-                    next_href = next_link.get('href', '')
-                    current_url = f"{self.BASE_URL}{next_href}"
-                else:
-                    current_url = None
-
-            print(f"[Scraper] Total matching links found: {len(all_links)} (checked {pages_checked} pages)")
-
-            # Filter and prioritize results - match against title words
-            result_link = None
-            best_match_score = 0
-
-            # Score each link based on title word matches
-            for link in all_links:
-                href = link.get('href', '').lower()
-
-                # Skip instrumentals, remixes, covers
-                if '-instrumental' in href:
-                    continue
-                if '-remix' in href:
-                    continue
-                if '-cover' in href:
-                    continue
-
-                # Calculate match score based on title words in href
-                # Extract the song name part from the URL
-                url_parts = href.split('/')
-                song_part = url_parts[-1] if len(url_parts) >= 3 else href
-
-                score = 0
-                for word in title_words:
-                    # Use word boundary matching (word surrounded by dashes or at start/end)
-                    if len(word) > 2 and f'-{word}-' in f'-{song_part}-':
-                        score += 1
-
-                # Bonus for exact title slug match
-                title_slug = clean_title.lower().replace(' ', '-')
-                title_slug = re.sub(r'[^a-z0-9-]', '', title_slug)
-                if title_slug in href:
-                    score += len(title_words)  # Big bonus for exact match
-
-                if score > best_match_score:
-                    best_match_score = score
-                    result_link = link
-                    logger.debug(f"New best match (score {score}): {href}")
-                    print(f"[Scraper] Best match so far (score {score}): {href}")
-
-            # Fallback: use first non-instrumental result if no title match
-            if not result_link and all_links:
-                for link in all_links:
-                    href = link.get('href', '').lower()
-                    if '-instrumental' not in href and '-remix' not in href:
-                        result_link = link
-                        logger.debug(f"Using fallback result: {href}")
-                        break
-                if not result_link:
-                    result_link = all_links[0]
-                    logger.debug(f"Using first available result: {all_links[0].get('href')}")
-
-            # If no good match found on artist page, try direct URL construction
-            if not result_link or best_match_score == 0:
-                # Construct song slug from title
-                song_slug = clean_title.lower().replace(' ', '-')
-                song_slug = re.sub(r'[^a-z0-9-]', '', song_slug)
-
-                # Also try with featured artists if present
-                # Pattern varies: "feat.-artist" or "feat--artist" (period or double dash)
-
-                # Version with period: "feat.-duke-deuce"
-                full_title_with_period = title.lower().replace(' ', '-')
-                full_title_with_period = re.sub(r'\(feat\.?\s*', 'feat.-', full_title_with_period, flags=re.IGNORECASE)
-                full_title_with_period = re.sub(r'\)', '', full_title_with_period)
-                full_title_with_period = re.sub(r'[^a-z0-9.-]', '', full_title_with_period)
-                full_title_with_period = re.sub(r'-+', '-', full_title_with_period)
-                full_title_with_period = full_title_with_period.strip('-')
-
-                # Version with double dash: "feat--duke-deuce"
-                full_title_double_dash = title.lower().replace(' ', '-')
-                full_title_double_dash = re.sub(r'-?\(feat\.?\s*', '-feat--', full_title_double_dash, flags=re.IGNORECASE)
-                full_title_double_dash = re.sub(r'\)', '', full_title_double_dash)
-                full_title_double_dash = re.sub(r'[^a-z0-9-]', '', full_title_double_dash)
-                full_title_double_dash = re.sub(r'-+', '-', full_title_double_dash)  # Collapse multiple dashes except feat--
-                full_title_double_dash = re.sub(r'feat-([^-])', r'feat--\1', full_title_double_dash)  # Ensure double dash after feat
-                full_title_double_dash = full_title_double_dash.strip('-')
-
-                # Version with single dash: "feat-kodak-black"
-                full_title_single_dash = title.lower().replace(' ', '-')
-                full_title_single_dash = re.sub(r'\(feat\.?\s*', 'feat-', full_title_single_dash, flags=re.IGNORECASE)
-                full_title_single_dash = re.sub(r'\)', '', full_title_single_dash)
-                full_title_single_dash = re.sub(r'[^a-z0-9-]', '', full_title_single_dash)
-                full_title_single_dash = re.sub(r'-+', '-', full_title_single_dash)  # Collapse multiple dashes
-                full_title_single_dash = full_title_single_dash.strip('-')
-
-                # Try direct URLs with all patterns
-                direct_urls = [
-                    f"{self.BASE_URL}/@{artist_slug}/{full_title_with_period}",
-                    f"{self.BASE_URL}/@{artist_slug}/{full_title_double_dash}",
-                    f"{self.BASE_URL}/@{artist_slug}/{full_title_single_dash}",
-                    f"{self.BASE_URL}/@{artist_slug}/{song_slug}",
-                ]
-
-                print(f"[Scraper] Trying URL patterns: period='{full_title_with_period}', double='{full_title_double_dash}', single='{full_title_single_dash}'")
-
-                for direct_url in direct_urls:
-                    print(f"[Scraper] Trying direct URL: {direct_url}")
-                    try:
-                        direct_response = self.session.get(direct_url, timeout=10)
-                        if direct_response.status_code == 200:
-                            print(f"[Scraper] Direct URL found!")
-                            direct_soup = BeautifulSoup(direct_response.content, 'html.parser')
-                            bpm = self._extract_bpm(direct_soup)
-                            if bpm:
-                                return {
-                                    "bpm": bpm,
-                                    "artist": artist,
-                                    "title": title,
-                                    "source": "songbpm_scraper",
-                                    "url": direct_url
-                                }
-                    except Exception as e:
-                        logger.debug(f"Direct URL failed: {e}")
-                        continue
-
-                # No match found - don't fall back to random song
-                print(f"[Scraper] No match found for: {artist} - {title}")
-                return None
+        logger.debug("Total matching links found: %d (checked %d pages)", len(song_hrefs), pages_checked)
 
-            # Only use result_link if we have a good match
-            if result_link and best_match_score > 0:
-                href = result_link.get('href', '')
-                if href.startswith('/@'):
-                    song_url = self.BASE_URL + href
-                else:
-                    song_url = self.BASE_URL + href
+        # Filter and prioritize results - match against title words
+        result_href = None
+        best_match_score = 0
 
-                logger.debug(f"Fetching song page: {song_url}")
-                response = self.session.get(song_url, timeout=10)
-                response.raise_for_status()
+        # Score each link based on title word matches
+        for i, href in enumerate(song_hrefs_lower):
+            # Skip instrumentals, remixes, covers
+            if _EXCLUDE_RE.search(href):
+                continue
 
-                soup = BeautifulSoup(response.content, 'html.parser')
-                bpm = self._extract_bpm(soup)
+            # Calculate match score based on title words in href
+            # Extract the song name part from the URL
+            url_parts = href.split('/')
+            song_part = url_parts[-1] if len(url_parts) >= 3 else href
 
-                if bpm:
-                    return {
-                        "bpm": bpm,
-                        "artist": artist,
-                        "title": title,
-                        "source": "songbpm_scraper",
-                        "url": song_url
-                    }
-            else:
-                logger.debug(f"No search results found for: {artist} - {title}")
+            # Use word boundary matching (word surrounded by dashes or at start/end)
+            song_part = f'-{song_part}-'
+            score = sum(1 for marker in significant_markers if marker in song_part)
+
+            # Bonus for exact title slug match
+            if title_slug in href:
+                score += len(title_words)  # Big bonus for exact match
+
+            if score > best_match_score:
+                best_match_score = score
+                result_href = song_hrefs[i]
+                logger.debug("New best match (score %d): %s", score, href)
 
+        # No match found - don't fall back to random song
+        if not result_href or best_match_score == 0:
+            logger.debug("No match found for: %s - %s", artist, title)
             return None
 
+        song_url = self.BASE_URL + result_href
+
+        logger.debug("Fetching song page: %s", song_url)
+        with self.session.get(song_url, timeout=10, stream=True) as response:
+            response.raise_for_status()
+            bpm = self._stream_bpm(response)
+
+        if bpm:
+            return {
+                "bpm": bpm,
+                "artist": artist,
+                "title": title,
+                "source": "songbpm_scraper",
+                "url": song_url
+            }
+
+        return None
+
+    def _probe_direct_url(self, url: str) -> Optional[float]:
+        """
+        Fetch a guessed song URL and extract its BPM.
+
+        Args:
+            url: Candidate song page URL
+
+        Returns:
+            BPM value or None if the page doesn't exist or has no BPM
+        """
+        logger.debug("Trying direct URL: %s", url)
+        try:
+            with self.session.get(url, timeout=10, stream=True) as response:
+                if response.status_code != 200:
+                    return None
+                logger.debug("Direct URL found: %s", url)
+                return self._stream_bpm(response)
         except Exception as e:
-            logger.error(f"Search page scraping failed: {e}")
+            logger.debug("Direct URL failed: %s", e)
             return None
 
-    def _extract_bpm(self, soup: BeautifulSoup) -> Optional[float]:
+    def _stream_bpm(self, response: requests.Response) -> Optional[float]:
+        """
+        Read a streamed song page only as far as needed to find its BPM.
+
+        The page text usually carries two "<number> BPM" labels near the top,
+        and the second one is the song BPM (see _bpm_from_text). Once two
+        realistic values have been seen the rest of the page is not
+        downloaded; otherwise what was read (at most _STREAM_READ_LIMIT
+        bytes) goes through _extract_bpm_from_html.
+
+        Args:
+            response: Response opened with stream=True
+
+        Returns:
+            BPM value or None if not found
+        """
+        decoder = codecs.getincrementaldecoder(response.encoding or 'utf-8')(errors='replace')
+        page = _StreamedPageText()
+        pieces = []
+        read = 0
+
+        for chunk in response.iter_content(_STREAM_CHUNK_SIZE):
+            read += len(chunk)
+            # The incremental decoder holds back a multi-byte character split
+            # at the chunk boundary until the rest of it arrives
+            html = decoder.decode(chunk)
+            pieces.append(html)
+            page.feed(html)
+
+            if len(page.bpms) > 1:
+                logger.debug("BPM found after %d bytes", read)
+                self._release_connection(response)
+                return page.bpms[1]
+
+            if read >= _STREAM_READ_LIMIT:
+                # Give up on the tail; the complete-text prefix is all that
+                # is trustworthy to scan (the caller closes the response)
+                logger.debug("No BPM pair in the first %d bytes, stopping", read)
+                return self._extract_bpm_from_html(page.html)
+
+        pieces.append(decoder.decode(b'', final=True))
+        return self._extract_bpm_from_html(''.join(pieces))
+
+    @staticmethod
+    def _release_connection(response: requests.Response):
+        """
+        Let a partially read response's connection go back to the pool.
+
+        Closing a response with unread body forces urllib3 to drop the
+        connection, so the next request to songbpm.com pays for a new TCP
+        and TLS handshake. If only a little of the body is left, it is
+        cheaper to read it out and keep the connection alive.
+
+        Args:
+            response: Response opened with stream=True
+        """
+        try:
+            remaining = int(response.headers.get('Content-Length', '')) - response.raw.tell()
+        except (TypeError, ValueError, AttributeError):
+            return  # Chunked or unknown length: let the caller close it
+
+        if 0 < remaining <= _DRAIN_LIMIT:
+            for _ in response.iter_content(_STREAM_CHUNK_SIZE):
+                pass
+
+    def _extract_bpm_from_html(self, html: str) -> Optional[float]:
+        """
+        Extract BPM from raw HTML, parsing it only when necessary.
+
+        The common case (a "116 BPM" label in the page text) is answered by
+        a regex over the tag-stripped HTML; the page is parsed with
+        BeautifulSoup only when that finds nothing and the markup mentions
+        a tempo element.
+
+        Args:
+            html: Page HTML
+
+        Returns:
+            BPM value or None if not found
+        """
+        bpm = self._bpm_from_text(_page_text(html))
+        if bpm:
+            return bpm
+
+        # The DOM strategies need a "BPM" or "tempo" somewhere in the markup
+        if not _PARSE_HINT_RE.search(html):
+            return None
+
+        return self._extract_bpm(BeautifulSoup(html, _HTML_PARSER), text_scanned=True)
+
+    def extract_bpm_many(self, pages: Iterable[str]) -> List[Optional[float]]:
+        """
+        Extract BPM from many already-downloaded song pages at once.
+
+        Every "<number> BPM" label across all pages is collected into one
+        array and range-checked in a single vectorized comparison; the
+        per-page pick then follows the same rule as _bpm_from_text. Pages
+        with no realistic label fall back to the DOM strategies.
+
+        Args:
+            pages: Page HTML strings
+
+        Returns:
+            BPM values (or None) in the same order as pages
+        """
+        pages = list(pages)
+        labels = [_BPM_RE.findall(_page_text(html)) for html in pages]
+        counts = np.fromiter((len(found) for found in labels), dtype=np.intp, count=len(pages))
+        values = np.fromiter(
+            (float(value) for found in labels for value in found),
+            dtype=np.float64,
+            count=int(counts.sum())
+        )
+
+        realistic = (values >= 40) & (values <= 240)
+        page_of = np.repeat(np.arange(len(pages)), counts)[realistic]
+        values = values[realistic]
+
+        # page_of is sorted, so each page's realistic labels are contiguous
+        per_page = np.bincount(page_of, minlength=len(pages))
+        first = np.searchsorted(page_of, np.arange(len(pages)))
+
+        results = []
+        for i, html in enumerate(pages):
+            if per_page[i]:
+                # Second label if there is one (first is often a category BPM)
+                results.append(float(values[first[i] + (per_page[i] > 1)]))
+            elif _PARSE_HINT_RE.search(html):
+                results.append(self._extract_bpm(BeautifulSoup(html, _HTML_PARSER), text_scanned=True))
+            else:
+                results.append(None)
+        return results
+
+    @staticmethod
+    def _bpm_from_text(text: str) -> Optional[float]:
+        """
+        Pick the song BPM from "<number> BPM" labels in page text.
+
+        Args:
+            text: Page text
+
+        Returns:
+            BPM value or None if no realistic value is found
+        """
+        # Return the second value if available (first is often a
+        # category/genre BPM); labels after that are never looked at
+        found = list(islice(_realistic_bpms(text), 2))
+        return found[-1] if found else None
+
+    def _extract_bpm(self, soup: BeautifulSoup, text_scanned: bool = False) -> Optional[float]:
         """
         Extract BPM from parsed HTML.
 
         Args:
             soup: BeautifulSoup parsed HTML
+            text_scanned: The page text was already searched for "<number> BPM"
+                labels (the raw-HTML fast path), so skip the get_text() pass
 
         Returns:
             BPM value or None if not found
         """
         try:
             # Strategy 1: Look for BPM in the full page text
-            text = soup.get_text()
-            # Look for pattern like "116 BPM" (most common)
-            matches = re.findall(r'(\d+(?:\.\d+)?)\s*BPM', text, re.I)
-            if matches:
-                # Return the most common BPM value (usually the second occurrence is the song BPM)
-                bpm_values = [float(m) for m in matches]
-                # Filter out unrealistic BPM values (typically 40-240)
-                realistic_bpms = [bpm for bpm in bpm_values if 40 <= bpm <= 240]
-                if realistic_bpms:
-                    # Return the second value if available (first is often a category/genre BPM)
-                    return realistic_bpms[1] if len(realistic_bpms) > 1 else realistic_bpms[0]
+            if not text_scanned:
+                bpm = self._bpm_from_text(soup.get_text())
+                if bpm:
+                    return bpm
 
             # Strategy 2: Look for BPM in specific element with context
-            bpm_elem = soup.find(string=re.compile(r'BPM', re.I))
+            bpm_elem = soup.find(string=_BPM_WORD_RE)
             if bpm_elem:
                 parent = bpm_elem.parent
                 if parent:
                     # Try to find numeric value near BPM text
                     parent_text = parent.get_text()
-                    match = re.search(r'(\d+(?:\.\d+)?)\s*BPM', parent_text, re.I)
+                    match = _BPM_RE.search(parent_text)
                     if match:
                         bpm = float(match.group(1))
                         if 40 <= bpm <= 240:
@@ -372,7 +798,7 @@ class SongBPMScraper:
             tempo_elem = soup.select_one('[data-tempo], .tempo, #tempo')
             if tempo_elem:
                 tempo_text = tempo_elem.get_text()
-                match = re.search(r'(\d+(?:\.\d+)?)', tempo_text)
+                match = _NUM_RE.search(tempo_text)
                 if match:
                     bpm = float(match.group(1))
                     if 40 <= bpm <= 240:
@@ -384,83 +810,188 @@ class SongBPMScraper:
             logger.error(f"Error extracting BPM: {e}")
             return None
 
-    def _search_via_playwright(self, artist: str, title: str) -> Optional[Dict[str, Any]]:
+    def _search_via_playwright(
+        self,
+        artist: str,
+        title: str,
+        cancel: Optional[threading.Event] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Search using Playwright UI automation as final fallback.
 
+        Successful results are memoized per (artist, title), so repeat
+        lookups don't launch another browser.
+
         Args:
             artist: Artist name
             title: Song title
+            cancel: Optional event; a search still queued for the browser
+                thread when it is set is skipped
 
         Returns:
             Song data including BPM or None if not found
         """
+        key = (artist.lower(), title.lower())
+        if key in self._playwright_memo:
+            self._playwright_memo.move_to_end(key)
+            return self._playwright_memo[key]
+
+        result = self._run_playwright_search(artist, title, cancel)
+
+        # Only hits are remembered; a failure may be a transient timeout
+        if result:
+            self._playwright_memo[key] = result
+            if len(self._playwright_memo) > self.PLAYWRIGHT_MEMO_SIZE:
+                self._playwright_memo.popitem(last=False)
+        return result
+
+    def _run_playwright_search(
+        self,
+        artist: str,
+        title: str,
+        cancel: Optional[threading.Event] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Drive a headless browser through the songbpm.com search UI."""
         try:
-            from playwright.sync_api import sync_playwright
+            import playwright.sync_api  # noqa: F401
         except ImportError:
             logger.warning("Playwright not installed, skipping UI search fallback")
-            print("[Scraper] Playwright not installed, skipping UI search")
             return None
 
+        # Playwright's sync API must be driven from the thread that started
+        # it, and lookups can arrive on any thread (see BPMManager hedging),
+        # so all browser work runs on one dedicated thread
+        with self._playwright_lock:
+            if self._playwright_thread is None:
+                self._playwright_thread = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="scraper-playwright"
+                )
+            executor = self._playwright_thread
+
+        return executor.submit(self._playwright_search, artist, title, cancel).result()
+
+    def _browser_context(self):
+        """Return the shared browser context, launching Chromium on first use."""
+        if self._context is None:
+            from playwright.sync_api import sync_playwright
+
+            self._playwright = sync_playwright().start()
+            self._browser = self._playwright.chromium.launch(headless=True)
+            self._context = self._browser.new_context()
+        return self._context
+
+    def _playwright_search(
+        self,
+        artist: str,
+        title: str,
+        cancel: Optional[threading.Event] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Run one UI search on the Playwright thread, in a fresh page."""
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+        # Searches queue behind each other (and close()) on this thread;
+        # don't start one nobody is waiting for any more
+        if _cancelled(cancel):
+            return None
+
+        page = None
         try:
             query = f"{artist} {title}"
-            print(f"[Scraper] Playwright searching for: {query}")
+            logger.debug("Playwright searching for: %s", query)
 
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
+            page = self._browser_context().new_page()
 
-                # Navigate to songbpm.com - use domcontentloaded instead of networkidle
-                # networkidle times out on sites with continuous network activity
-                page.goto("https://songbpm.com", wait_until="domcontentloaded", timeout=15000)
+            # Navigate to songbpm.com - use domcontentloaded instead of networkidle
+            # networkidle times out on sites with continuous network activity
+            page.goto("https://songbpm.com", wait_until="domcontentloaded", timeout=15000)
 
-                # Wait for search box - uses name="query" and type="text"
-                page.wait_for_selector("input[name='query']", timeout=5000)
+            # Wait for search box - uses name="query" and type="text"
+            page.wait_for_selector("input[name='query']", timeout=5000)
 
-                # Fill search box and submit
-                page.fill("input[name='query']", query)
-                page.keyboard.press("Enter")
+            # Fill search box and submit
+            page.fill("input[name='query']", query)
+            page.keyboard.press("Enter")
 
-                # Wait for results to load
-                page.wait_for_selector("a[href^='/@']", timeout=5000)
+            # Wait for results to load
+            page.wait_for_selector("a[href^='/@']", timeout=5000)
 
-                # Click first result
-                first_result = page.query_selector("a[href^='/@']")
-                if not first_result:
-                    print("[Scraper] Playwright: No results found")
-                    browser.close()
-                    return None
+            # Click first result
+            first_result = page.query_selector("a[href^='/@']")
+            if not first_result:
+                logger.debug("Playwright: No results found")
+                return None
 
-                # Get the URL before clicking
-                result_url = first_result.get_attribute("href")
-                if result_url:
-                    result_url = f"{self.BASE_URL}{result_url}"
+            # Get the URL before clicking
+            result_href = first_result.get_attribute("href")
+            result_url = f"{self.BASE_URL}{result_href}" if result_href else None
+
+            # Wait for the song page and its BPM label rather than sleeping
+            # a fixed 2s; wait_for_url also covers client-side navigation
+            first_result.click()
+            try:
+                if result_href:
+                    page.wait_for_url(f"**{result_href}", wait_until="domcontentloaded", timeout=5000)
+                page.wait_for_selector("text=/\\d+\\s*BPM/i", timeout=3000)
+            except PlaywrightTimeoutError:
+                logger.debug("Playwright: song page still loading, reading it anyway")
+
+            # Extract BPM from the page
+            page_content = page.content()
+
+            # Parse the page content for BPM
+            bpm = self._extract_bpm_from_html(page_content)
+
+            if bpm:
+                logger.debug("Playwright found BPM: %s", bpm)
+                return {
+                    "bpm": bpm,
+                    "artist": artist,
+                    "title": title,
+                    "source": "songbpm_playwright",
+                    "url": result_url
+                }
+
+            logger.debug("Playwright: Could not extract BPM from page")
+            return None
 
-                first_result.click()
-                page.wait_for_timeout(2000)
+        except Exception as e:
+            logger.error(f"Playwright search failed: {e}")
+            return None
+        finally:
+            if page is not None:
+                try:
+                    page.close()
+                except Exception:
+                    pass
+
+    def _shutdown_browser(self):
+        """Close the shared browser; runs on the Playwright thread."""
+        try:
+            if self._browser is not None:
+                self._browser.close()
+            if self._playwright is not None:
+                self._playwright.stop()
+        except Exception as e:
+            logger.debug("Error shutting down Playwright: %s", e)
+        finally:
+            self._context = self._browser = self._playwright = None
 
-                # Extract BPM from the page
-                page_content = page.content()
-                browser.close()
+    def close(self):
+        """
+        Shut down the shared Playwright browser, if one was started.
 
-                # Parse the page content for BPM
-                soup = BeautifulSoup(page_content, 'html.parser')
-                bpm = self._extract_bpm(soup)
+        If the scraper is never closed, the browser's driver process still
+        exits with the interpreter when its pipe closes.
+        """
+        with self._playwright_lock:
+            executor, self._playwright_thread = self._playwright_thread, None
 
-                if bpm:
-                    print(f"[Scraper] Playwright found BPM: {bpm}")
-                    return {
-                        "bpm": bpm,
-                        "artist": artist,
-                        "title": title,
-                        "source": "songbpm_playwright",
-                        "url": result_url
-                    }
+        if executor is not None:
+            executor.submit(self._shutdown_browser).result()
+            executor.shutdown()
 
-                print("[Scraper] Playwright: Could not extract BPM from page")
-                return None
+    def __enter__(self):
+        return self
 
-        except Exception as e:
-            logger.error(f"Playwright search failed: {e}")
-            print(f"[Scraper] Playwright error: {e}")
-            return None
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
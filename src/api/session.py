@@ -0,0 +1,88 @@
+"""Shared HTTP session setup for the API clients."""
+
+import logging
+from datetime import timedelta
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+
+class _CappedRetry(Retry):
+    """Retry whose waits never exceed MAX_WAIT seconds.
+
+    Applies to the exponential backoff and to a server's Retry-After
+    header alike: a 503 asking for two minutes should fail the lookup over
+    to the next source, not stall it.
+    """
+
+    MAX_WAIT = 2.0
+
+    def get_backoff_time(self) -> float:
+        return min(super().get_backoff_time(), self.MAX_WAIT)
+
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.MAX_WAIT)
+
+
+# Retry transient upstream failures (connection errors, timeouts, rate
+# limiting, gateway errors) with exponential backoff instead of failing the
+# lookup outright
+RETRY = _CappedRetry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET"})
+)
+
+
+def create_session(
+    pool_connections: int = 32,
+    pool_maxsize: int = 64,
+    cache_path: Optional[str] = None,
+    expire_after: timedelta = timedelta(days=7)
+) -> requests.Session:
+    """
+    Create a keep-alive session with a sized connection pool and retries.
+
+    The default adapter keeps only 10 connections per host, which caps
+    concurrent lookups (e.g. GetSongBPMClient.search_many).
+
+    Args:
+        pool_connections: Number of per-host pools to cache
+        pool_maxsize: Maximum connections kept open per host
+        cache_path: If set and requests-cache is installed, responses
+            (including 404s) are cached on disk at this path
+        expire_after: How long cached responses stay valid
+
+    Returns:
+        Configured requests session
+    """
+    session = None
+    if cache_path:
+        try:
+            import requests_cache
+            session = requests_cache.CachedSession(
+                cache_path,
+                expire_after=expire_after,
+                allowable_codes=(200, 404)
+            )
+        except ImportError:
+            logger.warning("requests-cache not installed, HTTP responses won't be cached")
+
+    if session is None:
+        session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=RETRY
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -1,42 +1,184 @@
 """MongoDB cache implementation for storing BPM data."""
 
-from typing import Optional, Dict, Any
-from pymongo import MongoClient
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, Iterable, List, Tuple
+from pymongo import ASCENDING, DESCENDING, IndexModel, MongoClient, UpdateOne, WriteConcern
+from pymongo.collation import Collation
 from pymongo.errors import ConnectionFailure
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Case-insensitive comparison (strength 2 ignores case but not accents).
+# Queries must pass the same collation to use the artist_title_ci index.
+CASE_INSENSITIVE = Collation(locale="en", strength=2)
+
+# The bpm_cache indexes, created by MongoDBCache and the setup/seed scripts
+BPM_CACHE_INDEXES = (
+    # Lets every upsert resolve with an index scan, and keeps one entry per song
+    IndexModel([("artist", ASCENDING), ("title", ASCENDING)], unique=True),
+    # Equality on artist/title, then sort on recency: lookups that want the
+    # newest entry are answered by an IXSCAN with no SORT stage
+    IndexModel(
+        [("artist", ASCENDING), ("title", ASCENDING), ("last_updated", DESCENDING)],
+        name="artist_title_updated"
+    ),
+    # Case-insensitive variant used by the admin scripts' artist lookups
+    IndexModel(
+        [("artist", ASCENDING), ("title", ASCENDING)],
+        name="artist_title_ci",
+        collation=CASE_INSENSITIVE
+    ),
+)
+
+# Fields left out of cache reads: callers never use the ObjectId, and older
+# entries can carry the full upstream API payload under metadata.raw_data
+READ_PROJECTION = {"_id": 0, "metadata.raw_data": 0}
+
+# Fields get() and get_many() return: every BPM lookup only needs the bpm,
+# so the metadata subdocument isn't read, encoded or sent at all
+# (get_full() returns it). get_many also needs the key fields.
+BPM_PROJECTION = {"_id": 0, "bpm": 1, "last_updated": 1}
+BPM_MANY_PROJECTION = {"_id": 0, "artist": 1, "title": 1, "bpm": 1, "last_updated": 1}
+
+# Returned by MongoDBCache._memo_get when a key has no live memo entry
+# (None is a valid memoized value: a remembered cache miss)
+_NOT_MEMOIZED = object()
+
+# Connection strings whose server didn't answer, mapped to when (monotonic
+# clock). Every cache for such a server skips MongoDB until
+# MongoDBCache.DEAD_RETRY has passed, instead of each construction and
+# operation waiting out the server selection timeout again.
+_DEAD_SERVERS: Dict[str, float] = {}
+
+
+def create_missing_indexes(collection, indexes):
+    """
+    Create only the indexes a collection doesn't already have.
+
+    Existing index names are read with one listIndexes call, and the missing
+    definitions are sent together in a single createIndexes command, so
+    starting up against an initialized database creates nothing.
+
+    Args:
+        collection: Collection to index
+        indexes: IndexModel definitions
+    """
+    existing = {index["name"] for index in collection.list_indexes()}
+    missing = [index for index in indexes if index.document["name"] not in existing]
+    if missing:
+        collection.create_indexes(missing)
+    logger.info(f"{collection.name}: {len(missing)} of {len(indexes)} indexes created")
+
 
 class MongoDBCache:
     """Cache for storing song BPM data in MongoDB."""
 
-    def __init__(self, connection_string: str, database_name: str = "metromatch"):
+    # get() results are remembered in process so repeated lookups of the
+    # same song (e.g. now-playing polls) skip the MongoDB round trip
+    MEMO_SIZE = 2048
+    MEMO_TTL = 300.0
+    # Misses expire sooner so entries written by another process show up
+    MEMO_MISS_TTL = 30.0
+    # Seconds before a server that didn't answer is tried again
+    DEAD_RETRY = 60.0
+
+    def __init__(
+        self,
+        connection_string: str,
+        database_name: str = "metromatch",
+        buffer_size: int = 0,
+        fast_insert: bool = False
+    ):
         """
         Initialize MongoDB cache.
 
         Args:
             connection_string: MongoDB connection string
             database_name: Name of the database to use
+            buffer_size: Hold up to this many set() calls and write them in
+                one bulk write. 0 (the default) writes every set() straight
+                away. Buffered entries are visible to get() and get_many(),
+                and are written on flush() or close().
+            fast_insert: Write with an unacknowledged (w=0) write concern, so
+                set() returns once the request is on the socket instead of
+                waiting for the server. Cache entries can always be fetched
+                again, so a write lost this way costs one extra lookup.
         """
-        # Set a short timeout to avoid blocking if MongoDB isn't running
+        self.connection_string = connection_string
+        # Set a short timeout to avoid blocking if MongoDB isn't running.
+        # A desktop app makes one cache call at a time, so a small pool and
+        # an infrequent server monitor are enough.
         self.client = MongoClient(
             connection_string,
             serverSelectionTimeoutMS=2000,  # 2 second timeout
-            connectTimeoutMS=2000
+            connectTimeoutMS=2000,
+            maxPoolSize=2,
+            minPoolSize=0,
+            heartbeatFrequencyMS=30000,
+            appname="MetroMatch"
         )
         self.db = self.client[database_name]
         self.collection = self.db.bpm_cache
-        self._create_indexes()
+        # Reads keep the default write concern; only writes go through this
+        self.write_collection = (
+            self.collection.with_options(write_concern=WriteConcern(w=0))
+            if fast_insert else self.collection
+        )
+        self.buffer_size = buffer_size
+        # Pending writes keyed by lowercased (artist, title); a song set twice
+        # before a flush is only written once
+        self._buffer: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._buffer_lock = threading.Lock()
+        # (artist, title) -> (expiry on the monotonic clock, get() result)
+        self._memo: OrderedDict = OrderedDict()
+        self._memo_lock = threading.Lock()
+        # Indexes are created by the first call that reaches the server, so a
+        # cache constructed during an outage still gets them once it's back
+        self._indexes_ready = False
+        if not self._available():
+            logger.warning("MongoDB did not answer recently, skipping it for now")
+
+    def _server_down(self) -> bool:
+        """Whether this server failed to answer within the last DEAD_RETRY seconds."""
+        failed_at = _DEAD_SERVERS.get(self.connection_string)
+        return failed_at is not None and time.monotonic() - failed_at < self.DEAD_RETRY
+
+    def _note_failure(self, error: Exception):
+        """Remember an unreachable server so other calls skip it for a while."""
+        if isinstance(error, ConnectionFailure):
+            _DEAD_SERVERS[self.connection_string] = time.monotonic()
+
+    def _available(self) -> bool:
+        """
+        Whether to query MongoDB now, creating the indexes on first contact.
+
+        Returns:
+            False while the server is considered down (see DEAD_RETRY)
+        """
+        if self._server_down():
+            return False
+        if not self._indexes_ready:
+            self._create_indexes()
+            return not self._server_down()
+        return True
 
     def _create_indexes(self):
         """Create indexes for efficient querying."""
         try:
-            self.collection.create_index([("artist", 1), ("title", 1)], unique=True)
-            self.collection.create_index("last_updated")
-            logger.info("MongoDB indexes created successfully")
+            create_missing_indexes(self.collection, BPM_CACHE_INDEXES)
+            self._indexes_ready = True
         except Exception as e:
+            self._note_failure(e)
             logger.error(f"Error creating indexes: {e}")
+            # Only an unreachable server is worth trying again; anything
+            # else (e.g. duplicates blocking the unique index) would fail
+            # the same way on every call
+            if not isinstance(e, ConnectionFailure):
+                self._indexes_ready = True
 
     def get(self, artist: str, title: str) -> Optional[Dict[str, Any]]:
         """
@@ -47,61 +189,252 @@ class MongoDBCache:
             title: Song title
 
         Returns:
-            Cached BPM data or None if not found
+            Cached bpm and last_updated, or None if not found
         """
+        key = (artist.lower(), title.lower())
+        pending = self._buffer.get(key)
+        if pending is not None:
+            logger.debug(f"Cache hit (unflushed) for {artist} - {title}")
+            return dict(pending)
+
+        memoized = self._memo_get(key)
+        if memoized is not _NOT_MEMOIZED:
+            return dict(memoized) if memoized else None
+
+        if not self._available():
+            return None
+
         try:
             result = self.collection.find_one({
-                "artist": artist.lower(),
-                "title": title.lower()
-            })
+                "artist": key[0],
+                "title": key[1]
+            }, BPM_PROJECTION)
+            self._memo_put(key, result)
             if result:
                 logger.debug(f"Cache hit for {artist} - {title}")
-                return result
+                return dict(result)
             logger.debug(f"Cache miss for {artist} - {title}")
             return None
         except Exception as e:
+            self._note_failure(e)
             logger.error(f"Error retrieving from cache: {e}")
             return None
 
+    def get_full(self, artist: str, title: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve the whole cached document for a song, including metadata.
+
+        Unlike get(), this always queries MongoDB (or the write buffer).
+
+        Args:
+            artist: Artist name
+            title: Song title
+
+        Returns:
+            Cached document or None if not found
+        """
+        key = (artist.lower(), title.lower())
+        pending = self._buffer.get(key)
+        if pending is not None:
+            return dict(pending)
+
+        if not self._available():
+            return None
+
+        try:
+            return self.collection.find_one({
+                "artist": key[0],
+                "title": key[1]
+            }, READ_PROJECTION)
+        except Exception as e:
+            self._note_failure(e)
+            logger.error(f"Error retrieving from cache: {e}")
+            return None
+
+    def get_many(self, pairs: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """
+        Retrieve BPM data for several songs in a single query.
+
+        Args:
+            pairs: (artist, title) tuples
+
+        Returns:
+            Mapping of lowercased (artist, title) to cached data for every hit
+        """
+        keys = {(artist.lower(), title.lower()) for artist, title in pairs}
+        if not keys:
+            return {}
+
+        buffered = {key: dict(self._buffer[key]) for key in keys & self._buffer.keys()}
+        if not self._available():
+            return buffered
+
+        try:
+            cursor = self.collection.find({
+                "$or": [{"artist": artist, "title": title} for artist, title in keys]
+            }, BPM_MANY_PROJECTION)
+            hits = {(doc["artist"], doc["title"]): doc for doc in cursor}
+            hits.update(buffered)
+            logger.debug(f"Cache batch lookup: {len(hits)}/{len(keys)} hits")
+            return hits
+        except Exception as e:
+            self._note_failure(e)
+            logger.error(f"Error retrieving batch from cache: {e}")
+            return buffered
+
+    def _memo_get(self, key: Tuple[str, str]):
+        """Return the live memoized get() result for key, or _NOT_MEMOIZED."""
+        with self._memo_lock:
+            entry = self._memo.get(key)
+            if entry is None:
+                return _NOT_MEMOIZED
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._memo[key]
+                return _NOT_MEMOIZED
+            self._memo.move_to_end(key)
+            return value
+
+    def _memo_put(self, key: Tuple[str, str], value: Optional[Dict[str, Any]]):
+        """Remember a get() result (None for a miss), evicting the oldest."""
+        ttl = self.MEMO_TTL if value is not None else self.MEMO_MISS_TTL
+        with self._memo_lock:
+            self._memo[key] = (time.monotonic() + ttl, value)
+            self._memo.move_to_end(key)
+            if len(self._memo) > self.MEMO_SIZE:
+                self._memo.popitem(last=False)
+
+    def _memo_discard(self, keys: Iterable[Tuple[str, str]]):
+        """Forget memoized results for keys that are being written."""
+        with self._memo_lock:
+            for key in keys:
+                self._memo.pop(key, None)
+
+    @staticmethod
+    def _document(artist: str, title: str, bpm: float, metadata: Optional[Dict], now: datetime) -> Dict[str, Any]:
+        """Build the stored document for a song (keys lowercased)."""
+        return {
+            "artist": artist.lower(),
+            "title": title.lower(),
+            "bpm": bpm,
+            "last_updated": now,
+            "metadata": metadata or {}
+        }
+
+    def _bulk_upsert(self, documents: List[Dict[str, Any]]):
+        """Upsert documents in one unordered bulk write."""
+        self.write_collection.bulk_write([
+            UpdateOne(
+                {"artist": document["artist"], "title": document["title"]},
+                {"$set": document},
+                upsert=True
+            )
+            for document in documents
+        ], ordered=False)
+
     def set(self, artist: str, title: str, bpm: float, metadata: Optional[Dict] = None):
         """
         Store BPM data in cache.
 
+        With buffering enabled the write is deferred until the buffer is
+        full (or flush() is called).
+
         Args:
             artist: Artist name
             title: Song title
             bpm: Beats per minute
             metadata: Additional metadata to store
         """
+        document = self._document(artist, title, bpm, metadata, datetime.now(timezone.utc))
+        self._memo_discard([(document["artist"], document["title"])])
+
+        if self.buffer_size > 0:
+            with self._buffer_lock:
+                self._buffer[(document["artist"], document["title"])] = document
+                full = len(self._buffer) >= self.buffer_size
+            if full:
+                self.flush()
+            return
+
+        if not self._available():
+            return
+
         try:
-            from datetime import datetime, timezone
-
-            document = {
-                "artist": artist.lower(),
-                "title": title.lower(),
-                "bpm": bpm,
-                "last_updated": datetime.now(timezone.utc),
-                "metadata": metadata or {}
-            }
-
-            self.collection.update_one(
-                {"artist": artist.lower(), "title": title.lower()},
+            self.write_collection.update_one(
+                {"artist": document["artist"], "title": document["title"]},
                 {"$set": document},
                 upsert=True
             )
             logger.info(f"Cached BPM for {artist} - {title}: {bpm}")
         except Exception as e:
+            self._note_failure(e)
             logger.error(f"Error storing in cache: {e}")
 
+    def set_many(self, entries: Iterable[Tuple[str, str, float, Optional[Dict]]]):
+        """
+        Store BPM data for several songs in one unordered bulk write.
+
+        Args:
+            entries: (artist, title, bpm, metadata) tuples
+        """
+        if not self._available():
+            return
+
+        try:
+            now = datetime.now(timezone.utc)
+            documents = [
+                self._document(artist, title, bpm, metadata, now)
+                for artist, title, bpm, metadata in entries
+            ]
+            if not documents:
+                return
+
+            self._memo_discard((document["artist"], document["title"]) for document in documents)
+            self._bulk_upsert(documents)
+            logger.info(f"Cached BPM for {len(documents)} songs")
+        except Exception as e:
+            self._note_failure(e)
+            logger.error(f"Error storing batch in cache: {e}")
+
+    def flush(self):
+        """Write any buffered set() calls to MongoDB."""
+        with self._buffer_lock:
+            if not self._buffer:
+                return
+            documents = list(self._buffer.values())
+            try:
+                if not self._available():
+                    logger.warning(f"MongoDB unavailable, dropping {len(documents)} buffered cache entries")
+                else:
+                    self._bulk_upsert(documents)
+                    logger.info(f"Flushed {len(documents)} buffered cache entries")
+            except Exception as e:
+                self._note_failure(e)
+                logger.error(f"Error flushing cache buffer: {e}")
+            # Entries are advisory: a failed flush is logged and dropped
+            # rather than retried forever
+            self._buffer.clear()
+
     def clear(self):
         """Clear all cached data."""
+        with self._buffer_lock:
+            self._buffer.clear()
+        with self._memo_lock:
+            self._memo.clear()
+
+        if not self._available():
+            logger.warning("MongoDB unavailable, cache not cleared")
+            return
+
         try:
             result = self.collection.delete_many({})
             logger.info(f"Cleared {result.deleted_count} cached entries")
         except Exception as e:
+            self._note_failure(e)
             logger.error(f"Error clearing cache: {e}")
 
     def close(self):
-        """Close the MongoDB connection."""
+        """Flush buffered writes and close the MongoDB connection."""
+        self.flush()
         self.client.close()
         logger.info("MongoDB connection closed")
@@ -0,0 +1,286 @@
+"""MetroMatch command-line interface.
+
+Installed as the `metromatch` console script; also run by `python -m metromatch`.
+"""
+
+import os
+import sys
+import signal
+import argparse
+import threading
+
+# BPMManager and config.settings are imported inside main() once a command
+# has been parsed, so `--help` doesn't pay for MongoDB/scraper/audio imports
+# or .env parsing.
+
+_EPILOG = """
+Examples:
+  # Get BPM for a song
+  python -m metromatch bpm "Daft Punk" "Get Lucky"
+
+  # Start metronome at 120 BPM
+  python -m metromatch metronome 120
+
+  # Sync metronome to now playing
+  python -m metromatch sync
+
+  # Show statistics
+  python -m metromatch stats
+        """
+
+# Top-level help printed without building any argparse objects; {prog} is
+# filled in the way argparse does. tests/test_cli.py checks it still matches
+# _build_parser().format_help().
+_STATIC_HELP = """usage: {prog} [-h] {{bpm,metronome,sync,stats}} ...
+
+MetroMatch - BPM Detection and Metronome Sync
+
+positional arguments:
+  {{bpm,metronome,sync,stats}}
+                        Available commands
+    bpm                 Get BPM for a song
+    metronome           Start metronome
+    sync                Sync to now playing
+    stats               Show statistics
+
+options:
+  -h, --help            show this help message and exit
+""" + _EPILOG + "\n"
+
+
+def _add_bpm_parser(subparsers):
+    """Register the `bpm` command."""
+    bpm_parser = subparsers.add_parser('bpm', help='Get BPM for a song')
+    bpm_parser.add_argument('artist', help='Artist name')
+    bpm_parser.add_argument('title', help='Song title')
+
+
+def _add_metronome_parser(subparsers):
+    """Register the `metronome` command."""
+    # Only built when `metronome` is the command (or all subparsers are
+    # needed), so top-level --help still skips loading settings
+    from config.settings import settings
+
+    metronome_parser = subparsers.add_parser('metronome', help='Start metronome')
+    metronome_parser.add_argument('bpm', type=float, nargs='?', default=settings.DEFAULT_BPM,
+                                  help=f'BPM (default: {settings.DEFAULT_BPM})')
+    metronome_parser.add_argument('--duration', type=int, default=None,
+                                  help='Duration in seconds (default: infinite)')
+
+
+def _add_sync_parser(subparsers):
+    """Register the `sync` command."""
+    sync_parser = subparsers.add_parser('sync', help='Sync to now playing')
+    sync_parser.add_argument('--auto', action='store_true',
+                            help='Enable auto-sync loop')
+
+
+def _add_stats_parser(subparsers):
+    """Register the `stats` command."""
+    stats_parser = subparsers.add_parser('stats', help='Show statistics')
+    stats_parser.add_argument('--json', action='store_true',
+                              help='Print status as JSON')
+
+
+_SUBCOMMANDS = {
+    'bpm': _add_bpm_parser,
+    'metronome': _add_metronome_parser,
+    'sync': _add_sync_parser,
+    'stats': _add_stats_parser,
+}
+
+
+def _dumps(obj) -> str:
+    """
+    Serialize obj to a JSON string, using orjson when it is installed.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        JSON text
+    """
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return json.dumps(obj, default=str)
+    return orjson.dumps(obj, default=str).decode()
+
+
+def _sniff_subcommand(argv):
+    """
+    Return the subcommand named in argv, or None if it isn't a known one.
+
+    Args:
+        argv: Full argument vector (including the program name)
+
+    Returns:
+        Subcommand name or None
+    """
+    for tok in argv[1:]:
+        if not tok.startswith('-'):
+            return tok if tok in _SUBCOMMANDS else None
+    return None
+
+
+def _wait_for_stop(timeout=None):
+    """
+    Park the main thread until Ctrl+C or until timeout seconds pass.
+
+    The metronome plays on its own thread, so the main thread just blocks on
+    an Event instead of waking up every second to sleep again.
+
+    Args:
+        timeout: Seconds to wait (None waits until interrupted)
+
+    Raises:
+        KeyboardInterrupt: If stopped by Ctrl+C
+    """
+    stop = threading.Event()
+    previous = signal.signal(signal.SIGINT, lambda *_: stop.set())
+    try:
+        stopped = stop.wait(timeout)
+    finally:
+        # Later Ctrl+C presses (e.g. during cleanup) raise KeyboardInterrupt again
+        signal.signal(signal.SIGINT, previous)
+    if stopped:
+        raise KeyboardInterrupt
+
+
+def _build_parser(command=None):
+    """
+    Build the argument parser.
+
+    Args:
+        command: Only register this subcommand (None registers all of them)
+
+    Returns:
+        argparse.ArgumentParser
+    """
+    parser = argparse.ArgumentParser(
+        description="MetroMatch - BPM Detection and Metronome Sync",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
+    )
+
+    subparsers = parser.add_subparsers(dest='command', help='Available commands')
+    for name, add_parser in _SUBCOMMANDS.items():
+        if command is None or name == command:
+            add_parser(subparsers)
+    return parser
+
+
+def main():
+    """Main entry point for MetroMatch CLI."""
+    if len(sys.argv) == 1 or sys.argv[1] in ('-h', '--help'):
+        print(_STATIC_HELP.format(prog=os.path.basename(sys.argv[0])), end='')
+        return
+
+    # Only build the subparser that was asked for; help, typos and bare
+    # invocations still get all of them so usage lists every command
+    parser = _build_parser(_sniff_subcommand(sys.argv))
+
+    args = parser.parse_args()
+
+    if not args.command:
+        parser.print_help()
+        return
+
+    # Keep stdout clean for machine-readable output
+    banner_out = sys.stderr if getattr(args, 'json', False) else sys.stdout
+    if banner_out is sys.stderr:
+        os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+    from src.manager import BPMManager
+    from config.settings import settings
+
+    # Initialize manager
+    print("🎵 Initializing MetroMatch...", file=banner_out)
+    manager = BPMManager(
+        mongodb_uri=settings.MONGODB_URI,
+        getsongbpm_api_key=settings.GETSONGBPM_API_KEY,
+        use_scraper=settings.USE_SCRAPER,
+        auto_sync=settings.AUTO_SYNC
+    )
+
+    try:
+        if args.command == 'bpm':
+            # Get BPM command
+            print(f"\n🔍 Looking up: {args.artist} - {args.title}")
+            bpm = manager.get_bpm(args.artist, args.title)
+
+            if bpm:
+                print(f"✅ BPM: {bpm}")
+            else:
+                print("❌ Could not find BPM")
+                sys.exit(1)
+
+        elif args.command == 'metronome':
+            # Metronome command
+            print(f"\n🥁 Starting metronome at {args.bpm} BPM")
+            manager.start_metronome(args.bpm)
+
+            if args.duration:
+                print(f"⏱️  Running for {args.duration} seconds (Ctrl+C to stop)")
+                _wait_for_stop(args.duration)
+            else:
+                print("⏱️  Running (Ctrl+C to stop)")
+                _wait_for_stop()
+
+        elif args.command == 'sync':
+            # Sync command
+            if args.auto:
+                print("\n🔄 Starting auto-sync loop (Ctrl+C to stop)")
+                manager.auto_sync = True
+                manager.auto_sync_loop()
+            else:
+                print("\n🔄 Syncing to now playing...")
+                if manager.sync_to_now_playing():
+                    print(f"✅ Synced! BPM: {manager.current_bpm}")
+                    if manager.current_track:
+                        print(f"🎵 Track: {manager.current_track.get('artist')} - {manager.current_track.get('title')}")
+
+                    # Start metronome
+                    manager.start_metronome()
+                    print("🥁 Metronome started (Ctrl+C to stop)")
+
+                    _wait_for_stop()
+                else:
+                    print("❌ No track playing or BPM not found")
+                    sys.exit(1)
+
+        elif args.command == 'stats':
+            # Stats command
+            status = manager.get_status()
+
+            if args.json:
+                print(_dumps(status))
+                return
+
+            print("\n📊 MetroMatch Statistics")
+            print("=" * 60)
+
+            print(f"Current BPM: {status['current_bpm'] or 'N/A'}")
+            print(f"Metronome Running: {status['metronome_running']}")
+            print(f"Auto Sync: {status['auto_sync']}")
+            print(f"\nFeatures Available:")
+            print(f"  - MongoDB Cache: {'✅' if status['has_cache'] else '❌'}")
+            print(f"  - GetSongBPM API: {'✅' if status['has_api'] else '❌'}")
+            print(f"  - Web Scraper: {'✅' if status['has_scraper'] else '❌'}")
+
+            if status['current_track']:
+                track = status['current_track']
+                print(f"\nCurrent Track:")
+                print(f"  {track.get('artist')} - {track.get('title')}")
+                print(f"  Player: {track.get('player')}")
+
+    except KeyboardInterrupt:
+        print("\n\n🛑 Stopping...")
+    finally:
+        manager.cleanup()
+        print("👋 Goodbye!", file=banner_out)
+
+
+if __name__ == '__main__':
+    main()
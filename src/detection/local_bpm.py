@@ -1,21 +1,156 @@
 """Local BPM detection from audio files (optional feature)."""
 
+import json
+import os
+
 import librosa
 import numpy as np
+import soxr
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from typing import Optional, Dict, Any
 import logging
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Audio is analyzed as mono at librosa's default MIR rate: beat tracking
+# doesn't need more, and onset/beat work is linear in the sample count
+ANALYSIS_SR = 22050
+# Low-quality soxr resampling is fast and plenty for onset detection
+# (librosa's res_type name, and soxr's own for the streaming resampler)
+RESAMPLE_TYPE = 'soxr_lq'
+STREAM_RESAMPLE_QUALITY = 'LQ'
+# Only the first 2 minutes are analyzed
+ANALYSIS_DURATION = 120
+# librosa's default STFT window and hop between onset-envelope frames,
+# in samples
+N_FFT = 2048
+HOP_LENGTH = 512
+# Hops per block when streaming a file; the decoded audio held at once is
+# about STREAM_BLOCK_FRAMES * HOP_LENGTH samples
+STREAM_BLOCK_FRAMES = 256
+# Tempo range searched by the autocorrelation method (same realistic range
+# the scraper accepts)
+MIN_BPM, MAX_BPM = 40, 240
+# Per-folder record of analyzed files, used by analyze_folder to skip
+# files that haven't changed
+MANIFEST_NAME = ".metromatch_bpm.json"
+# The manifest is rewritten after this many new results (and when the run
+# ends or is interrupted), so stopping a long run keeps its progress
+MANIFEST_SAVE_EVERY = 8
+
 
 class LocalBPMDetector:
     """Detector for BPM from local audio files."""
 
+    __slots__ = ('supported_formats',)
+
     def __init__(self):
         """Initialize the local BPM detector."""
         self.supported_formats = ['.mp3', '.wav', '.flac', '.ogg', '.m4a']
 
+    @staticmethod
+    def _load(file_path: str):
+        """Decode the analyzed part of a file as mono at ANALYSIS_SR."""
+        return librosa.load(
+            file_path,
+            sr=ANALYSIS_SR,
+            mono=True,
+            duration=ANALYSIS_DURATION,
+            res_type=RESAMPLE_TYPE
+        )
+
+    def _onset_envelope(self, file_path: str):
+        """
+        Compute the onset strength envelope of the analyzed part of a file.
+
+        The file is streamed in blocks of STREAM_BLOCK_FRAMES hops, each block
+        is resampled to ANALYSIS_SR and only its mel spectrogram is kept, so
+        the whole signal is never in memory at once. Formats soundfile can't
+        stream (e.g. m4a) are decoded in one go with _load() instead.
+
+        Args:
+            file_path: Path to the audio file
+
+        Returns:
+            Tuple of (onset envelope, sample rate it was computed at)
+        """
+        try:
+            mel = self._stream_mel(file_path)
+        except Exception as e:
+            logger.debug(f"Cannot stream {file_path}, loading it whole: {e}")
+            y, sr = self._load(file_path)
+            return librosa.onset.onset_strength(y=y, sr=sr), sr
+
+        # Same envelope onset_strength computes from a signal: log-power mel
+        # frames. power_to_db is relative to ref=1.0, so the frames don't
+        # depend on each other; only the top_db floor (80 dB below the
+        # loudest frame) needs the whole spectrogram, hence after
+        # concatenating
+        return librosa.onset.onset_strength(S=librosa.power_to_db(mel), sr=ANALYSIS_SR), ANALYSIS_SR
+
+    @staticmethod
+    def _stream_mel(file_path: str):
+        """
+        Stream a file and compute its mel spectrogram at ANALYSIS_SR.
+
+        Blocks are read back to back at the file's own rate and fed through
+        one soxr stream, which keeps the filter state across block
+        boundaries. Samples that don't fill a whole STFT frame yet are
+        carried over to the next block. The signal is zero-padded by half a
+        window at both ends, as melspectrogram(center=True) does, so the
+        frames line up with those of the _load() path.
+
+        Args:
+            file_path: Path to the audio file
+
+        Returns:
+            Mel power spectrogram with one column per HOP_LENGTH samples
+        """
+        sr = librosa.get_samplerate(file_path)
+        # frame_length == hop_length: contiguous blocks, no overlap to resample twice
+        blocks = librosa.stream(
+            file_path,
+            block_length=STREAM_BLOCK_FRAMES,
+            frame_length=HOP_LENGTH,
+            hop_length=HOP_LENGTH,
+            mono=True,
+            duration=ANALYSIS_DURATION
+        )
+        resampler = None
+        if sr != ANALYSIS_SR:
+            resampler = soxr.ResampleStream(
+                sr, ANALYSIS_SR, 1, dtype='float32', quality=STREAM_RESAMPLE_QUALITY
+            )
+
+        mels = []
+        half_window = np.zeros(N_FFT // 2, dtype=np.float32)
+        pending = half_window
+
+        def add_frames(y):
+            """Append the mel frames that fit in y; return the leftover samples."""
+            n_frames = 1 + (len(y) - N_FFT) // HOP_LENGTH if len(y) >= N_FFT else 0
+            if n_frames:
+                mels.append(librosa.feature.melspectrogram(
+                    y=y[:N_FFT + (n_frames - 1) * HOP_LENGTH], sr=ANALYSIS_SR,
+                    n_fft=N_FFT, hop_length=HOP_LENGTH, center=False
+                ))
+            return y[n_frames * HOP_LENGTH:]
+
+        for block in blocks:
+            if resampler is not None:
+                block = resampler.resample_chunk(block)
+            pending = add_frames(np.concatenate([pending, block]))
+
+        if resampler is not None:
+            pending = np.concatenate([pending, resampler.resample_chunk(
+                np.zeros(0, dtype=np.float32), last=True
+            )])
+        # 1 + n_samples // HOP_LENGTH frames in all, like a centred STFT
+        add_frames(np.concatenate([pending, half_window]))
+
+        return np.concatenate(mels, axis=1)
+
     def detect_bpm(self, file_path: str) -> Optional[Dict[str, Any]]:
         """
         Detect BPM from a local audio file.
@@ -39,14 +174,15 @@ class LocalBPMDetector:
 
             logger.info(f"Analyzing {file_path}...")
 
-            # Load audio file
-            y, sr = librosa.load(file_path, sr=None, duration=120)  # Analyze first 2 minutes
+            # The onset envelope (STFT + spectral flux) is the expensive step;
+            # compute it once for both beat tracking and the confidence score
+            onset_env, sr = self._onset_envelope(file_path)
 
-            # Detect tempo
-            tempo, beats = librosa.beat.beat_track(y=y, sr=sr)
+            # Detect tempo (librosa >= 0.10.2 returns it as a 1-element array)
+            tempo, beats = librosa.beat.beat_track(onset_envelope=onset_env, sr=sr)
+            tempo = float(np.ravel(tempo)[0])
 
             # Calculate confidence based on beat strength
-            onset_env = librosa.onset.onset_strength(y=y, sr=sr)
             beat_strength = np.mean(onset_env[beats]) if len(beats) > 0 else 0
             confidence = min(beat_strength / 10.0, 1.0)  # Normalize to 0-1
 
@@ -75,19 +211,24 @@ class LocalBPMDetector:
             Dictionary with BPM estimates from different methods
         """
         try:
-            y, sr = librosa.load(file_path, sr=None, duration=120)
+            # One onset envelope feeds all three methods
+            onset_env, sr = self._onset_envelope(file_path)
 
             # Method 1: Standard beat tracking
-            tempo1, _ = librosa.beat.beat_track(y=y, sr=sr)
+            tempo1, _ = librosa.beat.beat_track(onset_envelope=onset_env, sr=sr)
+            tempo1 = float(np.ravel(tempo1)[0])
 
             # Method 2: Tempogram-based analysis
-            onset_env = librosa.onset.onset_strength(y=y, sr=sr)
-            tempogram = librosa.feature.tempogram(onset_envelope=onset_env, sr=sr)
-            tempo2 = librosa.beat.tempo(onset_envelope=onset_env, sr=sr)[0]
+            tempo2 = librosa.feature.rhythm.tempo(onset_envelope=onset_env, sr=sr)[0]
 
-            # Method 3: Autocorrelation
-            ac = librosa.autocorrelate(onset_env)
-            tempo3 = 60.0 * sr / (np.argmax(ac[sr // 60:]) + sr // 60)
+            # Method 3: Autocorrelation. Lags are in onset frames, so only
+            # the lags for MIN_BPM..MAX_BPM are computed and searched
+            frame_rate = sr / HOP_LENGTH
+            min_lag = int(60.0 * frame_rate / MAX_BPM)
+            max_lag = int(np.ceil(60.0 * frame_rate / MIN_BPM))
+            ac = librosa.autocorrelate(onset_env, max_size=max_lag + 1)
+            lag = min_lag + int(np.argmax(ac[min_lag:]))
+            tempo3 = 60.0 * frame_rate / lag
 
             # Average the estimates
             bpm_estimates = [tempo1, tempo2, tempo3]
@@ -112,12 +253,43 @@ class LocalBPMDetector:
             logger.error(f"Error in advanced BPM detection: {e}")
             return None
 
-    def analyze_folder(self, folder_path: str) -> Dict[str, Any]:
+    @staticmethod
+    def _load_manifest(path: Path) -> Dict[str, Any]:
+        """Load a folder's analysis manifest, or start an empty one."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                manifest = json.load(f)
+            return manifest if isinstance(manifest, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable manifest {path}: {e}")
+            return {}
+
+    @staticmethod
+    def _save_manifest(path: Path, manifest: Dict[str, Any]):
+        """Write the manifest atomically so an interrupted run can't corrupt it."""
+        tmp_path = path.with_name(path.name + ".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write manifest {path}: {e}")
+
+    def analyze_folder(self, folder_path: str, max_workers: Optional[int] = None) -> Dict[str, Any]:
         """
         Analyze all audio files in a folder.
 
+        Beat tracking is CPU bound and independent per file, so files are
+        analyzed in a process pool rather than one after another. Results
+        are recorded in a MANIFEST_NAME file in the folder as they arrive,
+        and files whose modification time and size are unchanged are not
+        analyzed again.
+
         Args:
             folder_path: Path to the folder
+            max_workers: Number of worker processes (defaults to the CPU count)
 
         Returns:
             Dictionary mapping file names to BPM data
@@ -135,10 +307,49 @@ class LocalBPMDetector:
 
         logger.info(f"Found {len(audio_files)} audio files to analyze")
 
+        # Files unchanged since a previous run are answered from the manifest
+        manifest_path = folder / MANIFEST_NAME
+        manifest = self._load_manifest(manifest_path)
+        pending = []
         for file_path in audio_files:
-            logger.info(f"Processing {file_path.name}...")
-            result = self.detect_bpm(str(file_path))
-            if result:
+            stat = file_path.stat()
+            signature = [stat.st_mtime_ns, stat.st_size]
+            entry = manifest.get(file_path.name)
+            if entry and entry.get("signature") == signature:
+                results[file_path.name] = entry["result"]
+            else:
+                pending.append((file_path, signature))
+
+        logger.info(f"{len(results)} files unchanged since last analysis, {len(pending)} to analyze")
+
+        executor = None
+        unsaved = 0
+        try:
+            if len(pending) < 2:
+                # Not worth starting worker processes for
+                analyzed = ((entry, self.detect_bpm(str(entry[0]))) for entry in pending)
+            else:
+                executor = ProcessPoolExecutor(max_workers=max_workers)
+                futures = {
+                    executor.submit(self.detect_bpm, str(file_path)): (file_path, signature)
+                    for file_path, signature in pending
+                }
+                analyzed = ((futures[future], future.result()) for future in as_completed(futures))
+
+            for (file_path, signature), result in analyzed:
+                if not result:
+                    continue
                 results[file_path.name] = result
+                manifest[file_path.name] = {"signature": signature, "result": result}
+                unsaved += 1
+                if unsaved >= MANIFEST_SAVE_EVERY:
+                    self._save_manifest(manifest_path, manifest)
+                    unsaved = 0
+        finally:
+            if executor is not None:
+                # After an interrupt, don't start files nobody will wait for
+                executor.shutdown(cancel_futures=True)
+            if unsaved:
+                self._save_manifest(manifest_path, manifest)
 
         return results
@@ -1,26 +1,134 @@
 """Now playing detection using system media session APIs."""
 
+import os
 import platform
-from typing import Optional, Dict, Any
+import re
+import threading
+import time
+from typing import Optional, Dict, Any, List
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Private framework behind Control Center's Now Playing widget. It reports
+# the track of whichever app owns the system media session, with no
+# subprocess and without touching the app.
+MEDIA_REMOTE_PATH = "/System/Library/PrivateFrameworks/MediaRemote.framework"
+# Seconds to wait for MediaRemote's callback before falling back
+MEDIA_REMOTE_TIMEOUT = 0.5
+
+# AppleScript used to read window titles of apps without AppleScript support,
+# run as `osascript <script> <app name>`. One script per poll: apps like
+# Tidal hide their window in the background, so it activates the app only
+# when it has no windows, then returns the title. It is compiled once in
+# _init_macos so polls skip the AppleScript compile step.
+_WINDOW_TITLE_SCRIPT = '''
+on run argv
+    set appName to item 1 of argv
+    tell application "System Events"
+        if not (exists process appName) then return ""
+        tell process appName
+            if (count of windows) is 0 then
+                tell application appName to activate
+                delay 0.3
+            end if
+            try
+                return name of window 1
+            end try
+        end tell
+    end tell
+    return ""
+end run
+'''
+
+# Window titles are split on their first " - " (after the app name has
+# been removed). Tidal shows "Song - Artist[, Artist...]" and only the first
+# artist is kept; other apps show "Artist - Song".
+_TIDAL_TITLE_RE = re.compile(r'(?P<song>.*?) - (?P<artist>[^,]*)', re.S)
+_GENERIC_TITLE_RE = re.compile(r'(?P<artist>.*?) - (?P<song>.*)', re.S)
+
+# Session bus whose signals are dispatched by the one GLib main loop thread
+# shared by every detector (see _mpris_signal_bus)
+_mpris_bus = None
+_mpris_bus_lock = threading.Lock()
+
+
+def _mpris_signal_bus():
+    """
+    Return the session bus whose signals are delivered on a GLib loop thread.
+
+    dbus-python only delivers signals through a main loop. The first call
+    initializes dbus-glib threading, connects the bus with a GLib main loop
+    and runs that loop on a daemon thread; later calls (e.g. from a second
+    detector) reuse both.
+
+    Returns:
+        dbus.SessionBus with a running main loop
+
+    Raises:
+        ImportError: dbus-python or PyGObject is not installed
+    """
+    global _mpris_bus
+    with _mpris_bus_lock:
+        if _mpris_bus is None:
+            import dbus  # type: ignore
+            from dbus.mainloop.glib import DBusGMainLoop, threads_init  # type: ignore
+            from gi.repository import GLib  # type: ignore
+
+            # Required before a second thread uses dbus-glib: polls make
+            # blocking calls on this bus while the loop thread dispatches it
+            threads_init()
+            bus = dbus.SessionBus(mainloop=DBusGMainLoop())
+            threading.Thread(
+                target=GLib.MainLoop().run,
+                name="now-playing-mpris",
+                daemon=True
+            ).start()
+            _mpris_bus = bus
+        return _mpris_bus
+
 
 class NowPlayingDetector:
     """Detector for currently playing music across different platforms."""
 
+    # Every attribute any platform sets; platform-specific ones stay unset
+    # on other platforms
+    __slots__ = (
+        'platform', 'has_media_support', '_get_track',
+        '_last_track', '_last_ts', '_min_interval',
+        # macOS
+        '_sb_players', '_window_title_apps', '_osa_command', '_osa_dir',
+        '_media_remote_info',
+        # Windows
+        '_loop', '_session_mgr',
+        # Linux
+        '_mpris_players', '_mpris_lock', '_bus',
+    )
+
     def __init__(self):
         """Initialize the detector based on current platform."""
         self.platform = platform.system()
         logger.info(f"Initializing NowPlayingDetector for {self.platform}")
+        self.has_media_support = False
+
+        # Last track found and when (monotonic clock). Polls closer together
+        # than _min_interval return it instead of querying the player again.
+        self._last_track: Optional[Dict[str, Any]] = None
+        self._last_ts = 0.0
+        self._min_interval = 1.0
 
+        # Pick the platform's track getter once; get_current_track is polled
+        # every second
+        self._get_track = None
         if self.platform == "Darwin":  # macOS
             self._init_macos()
+            self._get_track = self._get_macos_track
         elif self.platform == "Windows":
             self._init_windows()
+            self._get_track = self._get_windows_track
         elif self.platform == "Linux":
             self._init_linux()
+            self._get_track = self._get_linux_track
         else:
             logger.warning(f"Unsupported platform: {self.platform}")
 
@@ -28,15 +136,124 @@ class NowPlayingDetector:
         """Initialize macOS-specific detection using ScriptingBridge."""
         try:
             # Try to import macOS-specific modules
-            # ScriptingBridge is used in _get_macos_track()
-            import ScriptingBridge  # noqa: F401
+            from ScriptingBridge import SBApplication  # type: ignore
             self.has_media_support = True
             logger.info("macOS media detection initialized (ScriptingBridge)")
+
+            # Common music players with their bundle identifiers, resolved
+            # once: the lookup goes through LaunchServices, while isRunning()
+            # on the resolved object is cheap. None if not installed.
+            # Note: Only players with AppleScript/ScriptingBridge support will work
+            # Tidal does not have native AppleScript support (has scripting terminology: false)
+            # For Tidal, use macOS Media Remote API or Now Playing Center instead
+            players = [
+                ("Music", "com.apple.Music"),
+                ("Spotify", "com.spotify.client"),
+                ("iTunes", "com.apple.iTunes"),
+                # ("Tidal", "com.tidal.desktop"),  # Disabled - no AppleScript support
+            ]
+            self._sb_players = [
+                (player_name, SBApplication.applicationWithBundleIdentifier_(bundle_id))
+                for player_name, bundle_id in players
+            ]
+
+            # Apps read through their window title (bundle ID, name, title parser)
+            self._window_title_apps = [
+                ("com.tidal.desktop", "TIDAL", self._parse_tidal_title),
+                ("com.soundcloud.desktop", "SoundCloud", self._parse_generic_title),
+            ]
+            self._osa_command = self._compile_window_title_script()
+            self._media_remote_info = self._load_media_remote()
         except ImportError as e:
             logger.warning(f"macOS media detection not available: {e}")
             logger.info("Install with: pip install pyobjc-framework-ScriptingBridge")
             self.has_media_support = False
 
+    def _load_media_remote(self):
+        """
+        Load MRMediaRemoteGetNowPlayingInfo from the MediaRemote framework.
+
+        The function reports through an Objective-C block, which plain ctypes
+        can't build, so it is bound with PyObjC. Its answer is delivered on
+        a GCD queue and waited for here.
+
+        Returns:
+            Function taking a timeout and returning the now playing info
+            dictionary (or None), or None if MediaRemote is unavailable
+        """
+        try:
+            import objc  # type: ignore
+            from Foundation import NSBundle  # type: ignore
+            from libdispatch import dispatch_get_global_queue  # type: ignore
+
+            bundle = NSBundle.bundleWithPath_(MEDIA_REMOTE_PATH)
+            if bundle is None:
+                return None
+
+            functions: Dict[str, Any] = {}
+            objc.loadBundleFunctions(bundle, functions, [(
+                "MRMediaRemoteGetNowPlayingInfo",
+                b"v@@?",
+                "",
+                {"arguments": {1: {"callable": {
+                    "retval": {"type": b"v"},
+                    "arguments": {0: {"type": b"^v"}, 1: {"type": b"@"}},
+                }}}},
+            )])
+            get_now_playing_info = functions.get("MRMediaRemoteGetNowPlayingInfo")
+            if get_now_playing_info is None:
+                return None
+        except Exception as e:
+            logger.debug(f"MediaRemote not available, using window titles: {e}")
+            return None
+
+        queue = dispatch_get_global_queue(0, 0)
+
+        def now_playing_info(timeout: float):
+            done = threading.Event()
+            reply = {}
+
+            def handler(info):
+                reply["info"] = info
+                done.set()
+
+            get_now_playing_info(queue, handler)
+            if not done.wait(timeout):
+                return None
+            return reply.get("info")
+
+        logger.info("macOS Now Playing detection initialized (MediaRemote)")
+        return now_playing_info
+
+    def _compile_window_title_script(self) -> List[str]:
+        """
+        Compile the window title script once and return the command to run it.
+
+        Running a compiled .scpt skips parsing and compiling the AppleScript
+        on every poll. If osacompile fails, the source is passed to
+        osascript directly instead.
+
+        Returns:
+            osascript command; append the app name to run it
+        """
+        import subprocess
+        import tempfile
+
+        # Removed with the detector (or at interpreter exit)
+        self._osa_dir = tempfile.TemporaryDirectory(prefix="metromatch-")
+        compiled = os.path.join(self._osa_dir.name, "window_title.scpt")
+        try:
+            subprocess.run(
+                ['osacompile', '-o', compiled, '-e', _WINDOW_TITLE_SCRIPT],
+                capture_output=True,
+                check=True,
+                timeout=5
+            )
+            return ['osascript', compiled]
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.debug(f"Could not compile window title script, using source: {e}")
+            return ['osascript', '-e', _WINDOW_TITLE_SCRIPT]
+
     def _init_windows(self):
         """Initialize Windows-specific detection using Windows.Media API."""
         try:
@@ -47,9 +264,52 @@ class NowPlayingDetector:
         except ImportError:
             logger.warning("Windows media detection not available (winrt not installed)")
             self.has_media_support = False
+            return
+
+        # WinRT calls are awaited on one long-lived event loop instead of a
+        # new asyncio.run() loop per poll, and the session manager is
+        # requested once
+        import asyncio
+
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(
+            target=self._loop.run_forever,
+            name="now-playing-winrt",
+            daemon=True
+        ).start()
+        self._session_mgr = None
+        try:
+            self._session_mgr = self._run_winrt(
+                media_control.GlobalSystemMediaTransportControlsSessionManager.request_async()
+            )
+        except Exception as e:
+            logger.debug(f"Could not get media session manager, retrying on poll: {e}")
+
+    def _run_winrt(self, operation, timeout: float = 5.0):
+        """
+        Await a WinRT async operation on the detector's event loop.
+
+        Args:
+            operation: Awaitable WinRT IAsyncOperation
+            timeout: Seconds to wait for the result
+
+        Returns:
+            The operation's result
+        """
+        import asyncio
+
+        async def wait():
+            return await operation
+
+        return asyncio.run_coroutine_threadsafe(wait(), self._loop).result(timeout)
 
     def _init_linux(self):
         """Initialize Linux-specific detection using MPRIS."""
+        # Known MPRIS player bus names, kept up to date from NameOwnerChanged
+        # signals. None when signals can't be received, in which case every
+        # poll lists the bus names instead.
+        self._mpris_players: Optional[set] = None
+        self._mpris_lock = threading.Lock()
         try:
             import dbus # type: ignore
             self.has_media_support = True
@@ -57,11 +317,59 @@ class NowPlayingDetector:
         except ImportError:
             logger.warning("Linux media detection not available (dbus not installed)")
             self.has_media_support = False
+            return
+
+        self._watch_mpris_players()
+
+    def _watch_mpris_players(self):
+        """
+        Enumerate MPRIS players once and track them through bus signals.
+
+        Signals arrive on the shared GLib loop thread (_mpris_signal_bus).
+        Without PyGObject the player list is not tracked and
+        _get_linux_track lists bus names on every poll.
+        """
+        try:
+            bus = _mpris_signal_bus()
+            # Subscribe before listing, so a player starting in between is
+            # not missed (adding a name twice is harmless)
+            self._mpris_players = set()
+            bus.add_signal_receiver(
+                self._on_name_owner_changed,
+                signal_name='NameOwnerChanged',
+                dbus_interface='org.freedesktop.DBus',
+                bus_name='org.freedesktop.DBus',
+                path='/org/freedesktop/DBus'
+            )
+            names = [
+                str(name) for name in bus.list_names()
+                if name.startswith('org.mpris.MediaPlayer2.')
+            ]
+            with self._mpris_lock:
+                self._mpris_players.update(names)
+            self._bus = bus
+            logger.debug(f"Watching MPRIS players: {sorted(names)}")
+        except Exception as e:
+            logger.debug(f"Not watching MPRIS players, listing on each poll: {e}")
+            self._mpris_players = None
+
+    def _on_name_owner_changed(self, name, old_owner, new_owner):
+        """Add or drop an MPRIS player as its bus name appears or goes away."""
+        if self._mpris_players is None or not name.startswith('org.mpris.MediaPlayer2.'):
+            return
+        with self._mpris_lock:
+            if new_owner:
+                self._mpris_players.add(str(name))
+            else:
+                self._mpris_players.discard(str(name))
 
     def get_current_track(self) -> Optional[Dict[str, Any]]:
         """
         Get currently playing track information.
 
+        A track found less than _min_interval seconds ago is returned
+        without asking the player again.
+
         Returns:
             Dictionary with artist, title, and album information or None
         """
@@ -69,37 +377,23 @@ class NowPlayingDetector:
             logger.warning("Media detection not supported on this system")
             return None
 
-        if self.platform == "Darwin":
-            return self._get_macos_track()
-        elif self.platform == "Windows":
-            return self._get_windows_track()
-        elif self.platform == "Linux":
-            return self._get_linux_track()
+        if self._last_track and time.monotonic() - self._last_ts < self._min_interval:
+            return dict(self._last_track)
 
-        return None
+        track = self._get_track()
+        if track:
+            self._last_track = track
+            self._last_ts = time.monotonic()
+            return dict(track)
+        return track
 
     def _get_macos_track(self) -> Optional[Dict[str, Any]]:
         """Get currently playing track on macOS using ScriptingBridge."""
         try:
-            from ScriptingBridge import SBApplication # type: ignore
-
-            # Try common music players with their bundle identifiers
-            # Note: Only players with AppleScript/ScriptingBridge support will work
-            # Tidal does not have native AppleScript support (has scripting terminology: false)
-            # For Tidal, use macOS Media Remote API or Now Playing Center instead
-            players = [
-                ("Music", "com.apple.Music"),
-                ("Spotify", "com.spotify.client"),
-                ("iTunes", "com.apple.iTunes"),
-                # ("Tidal", "com.tidal.desktop"),  # Disabled - no AppleScript support
-            ]
-
             # First try AppleScript-capable players
-            for player_name, bundle_id in players:
+            for player_name, player in self._sb_players:
                 try:
-                    player = SBApplication.applicationWithBundleIdentifier_(bundle_id)
-
-                    # Check if player is running
+                    # Check if player is installed and running
                     if not player or not player.isRunning():
                         continue
 
@@ -139,9 +433,6 @@ class NowPlayingDetector:
 
             return None
 
-        except ImportError as e:
-            logger.error(f"ScriptingBridge not available: {e}")
-            return None
         except Exception as e:
             logger.error(f"Error getting macOS track: {e}")
             return None
@@ -149,9 +440,13 @@ class NowPlayingDetector:
     def _get_macos_now_playing_center(self) -> Optional[Dict[str, Any]]:
         """
         Get currently playing track from apps without AppleScript support.
-        This monitors window titles for apps like Tidal.
 
-        How it works:
+        MediaRemote (the system Now Playing info) is asked first: one native
+        call that works for any app and never activates it. Newer macOS
+        releases return nothing to unentitled processes, so window titles
+        of known apps like Tidal are read as a fallback.
+
+        How the fallback works:
         1. Gets all running applications using NSWorkspace
         2. Looks for target apps (Tidal, etc.) by bundle ID
         3. Reads the window title which often contains: "Artist - Song - App"
@@ -162,18 +457,16 @@ class NowPlayingDetector:
         - Parsing format may vary between apps
         - May not work if window is minimized or app is in background
         """
+        track_info = self._get_media_remote_track()
+        if track_info:
+            return track_info
+
         try:
             from AppKit import NSWorkspace  # type: ignore
 
             workspace = NSWorkspace.sharedWorkspace()
 
-            # Apps to check (bundle ID, name, title parsing pattern)
-            target_apps = [
-                ("com.tidal.desktop", "TIDAL", self._parse_tidal_title),
-                ("com.soundcloud.desktop", "SoundCloud", self._parse_generic_title),
-            ]
-
-            for bundle_id, app_name, parser in target_apps:
+            for bundle_id, app_name, parser in self._window_title_apps:
                 try:
                     # Get all running applications
                     running_apps = workspace.runningApplications()
@@ -198,6 +491,33 @@ class NowPlayingDetector:
             logger.debug(f"Error in window title monitoring: {e}")
             return None
 
+    def _get_media_remote_track(self) -> Optional[Dict[str, Any]]:
+        """Get the system Now Playing track from MediaRemote, if loaded."""
+        if self._media_remote_info is None:
+            return None
+
+        try:
+            info = self._media_remote_info(MEDIA_REMOTE_TIMEOUT)
+            if not info:
+                return None
+
+            artist = info.get("kMRMediaRemoteNowPlayingInfoArtist")
+            title = info.get("kMRMediaRemoteNowPlayingInfoTitle")
+            album = info.get("kMRMediaRemoteNowPlayingInfoAlbum")
+            if artist and title:
+                logger.info(f"Found track from MediaRemote: {artist} - {title}")
+                return {
+                    "artist": str(artist),
+                    "title": str(title),
+                    "album": str(album) if album else None,
+                    "player": "Now Playing",
+                }
+            return None
+
+        except Exception as e:
+            logger.debug(f"Error reading MediaRemote now playing info: {e}")
+            return None
+
     def _get_app_window_title(self, app, app_name: str, parser) -> Optional[Dict[str, Any]]:
         """
         Get window title from an NSRunningApplication using AppleScript.
@@ -216,61 +536,13 @@ class NowPlayingDetector:
         import subprocess
         
         try:
-
-            # First, check if the app has windows - if not, activate it
-            # This is needed for apps like Tidal that hide windows when in background
-            check_script = f'''
-            tell application "System Events"
-                tell process "{app_name}"
-                    if exists then
-                        return count of windows
-                    end if
-                end tell
-            end tell
-            '''
-
-            result = subprocess.run(
-                ['osascript', '-e', check_script],
-                capture_output=True,
-                text=True,
-                timeout=2
-            )
-
-            window_count = 0
-            if result.returncode == 0 and result.stdout.strip().isdigit():
-                window_count = int(result.stdout.strip())
-
-            # If no windows, activate the app to make window visible
-            if window_count == 0:
-                logger.debug(f"{app_name} has no visible windows, activating...")
-                activate_script = f'tell application "{app_name}" to activate'
-                subprocess.run(
-                    ['osascript', '-e', activate_script],
-                    capture_output=True,
-                    timeout=1
-                )
-                # Give it a moment to show the window
-                import time
-                time.sleep(0.3)
-
-            # Now get the window title
-            get_title_script = f'''
-            tell application "System Events"
-                tell process "{app_name}"
-                    if exists then
-                        try
-                            return name of window 1
-                        end try
-                    end if
-                end tell
-            end tell
-            '''
-
+            # Activates the app first if it has no windows, then reads the
+            # title - one osascript process per poll
             result = subprocess.run(
-                ['osascript', '-e', get_title_script],
+                self._osa_command + [app_name],
                 capture_output=True,
                 text=True,
-                timeout=2
+                timeout=3
             )
 
             if result.returncode == 0 and result.stdout:
@@ -313,20 +585,14 @@ class NowPlayingDetector:
         # Remove trailing " - TIDAL" or " - Tidal" if present
         title = title.replace(" - TIDAL", "").replace(" - Tidal", "").strip()
 
-        # Split on " - " to get parts
-        parts = title.split(" - ", 1)
+        # Tidal shows "Song - Artist(s)"; only the first artist is kept
+        match = _TIDAL_TITLE_RE.match(title)
 
-        if len(parts) >= 2:
-            # Tidal shows: "Song - Artist(s)"
-            # So parts[0] is song, parts[1] is artist(s)
-            song = parts[0].strip()
-            artist = parts[1].strip()
+        if match:
+            song = match.group('song').strip()
+            artist = match.group('artist').strip()
 
-            # Extract only the first artist if multiple are listed
-            if ',' in artist:
-                artist = artist.split(',')[0].strip()
-
-            if artist and song:
+            if artist and song and app_name not in (artist, song):
                 return {
                     "artist": artist,
                     "title": song,
@@ -353,14 +619,13 @@ class NowPlayingDetector:
         # Remove app name from end if present
         title = title.replace(f" - {app_name}", "").strip()
 
-        # Split on " - "
-        parts = title.split(" - ", 1)
+        match = _GENERIC_TITLE_RE.match(title)
 
-        if len(parts) >= 2:
-            artist = parts[0].strip()
-            song = parts[1].strip()
+        if match:
+            artist = match.group('artist').strip()
+            song = match.group('song').strip()
 
-            if artist and song:
+            if artist and song and app_name not in (artist, song):
                 return {
                     "artist": artist,
                     "title": song,
@@ -373,24 +638,22 @@ class NowPlayingDetector:
     def _get_windows_track(self) -> Optional[Dict[str, Any]]:
         """Get currently playing track on Windows."""
         try:
-            import asyncio
             from winrt.windows.media.control import GlobalSystemMediaTransportControlsSessionManager as MediaManager  # type: ignore
 
-            async def get_media_info():
-                sessions = await MediaManager.request_async()
-                current_session = sessions.get_current_session()
-
-                if current_session:
-                    info = await current_session.try_get_media_properties_async()
-                    return {
-                        "artist": info.artist,
-                        "title": info.title,
-                        "album": info.album_title,
-                        "player": current_session.source_app_user_model_id
-                    }
-                return None
+            if self._session_mgr is None:
+                self._session_mgr = self._run_winrt(MediaManager.request_async())
 
-            return asyncio.run(get_media_info())
+            current_session = self._session_mgr.get_current_session()
+
+            if current_session:
+                info = self._run_winrt(current_session.try_get_media_properties_async())
+                return {
+                    "artist": info.artist,
+                    "title": info.title,
+                    "album": info.album_title,
+                    "player": current_session.source_app_user_model_id
+                }
+            return None
 
         except Exception as e:
             logger.error(f"Error getting Windows track: {e}")
@@ -401,11 +664,17 @@ class NowPlayingDetector:
         try:
             import dbus  # type: ignore
 
-            bus = dbus.SessionBus()
-
-            # Get list of MPRIS players
-            players = [name for name in bus.list_names()
-                      if name.startswith('org.mpris.MediaPlayer2.')]
+            if self._mpris_players is not None:
+                bus = self._bus
+                # Copied: the signal thread may change the set meanwhile
+                with self._mpris_lock:
+                    players = list(self._mpris_players)
+            else:
+                bus = dbus.SessionBus()
+
+                # Get list of MPRIS players
+                players = [name for name in bus.list_names()
+                          if name.startswith('org.mpris.MediaPlayer2.')]
 
             for player_name in players:
                 try:
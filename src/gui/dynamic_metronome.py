@@ -2,13 +2,29 @@
 
 import tkinter as tk
 from tkinter import ttk
+import random
 import threading
 import time
-import math
-from typing import Optional
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
 import pygame
 import numpy as np
 
+from src.metronome.timing import (
+    begin_timer_resolution, end_timer_resolution, raise_thread_priority, sleep_until
+)
+
+# Click sounds are 0.1s at the mixer rate. The time base and the linear
+# decay envelope don't depend on pitch or volume, so they are built once
+# and only the sine is computed per regeneration.
+CLICK_SAMPLE_RATE = 44100
+CLICK_DURATION = 0.1
+_CLICK_T = np.arange(int(CLICK_SAMPLE_RATE * CLICK_DURATION)) / CLICK_SAMPLE_RATE
+_CLICK_PHASE = 2 * np.pi * _CLICK_T  # Phase per Hz of pitch
+_CLICK_ENVELOPE = 1.0 - _CLICK_T / CLICK_DURATION
+# (pitch, volume) settings whose click sounds are kept for reuse
+CLICK_CACHE_SIZE = 32
+
 
 class DynamicMetronome:
     """Interactive metronome with BPM, volume, pitch, and advanced features."""
@@ -27,6 +43,14 @@ class DynamicMetronome:
         # Initialize pygame mixer for audio with smaller buffer for lower latency
         pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=256)
 
+        # Dedicated channels for each click, so a beat never waits on the
+        # mixer's search for a free channel. Reserved channels are skipped
+        # by Sound.play(), so nothing else can take them.
+        pygame.mixer.set_reserved(3)
+        self._accent_channel = pygame.mixer.Channel(0)
+        self._normal_channel = pygame.mixer.Channel(1)
+        self._poly_channel = pygame.mixer.Channel(2)
+
         # State variables
         self.is_playing = False
         self.current_beat = 0
@@ -52,18 +76,59 @@ class DynamicMetronome:
         self.polyrhythm_enabled = tk.BooleanVar(value=False)
         self.polyrhythm_ratio = tk.StringVar(value="3:2")
         self.polyrhythm_beat_count = 0  # Track beats for polyrhythm
+        self._rng = random.Random()  # Picks dynamic BPM values
+
+        # Plain-Python copies of the settings the metronome thread reads on
+        # every beat, kept current by variable traces. Reading a Tk variable
+        # is a Tcl round trip that contends with the GUI thread.
+        self._params: Dict[str, Any] = {}
+        for name in (
+            'bpm', 'time_sig_numerator', 'dynamic_bpm_enabled', 'dynamic_bpm_min',
+            'dynamic_bpm_max', 'dynamic_bpm_interval', 'swing_enabled',
+            'swing_ratio', 'polyrhythm_enabled',
+        ):
+            self._watch_param(name, getattr(self, name))
+        self._watch_param('polyrhythm_ratio', self.polyrhythm_ratio, self._parse_ratio)
 
         # Pre-generate click sounds for better timing accuracy
         self.accent_sound = None
         self.normal_sound = None
+        self._regen_job: Optional[str] = None  # Pending debounced regeneration
+        # (pitch, volume) -> (accent, normal) sounds, least recently used first
+        self._click_sounds: OrderedDict = OrderedDict()
         self._generate_click_sounds()
 
         # Build GUI
         self._build_gui()
 
         # Add callbacks to regenerate sounds when pitch or volume changes
-        self.pitch.trace_add('write', lambda *_: self._generate_click_sounds())
-        self.volume.trace_add('write', lambda *_: self._generate_click_sounds())
+        self.pitch.trace_add('write', self._schedule_click_sounds)
+        self.volume.trace_add('write', self._schedule_click_sounds)
+
+    def _watch_param(self, name: str, variable: tk.Variable, convert: Optional[Callable] = None):
+        """Mirror a Tk variable into self._params[name] on every write.
+
+        Args:
+            name: Key in self._params
+            variable: Tk variable to mirror
+            convert: Optional function applied to the variable's value
+        """
+        def update(*args):
+            try:
+                value = variable.get()
+                self._params[name] = convert(value) if convert else value
+            except (tk.TclError, ValueError):
+                # Mid-edit value (e.g. an emptied spinbox); keep the last one
+                pass
+
+        update()
+        variable.trace_add('write', update)
+
+    @staticmethod
+    def _parse_ratio(ratio: str) -> Tuple[int, int]:
+        """Parse a polyrhythm ratio like "3:2" into (3, 2)."""
+        base_beats, poly_beats = ratio.split(':')
+        return int(base_beats), int(poly_beats)
 
     def _build_gui(self):
         """Build the GUI interface."""
@@ -296,36 +361,55 @@ class DynamicMetronome:
         )
         denominator_combo.pack(side=tk.LEFT)
 
+    def _schedule_click_sounds(self, *args):
+        """Regenerate click sounds once a pitch/volume slider stops moving.
+
+        Dragging a slider writes its variable many times a second; each
+        write restarts a short timer so only the final value is rendered.
+        """
+        if self._regen_job is not None:
+            self.root.after_cancel(self._regen_job)
+        self._regen_job = self.root.after(50, self._generate_click_sounds)
+
     def _generate_click_sounds(self):
         """Pre-generate accent and normal click sounds for better timing."""
-        sample_rate = 44100
-        duration = 0.1
-        samples = int(sample_rate * duration)
+        self._regen_job = None
 
         # Get current pitch and volume settings
         base_pitch = self.pitch.get()  # Hz from slider
-        base_volume = self.volume.get() / 100.0  # Convert percentage to 0-1
+        volume_percent = self.volume.get()
+        base_volume = volume_percent / 100.0  # Convert percentage to 0-1
+
+        # Settings used before (e.g. toggling between practice presets)
+        # reuse their sounds
+        key = (base_pitch, volume_percent)
+        cached = self._click_sounds.get(key)
+        if cached is not None:
+            self._click_sounds.move_to_end(key)
+            self.accent_sound, self.normal_sound = cached
+            return
 
         def create_click(pitch_multiplier, volume_multiplier):
             """Create a single click sound."""
             frequency = base_pitch * pitch_multiplier
             volume = min(base_volume * volume_multiplier, 1.0)
 
-            buf = []
-            for i in range(samples):
-                t = i / sample_rate
-                envelope = 1.0 - (t / duration)
-                value = volume * envelope * math.sin(2 * math.pi * frequency * t)
-                sample = int(np.clip(value * 32767, -32768, 32767))
-                buf.append(sample)
+            # Whole-buffer NumPy ops; int16 conversion truncates like int()
+            value = volume * _CLICK_ENVELOPE * np.sin(frequency * _CLICK_PHASE)
+            wave = np.clip(value * 32767, -32768, 32767).astype(np.int16)
 
-            stereo_buf = np.array([[s, s] for s in buf], dtype=np.int16)
+            # Same samples on both channels; make_sound needs a C-contiguous array
+            stereo_buf = np.repeat(wave[:, np.newaxis], 2, axis=1)
             return pygame.sndarray.make_sound(stereo_buf)
 
         # Pre-generate both sounds
         self.accent_sound = create_click(1.2, 1.3)  # Higher pitch, louder
         self.normal_sound = create_click(1.0, 1.0)  # Normal
 
+        self._click_sounds[key] = (self.accent_sound, self.normal_sound)
+        if len(self._click_sounds) > CLICK_CACHE_SIZE:
+            self._click_sounds.popitem(last=False)
+
     def toggle_developer_mode(self):
         """Toggle developer mode visibility."""
         if self.developer_mode.get():
@@ -363,83 +447,84 @@ class DynamicMetronome:
         self.beat_label.config(text="Beat: -")
 
     def _metronome_loop(self):
+        """Run the beat loop on a high-priority thread with a fine OS timer."""
+        raise_thread_priority()
+        begin_timer_resolution()
+        try:
+            self._beat_loop()
+        finally:
+            end_timer_resolution()
+
+    def _beat_loop(self):
         """Main metronome loop with precise timing."""
         next_beat_time = time.perf_counter()
         next_poly_time = time.perf_counter()
         total_beats = 0  # Track total beats for dynamic BPM interval
-        current_dynamic_bpm = self.bpm.get()  # Store current random BPM
+        params = self._params
+        current_dynamic_bpm = params['bpm']  # Store current random BPM
 
         while self.is_playing:
-            # Precise sleep until next beat FIRST
-            sleep_time = next_beat_time - time.perf_counter()
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-            else:
-                # We're running behind, skip this beat timing compensation
-                pass
+            # Precise sleep until next beat FIRST (returns at once if
+            # we're running behind)
+            sleep_until(next_beat_time)
 
             # Store current beat for UI update before any changes
             current_beat_for_ui = self.current_beat
 
             # Play pre-generated sound at exact beat time
             if self.current_beat == 0 and self.accent_sound:
-                self.accent_sound.play()
+                self._accent_channel.play(self.accent_sound)
             elif self.normal_sound:
-                self.normal_sound.play()
+                self._normal_channel.play(self.normal_sound)
 
             # Check if polyrhythm should play on this beat
-            if self.polyrhythm_enabled.get():
+            if params['polyrhythm_enabled']:
                 poly_now = time.perf_counter()
                 if poly_now >= next_poly_time:
                     # Play polyrhythm accent sound
                     if self.accent_sound:
-                        self.accent_sound.play()
+                        self._poly_channel.play(self.accent_sound)
                     # Calculate next polyrhythm beat
-                    ratio_parts = self.polyrhythm_ratio.get().split(':')
-                    poly_beats = int(ratio_parts[1])  # Denominator
-                    base_beats = int(ratio_parts[0])  # Numerator
-                    bpm = current_dynamic_bpm if self.dynamic_bpm_enabled.get() else self.bpm.get()
+                    base_beats, poly_beats = params['polyrhythm_ratio']
+                    bpm = current_dynamic_bpm if params['dynamic_bpm_enabled'] else params['bpm']
                     poly_interval = (60.0 / bpm) * (base_beats / poly_beats)
                     next_poly_time += poly_interval
 
             # Increment to next beat BEFORE UI update
-            self.current_beat = (self.current_beat + 1) % self.time_sig_numerator.get()
+            self.current_beat = (self.current_beat + 1) % params['time_sig_numerator']
             total_beats += 1
 
             # Update UI with the beat we just played (thread-safe via after_idle)
             self.root.after_idle(lambda beat=current_beat_for_ui: self._update_beat_indicator(beat))
 
             # Get current parameters for next beat
-            bpm = self.bpm.get()
+            bpm = params['bpm']
 
             # Apply dynamic BPM if enabled
-            if self.dynamic_bpm_enabled.get():
-                import random
+            if params['dynamic_bpm_enabled']:
                 # Check if it's time to change BPM based on interval
-                interval = self.dynamic_bpm_interval.get()
+                interval = params['dynamic_bpm_interval']
                 if total_beats % interval == 0:
                     # Pick new random BPM in range
-                    min_bpm = self.dynamic_bpm_min.get()
-                    max_bpm = self.dynamic_bpm_max.get()
-                    current_dynamic_bpm = random.randint(min_bpm, max_bpm)
+                    min_bpm = params['dynamic_bpm_min']
+                    max_bpm = params['dynamic_bpm_max']
+                    current_dynamic_bpm = self._rng.randint(min_bpm, max_bpm)
                 bpm = current_dynamic_bpm
 
             # Calculate beat interval
             beat_interval = 60.0 / bpm
 
             # Apply swing if enabled (check NEXT beat)
-            if self.swing_enabled.get() and self.current_beat % 2 == 1:
-                swing_ratio = self.swing_ratio.get() / 100.0
+            if params['swing_enabled'] and self.current_beat % 2 == 1:
+                swing_ratio = params['swing_ratio'] / 100.0
                 beat_interval *= (2 - swing_ratio)
 
             # Calculate when next beat should happen
             next_beat_time += beat_interval
 
             # Initialize polyrhythm timing on first beat
-            if total_beats == 1 and self.polyrhythm_enabled.get():
-                ratio_parts = self.polyrhythm_ratio.get().split(':')
-                poly_beats = int(ratio_parts[1])
-                base_beats = int(ratio_parts[0])
+            if total_beats == 1 and params['polyrhythm_enabled']:
+                base_beats, poly_beats = params['polyrhythm_ratio']
                 poly_interval = (60.0 / bpm) * (base_beats / poly_beats)
                 next_poly_time = next_beat_time + poly_interval
 
@@ -6,18 +6,17 @@ import threading
 import time
 import math
 import io
-from typing import Optional
+from collections import OrderedDict
+from typing import Any, Dict, Optional
 import pygame
 import numpy as np
-import sys
-from pathlib import Path
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.manager import BPMManager
 from src.detection.now_playing import NowPlayingDetector
 from src.media.album_cover import AlbumCoverManager
+from src.metronome.timing import (
+    begin_timer_resolution, end_timer_resolution, raise_thread_priority, sleep_until
+)
 from config.settings import (
     MONGODB_URI, GETSONGBPM_API_KEY,
     SPOTIFY_CLIENT_ID, SPOTIFY_CLIENT_SECRET, ENABLE_ALBUM_COVERS
@@ -30,6 +29,17 @@ try:
 except ImportError:
     PIL_AVAILABLE = False
 
+# Click sounds are 0.1s at the mixer rate. The time base and the linear
+# decay envelope don't depend on pitch or volume, so they are built once
+# and only the sine is computed per regeneration.
+CLICK_SAMPLE_RATE = 44100
+CLICK_DURATION = 0.1
+_CLICK_T = np.arange(int(CLICK_SAMPLE_RATE * CLICK_DURATION)) / CLICK_SAMPLE_RATE
+_CLICK_PHASE = 2 * np.pi * _CLICK_T  # Phase per Hz of pitch
+_CLICK_ENVELOPE = 1.0 - _CLICK_T / CLICK_DURATION
+# (pitch, volume) settings whose click sounds are kept for reuse
+CLICK_CACHE_SIZE = 32
+
 
 class MetroMatchApp:
     """Main MetroMatch application with hamburger menu navigation."""
@@ -96,6 +106,12 @@ class MetroMatchApp:
         # Initialize pygame mixer for audio
         pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=256)
 
+        # Dedicated (reserved) channels for the clicks, so a beat never waits
+        # on the mixer's search for a free channel
+        pygame.mixer.set_reserved(2)
+        self._accent_channel = pygame.mixer.Channel(0)
+        self._normal_channel = pygame.mixer.Channel(1)
+
         # Current view
         self.current_view = None
         self.menu_visible = False
@@ -115,6 +131,12 @@ class MetroMatchApp:
         self.is_playing = False
         self.metronome_thread = None
         self.current_beat = 0
+        self._regen_job = None  # Pending debounced click sound regeneration
+        # Plain-Python copies of the settings the metronome thread reads on
+        # every beat (see _watch_param)
+        self._params: Dict[str, Any] = {}
+        # (pitch, volume) -> (accent, normal) sounds, least recently used first
+        self._click_sounds = OrderedDict()
 
         # Build UI
         self._configure_styles()
@@ -355,6 +377,10 @@ class MetroMatchApp:
         self.time_sig_num.trace_add('write', update_sig)
         self.time_sig_den.trace_add('write', update_sig)
 
+        # The metronome thread reads these every beat
+        self._watch_param('bpm', self.bpm_var)
+        self._watch_param('time_sig_num', self.time_sig_num)
+
         # Play/Pause controls - centered
         play_frame = tk.Frame(container, bg=self.colors['bg'])
         play_frame.pack(pady=5)
@@ -440,8 +466,24 @@ class MetroMatchApp:
         self._generate_click_sounds()
 
         # Update sounds when parameters change
-        self.pitch_var.trace_add('write', lambda *_: self._generate_click_sounds())
-        self.volume_var.trace_add('write', lambda *_: self._generate_click_sounds())
+        self.pitch_var.trace_add('write', self._schedule_click_sounds)
+        self.volume_var.trace_add('write', self._schedule_click_sounds)
+
+    def _watch_param(self, name: str, variable: tk.Variable):
+        """Mirror a Tk variable into self._params[name] on every write.
+
+        Reading a Tk variable is a Tcl round trip that contends with the GUI
+        thread, so the metronome thread reads the mirrored value instead.
+        """
+        def update(*_):
+            try:
+                self._params[name] = variable.get()
+            except tk.TclError:
+                # Mid-edit value (e.g. an emptied spinbox); keep the last one
+                pass
+
+        update()
+        variable.trace_add('write', update)
 
     def _draw_bpm_dial(self):
         """Draw the circular BPM dial."""
@@ -552,36 +594,53 @@ class MetroMatchApp:
             value_label.config(text=str(variable.get()))
         variable.trace_add('write', update)
 
+    def _schedule_click_sounds(self, *_):
+        """Regenerate click sounds once a pitch/volume slider stops moving.
+
+        Dragging a slider writes its variable many times a second; each
+        write restarts a short timer so only the final value is rendered.
+        """
+        if self._regen_job is not None:
+            self.root.after_cancel(self._regen_job)
+        self._regen_job = self.root.after(50, self._generate_click_sounds)
+
     def _generate_click_sounds(self):
         """Generate metronome click sounds."""
+        self._regen_job = None
         if not hasattr(self, 'pitch_var'):
             return
 
-        sample_rate = 44100
-        duration = 0.1
-        samples = int(sample_rate * duration)
-
         base_pitch = self.pitch_var.get()
-        base_volume = self.volume_var.get() / 100.0
+        volume_percent = self.volume_var.get()
+        base_volume = volume_percent / 100.0
+
+        # Settings used before reuse their sounds
+        key = (base_pitch, volume_percent)
+        cached = self._click_sounds.get(key)
+        if cached is not None:
+            self._click_sounds.move_to_end(key)
+            self.accent_sound, self.normal_sound = cached
+            return
 
         def create_click(pitch_mult, vol_mult):
             freq = base_pitch * pitch_mult
             vol = min(base_volume * vol_mult, 1.0)
 
-            buf = []
-            for i in range(samples):
-                t = i / sample_rate
-                envelope = 1.0 - (t / duration)
-                value = vol * envelope * math.sin(2 * math.pi * freq * t)
-                sample = int(np.clip(value * 32767, -32768, 32767))
-                buf.append(sample)
+            # Whole-buffer NumPy ops; int16 conversion truncates like int()
+            value = vol * _CLICK_ENVELOPE * np.sin(freq * _CLICK_PHASE)
+            wave = np.clip(value * 32767, -32768, 32767).astype(np.int16)
 
-            stereo_buf = np.array([[s, s] for s in buf], dtype=np.int16)
+            # Same samples on both channels; make_sound needs a C-contiguous array
+            stereo_buf = np.repeat(wave[:, np.newaxis], 2, axis=1)
             return pygame.sndarray.make_sound(stereo_buf)
 
         self.accent_sound = create_click(1.2, 1.3)
         self.normal_sound = create_click(1.0, 1.0)
 
+        self._click_sounds[key] = (self.accent_sound, self.normal_sound)
+        if len(self._click_sounds) > CLICK_CACHE_SIZE:
+            self._click_sounds.popitem(last=False)
+
     def _toggle_metronome(self):
         """Start or stop the metronome."""
         if self.is_playing:
@@ -596,30 +655,38 @@ class MetroMatchApp:
             self.metronome_thread.start()
 
     def _metronome_loop(self):
+        """Run the beat loop on a high-priority thread with a fine OS timer."""
+        raise_thread_priority()
+        begin_timer_resolution()
+        try:
+            self._beat_loop()
+        finally:
+            end_timer_resolution()
+
+    def _beat_loop(self):
         """Main metronome timing loop."""
         next_beat = time.perf_counter()
+        params = self._params
 
         while self.is_playing:
-            sleep_time = next_beat - time.perf_counter()
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+            sleep_until(next_beat)
 
             current = self.current_beat
 
             # Play sound
             if current == 0 and hasattr(self, 'accent_sound'):
-                self.accent_sound.play()
+                self._accent_channel.play(self.accent_sound)
             elif hasattr(self, 'normal_sound'):
-                self.normal_sound.play()
+                self._normal_channel.play(self.normal_sound)
 
             # Update beat
-            self.current_beat = (self.current_beat + 1) % self.time_sig_num.get()
+            self.current_beat = (self.current_beat + 1) % params['time_sig_num']
 
             # Update UI
             self.root.after_idle(lambda b=current: self._update_beat_display(b))
 
             # Calculate next beat
-            bpm = self.bpm_var.get()
+            bpm = params['bpm']
             next_beat += 60.0 / bpm
 
     def _update_beat_display(self, beat):
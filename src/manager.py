@@ -1,8 +1,10 @@
 """Main BPM Manager that coordinates all components."""
 
-from typing import Optional, Dict, Any
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Optional, Dict, Any, List, Tuple
 import logging
 import re
+import threading
 
 from .cache.mongodb_cache import MongoDBCache
 from .api.getsongbpm import GetSongBPMClient
@@ -45,6 +47,12 @@ def clean_title(title: str) -> str:
 class BPMManager:
     """Main manager that coordinates BPM detection and metronome playback."""
 
+    # Seconds to wait on the API before also starting the scraper
+    HEDGE_DELAY = 1.5
+    # Hedged lookups run on one pool: an API request and a scraper run per
+    # lookup, plus room for the loser of the previous race to wind down
+    REMOTE_WORKERS = 4
+
     def __init__(
         self,
         mongodb_uri: Optional[str] = None,
@@ -68,6 +76,13 @@ class BPMManager:
         self.now_playing = NowPlayingDetector()
         self.metronome = MetronomePlayer()
 
+        # Only needed when the API and scraper are raced (_race_remote)
+        self._remote_executor = None
+        if self.api_client and self.scraper:
+            self._remote_executor = ThreadPoolExecutor(
+                max_workers=self.REMOTE_WORKERS, thread_name_prefix="bpm-remote"
+            )
+
         self.auto_sync = auto_sync
         self.current_track: Optional[Dict[str, Any]] = None
         self.current_bpm: Optional[float] = None
@@ -107,41 +122,167 @@ class BPMManager:
             except Exception as e:
                 logger.warning(f"Cache lookup failed: {e}")
 
-        # Try API with cleaned title
-        if self.api_client:
-            api_result = self.api_client.search(artist, cleaned_title)
-            if api_result and api_result.get('bpm'):
-                bpm = api_result['bpm']
-                logger.info(f"BPM found via API: {bpm}")
+        return self._lookup_remote(artist, title, cleaned_title)
+
+    def get_bpm_many(self, pairs: List[Tuple[str, str]]) -> List[Optional[float]]:
+        """
+        Get BPM for several songs, prefetching all cache hits in one query.
 
-                # Cache the result with original title
-                if self.cache:
-                    self.cache.set(artist, title, bpm, api_result)
+        Only songs missing from the cache go on to the API and scraper.
 
-                return bpm
+        Args:
+            pairs: (artist, title) tuples
 
-        # Try scraper as fallback
-        if self.scraper:
-            print(f"[BPM Lookup] Trying scraper for: {artist} - {title}")
-            scrape_result = self.scraper.search(artist, title)
-            if scrape_result and scrape_result.get('bpm'):
-                bpm = scrape_result['bpm']
-                logger.info(f"BPM found via scraper: {bpm}")
-                print(f"[BPM Lookup] Found BPM: {bpm}")
-
-                # Cache the result with original title
-                if self.cache:
-                    try:
-                        self.cache.set(artist, title, bpm, scrape_result)
-                    except Exception as e:
-                        logger.warning(f"Cache store failed: {e}")
-
-                return bpm
+        Returns:
+            BPM values (or None) in the same order as pairs
+        """
+        cleaned = [clean_title(title) for _, title in pairs]
+
+        hits = {}
+        if self.cache:
+            try:
+                hits = self.cache.get_many(
+                    list(pairs) + [(artist, c) for (artist, _), c in zip(pairs, cleaned)]
+                )
+            except Exception as e:
+                logger.warning(f"Cache batch lookup failed: {e}")
+
+        results = []
+        to_cache = []
+        for (artist, title), cleaned_title in zip(pairs, cleaned):
+            cached = (hits.get((artist.lower(), title.lower()))
+                      or hits.get((artist.lower(), cleaned_title.lower())))
+            if cached:
+                logger.info(f"BPM found in cache: {cached['bpm']}")
+                results.append(cached['bpm'])
+                continue
+
+            remote = self._fetch_remote(artist, title, cleaned_title)
+            if remote:
+                to_cache.append((artist, title, remote['bpm'], remote))
+                results.append(remote['bpm'])
             else:
-                print(f"[BPM Lookup] Scraper returned no results")
+                results.append(None)
+
+        # Store every newly fetched BPM in one bulk write
+        if self.cache and to_cache:
+            self.cache.set_many(to_cache)
+
+        return results
+
+    def _lookup_remote(self, artist: str, title: str, cleaned_title: str) -> Optional[float]:
+        """
+        Look up BPM via the API, then the scraper, caching any result.
+
+        Args:
+            artist: Artist name
+            title: Original song title (used as the cache key)
+            cleaned_title: Title with featured artists etc. removed
+
+        Returns:
+            BPM value or None if not found
+        """
+        result = self._fetch_remote(artist, title, cleaned_title)
+        if not result:
+            return None
+
+        # Cache the result with original title
+        if self.cache:
+            try:
+                self.cache.set(artist, title, result['bpm'], result)
+            except Exception as e:
+                logger.warning(f"Cache store failed: {e}")
+
+        return result['bpm']
+
+    def _fetch_remote(self, artist: str, title: str, cleaned_title: str) -> Optional[Dict[str, Any]]:
+        """
+        Query the API, then the scraper, without touching the cache.
+
+        When both are configured the lookups are hedged: the API request
+        starts first, and if it has not answered within HEDGE_DELAY seconds
+        (or comes back empty) the scraper is started alongside it. The first
+        result with a BPM wins.
+
+        Args:
+            artist: Artist name
+            title: Original song title (passed to the scraper)
+            cleaned_title: Title with featured artists etc. removed
 
-        logger.warning(f"Could not find BPM for {artist} - {title}")
-        print(f"[BPM Lookup] Could not find BPM for {artist} - {title}")
+        Returns:
+            Result dict with a 'bpm' key, or None if not found
+        """
+        if self.api_client and self.scraper:
+            result = self._race_remote(artist, title, cleaned_title)
+        elif self.api_client:
+            result = self._search_api(artist, cleaned_title)
+        elif self.scraper:
+            result = self._search_scraper(artist, title)
+        else:
+            result = None
+
+        if not result:
+            logger.warning(f"Could not find BPM for {artist} - {title}")
+            print(f"[BPM Lookup] Could not find BPM for {artist} - {title}")
+        return result
+
+    def _race_remote(self, artist: str, title: str, cleaned_title: str) -> Optional[Dict[str, Any]]:
+        """Run the API lookup, hedged by the scraper; return the first hit."""
+        executor = self._remote_executor
+        cancel = threading.Event()
+        pending = set()
+        try:
+            pending.add(executor.submit(self._search_api, artist, cleaned_title))
+            scraper_started = False
+
+            while pending:
+                done, pending = wait(
+                    pending,
+                    timeout=None if scraper_started else self.HEDGE_DELAY,
+                    return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    result = future.result()
+                    if result:
+                        return result
+
+                if not scraper_started:
+                    pending.add(executor.submit(self._search_scraper, artist, title, cancel))
+                    scraper_started = True
+
+            return None
+        finally:
+            # Don't wait for the slower lookup. A scraper run stops before
+            # its next stage; an API request can't be interrupted and just
+            # finishes unused on the pool.
+            cancel.set()
+            for future in pending:
+                future.cancel()
+
+    def _search_api(self, artist: str, cleaned_title: str) -> Optional[Dict[str, Any]]:
+        """Look up BPM via the GetSongBPM API."""
+        api_result = self.api_client.search(artist, cleaned_title)
+        if api_result and api_result.get('bpm'):
+            logger.info(f"BPM found via API: {api_result['bpm']}")
+            return api_result
+        return None
+
+    def _search_scraper(
+        self,
+        artist: str,
+        title: str,
+        cancel: Optional[threading.Event] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Look up BPM by scraping SongBPM.com, giving up once cancel is set."""
+        print(f"[BPM Lookup] Trying scraper for: {artist} - {title}")
+        scrape_result = self.scraper.search(artist, title, cancel=cancel)
+        if scrape_result and scrape_result.get('bpm'):
+            bpm = scrape_result['bpm']
+            logger.info(f"BPM found via scraper: {bpm}")
+            print(f"[BPM Lookup] Found BPM: {bpm}")
+            return scrape_result
+
+        print(f"[BPM Lookup] Scraper returned no results")
         return None
 
     def sync_to_now_playing(self) -> bool:
@@ -248,4 +389,11 @@ class BPMManager:
         if self.cache:
             self.cache.close()
 
+        if self._remote_executor:
+            # Lookups abandoned by _race_remote are already cancelled
+            self._remote_executor.shutdown(wait=False, cancel_futures=True)
+
+        if self.scraper:
+            self.scraper.close()
+
         logger.info("BPM Manager cleaned up")
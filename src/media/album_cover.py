@@ -354,15 +354,16 @@ class AlbumCoverCache:
             True if cached successfully, False otherwise
         """
         try:
+            artist_lc, title_lc = artist.lower(), title.lower()
             self.collection.update_one(
                 {
-                    "artist": artist.lower(),
-                    "title": title.lower()
+                    "artist": artist_lc,
+                    "title": title_lc
                 },
                 {
                     "$set": {
-                        "artist": artist.lower(),
-                        "title": title.lower(),
+                        "artist": artist_lc,
+                        "title": title_lc,
                         "image_data": image_data,
                         "image_url": image_url,
                         "source": source,
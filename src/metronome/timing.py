@@ -0,0 +1,98 @@
+"""High-resolution timing helpers for the metronome loops."""
+
+import os
+import platform
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+_IS_WINDOWS = platform.system() == "Windows"
+_IS_LINUX = platform.system() == "Linux"
+
+# Linux prctl option setting the calling thread's timer slack, in ns
+_PR_SET_TIMERSLACK = 29
+# Windows THREAD_PRIORITY_TIME_CRITICAL
+_THREAD_PRIORITY_TIME_CRITICAL = 15
+# SCHED_FIFO priority for the metronome thread: above normal threads, well
+# below the kernel's own real-time threads
+_FIFO_PRIORITY = 10
+
+# time.sleep wakes up late by the OS timer slack (tens of microseconds on
+# Linux, up to a timer tick on Windows), so the last stretch before a
+# deadline is busy-waited on perf_counter instead
+SPIN_THRESHOLD = 0.002
+
+
+def sleep_until(deadline: float):
+    """
+    Block until time.perf_counter() reaches deadline.
+
+    Sleeps until about half of SPIN_THRESHOLD is left, then spins. Returns
+    at once if the deadline has already passed.
+
+    Args:
+        deadline: Target time on the perf_counter clock
+    """
+    remaining = deadline - time.perf_counter()
+    if remaining > SPIN_THRESHOLD:
+        time.sleep(remaining - SPIN_THRESHOLD / 2)
+    while time.perf_counter() < deadline:
+        pass
+
+
+def begin_timer_resolution():
+    """Raise the Windows system timer resolution to 1 ms (no-op elsewhere).
+
+    Every call must be matched by end_timer_resolution().
+    """
+    if not _IS_WINDOWS:
+        return
+    try:
+        import ctypes
+        ctypes.windll.winmm.timeBeginPeriod(1)
+    except (AttributeError, OSError) as e:
+        logger.debug(f"Could not raise timer resolution: {e}")
+
+
+def end_timer_resolution():
+    """Undo begin_timer_resolution()."""
+    if not _IS_WINDOWS:
+        return
+    try:
+        import ctypes
+        ctypes.windll.winmm.timeEndPeriod(1)
+    except (AttributeError, OSError) as e:
+        logger.debug(f"Could not restore timer resolution: {e}")
+
+
+def raise_thread_priority():
+    """
+    Make the calling thread's wake-ups as prompt as the OS allows.
+
+    On Linux the thread is moved to SCHED_FIFO (needs CAP_SYS_NICE or an
+    rtprio limit; skipped otherwise) and its timer slack is cut from 50us
+    to 1ns. On Windows it gets THREAD_PRIORITY_TIME_CRITICAL. Failures
+    are logged and ignored: the metronome still runs, just with normal
+    scheduling.
+    """
+    if _IS_LINUX:
+        try:
+            # pid 0 is the calling thread
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(_FIFO_PRIORITY))
+        except (AttributeError, OSError) as e:
+            logger.debug(f"Could not switch metronome thread to SCHED_FIFO: {e}")
+        try:
+            import ctypes
+            libc = ctypes.CDLL(None, use_errno=True)
+            if libc.prctl(_PR_SET_TIMERSLACK, 1, 0, 0, 0) != 0:
+                logger.debug(f"Could not set timer slack: errno {ctypes.get_errno()}")
+        except (AttributeError, OSError) as e:
+            logger.debug(f"Could not set timer slack: {e}")
+    elif _IS_WINDOWS:
+        try:
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(), _THREAD_PRIORITY_TIME_CRITICAL)
+        except (AttributeError, OSError) as e:
+            logger.debug(f"Could not raise metronome thread priority: {e}")
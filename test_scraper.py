@@ -1,14 +1,10 @@
 #!/usr/bin/env python3
 """Quick test for the scraper."""
 
-import sys
-from pathlib import Path
 import logging
 
 logging.basicConfig(level=logging.DEBUG, format='%(levelname)s: %(message)s')
 
-sys.path.insert(0, str(Path(__file__).parent))
-
 from src.api.scraper import SongBPMScraper
 
 def main():
@@ -2,8 +2,16 @@
 
 import unittest
 from unittest.mock import Mock, patch
+import json
 import requests
+from urllib3.util.retry import RequestHistory
 from src.api.getsongbpm import GetSongBPMClient
+from src.api.session import RETRY
+
+
+def _json_bytes(data):
+    """Encode data the way the API sends it (response.content)."""
+    return json.dumps(data).encode()
 
 
 class TestGetSongBPMClient(unittest.TestCase):
@@ -18,13 +26,13 @@ class TestGetSongBPMClient(unittest.TestCase):
     def test_search_success(self, mock_get):
         """Test successful API search."""
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = _json_bytes({
             "search": [{
                 "tempo": "120.0",
                 "artist": {"name": "Test Artist"},
                 "song_title": "Test Song"
             }]
-        }
+        })
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
 
@@ -35,12 +43,54 @@ class TestGetSongBPMClient(unittest.TestCase):
         self.assertEqual(result["bpm"], 120.0)
         self.assertEqual(result["artist"], "Test Artist")
         self.assertEqual(result["source"], "getsongbpm")
+        self.assertNotIn("raw_data", result)
+
+    @patch.object(GetSongBPMClient, 'get_by_id')
+    @patch('src.api.getsongbpm.requests.Session.get')
+    def test_search_without_tempo_fetches_song(self, mock_get, mock_get_by_id):
+        """Test search falls back to get_by_id when results lack a tempo."""
+        mock_response = Mock()
+        mock_response.content = _json_bytes({"search": [{"id": "abc123"}]})
+        mock_response.raise_for_status = Mock()
+        mock_get.return_value = mock_response
+        mock_get_by_id.return_value = {"bpm": 99.0}
+
+        result = self.client.search("Test Artist", "Test Song")
+
+        mock_get_by_id.assert_called_once_with("abc123")
+        self.assertEqual(result, {"bpm": 99.0})
+
+    @patch('src.api.getsongbpm.requests.Session.get')
+    def test_search_uses_cache(self, mock_get):
+        """Test a cache hit skips the API and a miss populates the cache."""
+        cache = Mock()
+        cache.get.return_value = {"bpm": 110.0}
+        client = GetSongBPMClient(self.api_key, cache=cache)
+
+        result = client.search("Test Artist", "Test Song")
+
+        self.assertEqual(result["bpm"], 110.0)
+        self.assertEqual(result["source"], "cache")
+        mock_get.assert_not_called()
+
+        cache.get.return_value = None
+        mock_response = Mock()
+        mock_response.content = _json_bytes({
+            "search": [{"tempo": "120.0", "artist": {"name": "Test Artist"}, "song_title": "Test Song"}]
+        })
+        mock_response.raise_for_status = Mock()
+        mock_get.return_value = mock_response
+
+        result = client.search("Test Artist", "Test Song")
+
+        self.assertEqual(result["bpm"], 120.0)
+        cache.set.assert_called_once_with("Test Artist", "Test Song", 120.0, result)
 
     @patch('src.api.getsongbpm.requests.Session.get')
     def test_search_no_results(self, mock_get):
         """Test API search with no results."""
         mock_response = Mock()
-        mock_response.json.return_value = {"search": []}
+        mock_response.content = _json_bytes({"search": []})
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
 
@@ -61,13 +111,13 @@ class TestGetSongBPMClient(unittest.TestCase):
     def test_get_by_id(self, mock_get):
         """Test getting song by ID."""
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = _json_bytes({
             "song": {
                 "tempo": "128.0",
                 "artist": {"name": "Test Artist"},
                 "song_title": "Test Song"
             }
-        }
+        })
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
         result = self.client.get_by_id("test_id")
@@ -77,6 +127,29 @@ class TestGetSongBPMClient(unittest.TestCase):
         self.assertEqual(result["bpm"], 128.0)
         self.assertEqual(result["bpm"], 128.0)
 
+    @patch.object(GetSongBPMClient, 'search')
+    def test_search_many_preserves_order(self, mock_search):
+        """Test concurrent search returns results in input order."""
+        mock_search.side_effect = lambda artist, title: (
+            {"bpm": 100.0} if artist == "A" else None
+        )
+
+        results = self.client.search_many([("A", "Song"), ("B", "Song"), ("A", "Other")])
+
+        self.assertEqual(results, [{"bpm": 100.0}, None, {"bpm": 100.0}])
+        self.assertEqual(mock_search.call_count, 3)
+        self.assertEqual(self.client.search_many([]), [])
+
+    def test_retry_waits_are_capped(self):
+        """Test long Retry-After hints and backoff don't stall a lookup."""
+        response = Mock()
+        response.headers = {"Retry-After": "120"}
+        self.assertEqual(RETRY.get_retry_after(response), RETRY.MAX_WAIT)
+
+        failures = tuple(RequestHistory("GET", "/", None, 503, None) for _ in range(10))
+        exhausted = RETRY.new(history=failures)
+        self.assertEqual(exhausted.get_backoff_time(), RETRY.MAX_WAIT)
+
 
 if __name__ == '__main__':
     unittest.main()
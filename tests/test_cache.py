@@ -2,6 +2,8 @@
 
 import unittest
 from unittest.mock import Mock, patch, MagicMock
+from pymongo.errors import ServerSelectionTimeoutError
+from src.cache import mongodb_cache
 from src.cache.mongodb_cache import MongoDBCache
 
 
@@ -24,8 +26,18 @@ class TestMongoDBCache(unittest.TestCase):
 
         cache = MongoDBCache("mongodb://localhost:27017")
 
-        mock_mongo_client.assert_called_once_with("mongodb://localhost:27017")
-        self.mock_collection.create_index.assert_called()
+        mock_mongo_client.assert_called_once_with(
+            "mongodb://localhost:27017",
+            serverSelectionTimeoutMS=2000,
+            connectTimeoutMS=2000,
+            maxPoolSize=2,
+            minPoolSize=0,
+            heartbeatFrequencyMS=30000,
+            appname="MetroMatch"
+        )
+        self.mock_collection.create_indexes.assert_called_once_with(
+            list(mongodb_cache.BPM_CACHE_INDEXES)
+        )
 
     @patch('src.cache.mongodb_cache.MongoClient')
     def test_get_hit(self, mock_mongo_client):
@@ -44,6 +56,20 @@ class TestMongoDBCache(unittest.TestCase):
         assert result is not None  # Type narrowing for type checker
         self.assertEqual(result["bpm"], 120.0)
 
+    @patch('src.cache.mongodb_cache.MongoClient')
+    def test_get_reads_only_bpm(self, mock_mongo_client):
+        """Test get() projects away metadata and get_full() keeps it."""
+        mock_mongo_client.return_value = self.mock_client
+
+        cache = MongoDBCache("mongodb://localhost:27017")
+        cache.get("Test Artist", "Test Song")
+        cache.get_full("Test Artist", "Test Song")
+
+        get_projection = self.mock_collection.find_one.call_args_list[0][0][1]
+        full_projection = self.mock_collection.find_one.call_args_list[1][0][1]
+        self.assertEqual(get_projection, {"_id": 0, "bpm": 1, "last_updated": 1})
+        self.assertNotIn("metadata", full_projection)
+
     @patch('src.cache.mongodb_cache.MongoClient')
     def test_get_miss(self, mock_mongo_client):
         """Test cache miss."""
@@ -55,6 +81,38 @@ class TestMongoDBCache(unittest.TestCase):
 
         self.assertIsNone(result)
 
+    @patch('src.cache.mongodb_cache.MongoClient')
+    def test_get_is_memoized_until_set(self, mock_mongo_client):
+        """Test repeat lookups skip MongoDB until the entry is rewritten."""
+        mock_mongo_client.return_value = self.mock_client
+        self.mock_collection.find_one.return_value = None
+
+        cache = MongoDBCache("mongodb://localhost:27017")
+        self.assertIsNone(cache.get("Test Artist", "Test Song"))
+        self.assertIsNone(cache.get("test artist", "TEST SONG"))
+        self.assertEqual(self.mock_collection.find_one.call_count, 1)
+
+        cache.set("Test Artist", "Test Song", 128.5)
+        self.mock_collection.find_one.return_value = {"bpm": 128.5}
+        self.assertEqual(cache.get("Test Artist", "Test Song")["bpm"], 128.5)
+        self.assertEqual(cache.get("Test Artist", "Test Song")["bpm"], 128.5)
+        self.assertEqual(self.mock_collection.find_one.call_count, 2)
+
+    @patch('src.cache.mongodb_cache.MongoClient')
+    def test_get_many(self, mock_mongo_client):
+        """Test batch lookup issues a single query."""
+        mock_mongo_client.return_value = self.mock_client
+        self.mock_collection.find.return_value = [
+            {"artist": "test artist", "title": "test song", "bpm": 120.0}
+        ]
+
+        cache = MongoDBCache("mongodb://localhost:27017")
+        result = cache.get_many([("Test Artist", "Test Song"), ("Other", "Song")])
+
+        self.mock_collection.find.assert_called_once()
+        self.assertEqual(result[("test artist", "test song")]["bpm"], 120.0)
+        self.assertNotIn(("other", "song"), result)
+
     @patch('src.cache.mongodb_cache.MongoClient')
     def test_set(self, mock_mongo_client):
         """Test setting cache value."""
@@ -65,6 +123,106 @@ class TestMongoDBCache(unittest.TestCase):
 
         self.mock_collection.update_one.assert_called_once()
 
+    @patch('src.cache.mongodb_cache.MongoClient')
+    def test_set_many(self, mock_mongo_client):
+        """Test batch storing uses a single unordered bulk write."""
+        mock_mongo_client.return_value = self.mock_client
+
+        cache = MongoDBCache("mongodb://localhost:27017")
+        cache.set_many([("Artist A", "Song A", 100.0, None), ("Artist B", "Song B", 120.0, {})])
+
+        self.mock_collection.bulk_write.assert_called_once()
+        operations = self.mock_collection.bulk_write.call_args[0][0]
+        self.assertEqual(len(operations), 2)
+        self.assertEqual(self.mock_collection.bulk_write.call_args[1], {"ordered": False})
+
+    @patch('src.cache.mongodb_cache.MongoClient')
+    def test_fast_insert_uses_unacknowledged_writes(self, mock_mongo_client):
+        """Test fast_insert sends writes with w=0 and leaves reads alone."""
+        mock_mongo_client.return_value = self.mock_client
+        fast_collection = self.mock_collection.with_options.return_value
+
+        cache = MongoDBCache("mongodb://localhost:27017", fast_insert=True)
+        cache.set("Test Artist", "Test Song", 128.5)
+        cache.get("Test Artist", "Test Song")
+
+        write_concern = self.mock_collection.with_options.call_args[1]["write_concern"]
+        self.assertEqual(write_concern.document, {"w": 0})
+        fast_collection.update_one.assert_called_once()
+        self.mock_collection.update_one.assert_not_called()
+        self.mock_collection.find_one.assert_called_once()
+
+    @patch('src.cache.mongodb_cache.MongoClient')
+    def test_buffered_set(self, mock_mongo_client):
+        """Test buffered writes are readable and go out in one bulk write."""
+        mock_mongo_client.return_value = self.mock_client
+
+        cache = MongoDBCache("mongodb://localhost:27017", buffer_size=3)
+        cache.set("Artist A", "Song A", 100.0)
+        cache.set("Artist A", "Song A", 101.0)
+        cache.set("Artist B", "Song B", 120.0)
+
+        self.mock_collection.update_one.assert_not_called()
+        self.mock_collection.bulk_write.assert_not_called()
+        self.assertEqual(cache.get("artist a", "song a")["bpm"], 101.0)
+        self.mock_collection.find_one.assert_not_called()
+
+        cache.close()
+
+        operations = self.mock_collection.bulk_write.call_args[0][0]
+        self.assertEqual(len(operations), 2)
+
+    @patch('src.cache.mongodb_cache.MongoClient')
+    def test_existing_indexes_are_not_recreated(self, mock_mongo_client):
+        """Test startup only creates the bpm_cache indexes that are missing."""
+        mock_mongo_client.return_value = self.mock_client
+        self.mock_collection.list_indexes.return_value = [
+            {"name": "_id_"}, {"name": "artist_1_title_1"}, {"name": "artist_title_ci"}
+        ]
+
+        MongoDBCache("mongodb://localhost:27017")
+
+        created = self.mock_collection.create_indexes.call_args[0][0]
+        self.assertEqual([index.document["name"] for index in created], ["artist_title_updated"])
+
+    @patch('src.cache.mongodb_cache.MongoClient')
+    def test_unreachable_server_is_skipped(self, mock_mongo_client):
+        """Test one server selection timeout spares later caches the wait."""
+        mock_mongo_client.return_value = self.mock_client
+        self.mock_collection.list_indexes.side_effect = ServerSelectionTimeoutError("down")
+        self.addCleanup(mongodb_cache._DEAD_SERVERS.clear)
+
+        MongoDBCache("mongodb://localhost:27017")
+        cache = MongoDBCache("mongodb://localhost:27017")
+        self.assertIsNone(cache.get("Test Artist", "Test Song"))
+        cache.set("Test Artist", "Test Song", 128.5)
+
+        self.assertEqual(self.mock_collection.list_indexes.call_count, 1)
+        self.mock_collection.find_one.assert_not_called()
+        self.mock_collection.update_one.assert_not_called()
+
+    @patch('src.cache.mongodb_cache.MongoClient')
+    def test_indexes_created_once_server_is_back(self, mock_mongo_client):
+        """Test a cache built during an outage creates its indexes later."""
+        mock_mongo_client.return_value = self.mock_client
+        self.mock_collection.list_indexes.side_effect = ServerSelectionTimeoutError("down")
+        self.mock_collection.find_one.return_value = None
+        self.addCleanup(mongodb_cache._DEAD_SERVERS.clear)
+
+        cache = MongoDBCache("mongodb://localhost:27017")
+        self.mock_collection.create_indexes.assert_not_called()
+
+        # The dead window has passed and the server answers again
+        mongodb_cache._DEAD_SERVERS.clear()
+        self.mock_collection.list_indexes.side_effect = None
+        self.mock_collection.list_indexes.return_value = []
+        cache.get("Test Artist", "Test Song")
+        cache.get("Other Artist", "Other Song")
+
+        self.mock_collection.create_indexes.assert_called_once()
+        self.assertEqual(self.mock_collection.list_indexes.call_count, 2)
+        self.assertEqual(self.mock_collection.find_one.call_count, 2)
+
     @patch('src.cache.mongodb_cache.MongoClient')
     def test_clear(self, mock_mongo_client):
         """Test clearing cache."""
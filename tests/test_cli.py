@@ -0,0 +1,47 @@
+"""Tests for the command-line interface."""
+
+import dataclasses
+import io
+import unittest
+from unittest.mock import patch
+from config.settings import settings
+from src import cli
+
+
+class TestStaticHelp(unittest.TestCase):
+    """Test cases for the argparse-free top-level help."""
+
+    def test_static_help_matches_parser(self):
+        """Test _STATIC_HELP is what the full parser would print."""
+        for prog in ('metromatch', '__main__.py'):
+            with patch('sys.argv', [prog]):
+                expected = cli._build_parser().format_help()
+            self.assertEqual(cli._STATIC_HELP.format(prog=prog), expected)
+
+    def test_help_uses_invoked_program_name(self):
+        """Test --help names the program it was run as."""
+        with patch('sys.argv', ['/usr/local/bin/metromatch', '--help']), \
+                patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            cli.main()
+
+        self.assertTrue(stdout.getvalue().startswith('usage: metromatch [-h]'))
+
+
+class TestMetronomeParser(unittest.TestCase):
+    """Test cases for the `metronome` subcommand."""
+
+    def test_bpm_defaults_to_setting(self):
+        """Test the configured DEFAULT_BPM is the default and shown in help."""
+        configured = dataclasses.replace(settings, DEFAULT_BPM=96)
+        with patch('config.settings.settings', configured):
+            parser = cli._build_parser('metronome')
+
+        self.assertEqual(parser.parse_args(['metronome']).bpm, 96)
+        with patch('sys.stdout', new_callable=io.StringIO) as stdout, \
+                self.assertRaises(SystemExit):
+            parser.parse_args(['metronome', '--help'])
+        self.assertIn('BPM (default: 96)', stdout.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
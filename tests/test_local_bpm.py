@@ -0,0 +1,243 @@
+"""Tests for local BPM detection."""
+
+import importlib.util
+import json
+import sys
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+# The audio stack is optional; everything but the end-to-end check runs
+# without it
+HAS_LIBROSA = importlib.util.find_spec('librosa') is not None
+with nullcontext() if HAS_LIBROSA else patch.dict(sys.modules, {'librosa': MagicMock(), 'soxr': MagicMock()}):
+    from src.detection import local_bpm
+    from src.detection.local_bpm import LocalBPMDetector, MANIFEST_NAME, N_FFT, HOP_LENGTH
+
+
+class TestStreamedOnsetEnvelope(unittest.TestCase):
+    """Test cases for the streamed mel spectrogram behind _onset_envelope."""
+
+    def _stream_mel(self, n_samples, block_size, sr=local_bpm.ANALYSIS_SR):
+        """
+        Stream 1, 2, ..., n_samples through _stream_mel.
+
+        The patched melspectrogram returns the sample at the centre of each
+        frame instead of a spectrum, so frame positions can be checked.
+        """
+        signal = np.arange(1, n_samples + 1, dtype=np.float32)
+        calls = []
+
+        def melspectrogram(y, sr, n_fft, hop_length, center):
+            calls.append((len(y), center))
+            return y[n_fft // 2:len(y) - n_fft // 2 + 1:hop_length][np.newaxis, :]
+
+        mock_librosa = MagicMock()
+        mock_librosa.get_samplerate.return_value = sr
+        mock_librosa.stream.return_value = (
+            signal[i:i + block_size] for i in range(0, n_samples, block_size)
+        )
+        mock_librosa.feature.melspectrogram.side_effect = melspectrogram
+        with patch.object(local_bpm, 'librosa', mock_librosa):
+            frames = LocalBPMDetector._stream_mel("song.wav")[0]
+        return frames, calls
+
+    def test_frames_are_centred_like_load_path(self):
+        """Test frame t is centred on sample t * HOP_LENGTH, zero-padded at the ends."""
+        for n_samples in (HOP_LENGTH * 300, HOP_LENGTH * 300 + 7, N_FFT, 100):
+            frames, calls = self._stream_mel(n_samples, block_size=HOP_LENGTH * 16)
+
+            # A centred STFT has 1 + n_samples // HOP_LENGTH frames
+            self.assertEqual(len(frames), 1 + n_samples // HOP_LENGTH, n_samples)
+            expected = np.arange(len(frames)) * HOP_LENGTH + 1
+            # A frame centred past the last sample sits on the end padding
+            expected[expected > n_samples] = 0
+            np.testing.assert_array_equal(frames, expected)
+            for length, center in calls:
+                self.assertFalse(center)
+                self.assertEqual((length - N_FFT) % HOP_LENGTH, 0)
+
+    def test_frames_carry_over_block_boundaries(self):
+        """Test block sizes that don't divide into frames give the same frames."""
+        whole, _ = self._stream_mel(HOP_LENGTH * 40 + 5, block_size=HOP_LENGTH * 64)
+        for block_size in (HOP_LENGTH, 700, N_FFT * 3 + 1):
+            frames, _ = self._stream_mel(HOP_LENGTH * 40 + 5, block_size=block_size)
+            np.testing.assert_array_equal(frames, whole)
+
+    def test_blocks_are_resampled_and_flushed(self):
+        """Test other rates go through one soxr stream that is flushed at the end."""
+        mock_soxr = MagicMock()
+        stream = mock_soxr.ResampleStream.return_value
+        stream.resample_chunk.side_effect = lambda block, last=False: (
+            np.zeros(HOP_LENGTH, dtype=np.float32) if last else block
+        )
+
+        with patch.object(local_bpm, 'soxr', mock_soxr):
+            frames, _ = self._stream_mel(HOP_LENGTH * 10, block_size=HOP_LENGTH * 4, sr=44100)
+
+        mock_soxr.ResampleStream.assert_called_once_with(
+            44100, local_bpm.ANALYSIS_SR, 1, dtype='float32', quality=local_bpm.STREAM_RESAMPLE_QUALITY
+        )
+        self.assertEqual(stream.resample_chunk.call_args_list[-1].kwargs, {"last": True})
+        # The flushed samples count as signal
+        self.assertEqual(len(frames), 1 + HOP_LENGTH * 11 // HOP_LENGTH)
+
+    @unittest.skipUnless(HAS_LIBROSA, "librosa not installed")
+    def test_streamed_envelope_matches_load_path(self):
+        """Test a streamed click track gives the envelope and BPM of _load()."""
+        import librosa
+        import soundfile
+
+        sr = 44100
+        track = np.zeros(sr * 20, dtype=np.float32)
+        click = librosa.clicks(times=[0], sr=sr, click_duration=0.05, length=sr // 20)
+        for start in np.arange(0.25, 19.9, 0.5):  # 120 BPM
+            i = int(start * sr)
+            track[i:i + len(click)] += click
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "clicks.wav")
+            soundfile.write(path, track, sr)
+            detector = LocalBPMDetector()
+
+            streamed, streamed_sr = detector._onset_envelope(path)
+            y, load_sr = detector._load(path)
+            loaded = librosa.onset.onset_strength(y=y, sr=load_sr)
+
+            streamed_bpm = detector.detect_bpm(path)["bpm"]
+            with patch.object(LocalBPMDetector, '_stream_mel', side_effect=RuntimeError("no stream")):
+                loaded_bpm = detector.detect_bpm(path)["bpm"]
+
+        self.assertEqual(streamed_sr, load_sr)
+        self.assertEqual(len(streamed), len(loaded))
+        np.testing.assert_allclose(streamed, loaded, atol=1e-3 * loaded.max())
+        self.assertAlmostEqual(streamed_bpm, loaded_bpm, delta=1.0)
+        self.assertAlmostEqual(streamed_bpm, 120.0, delta=5.0)
+
+
+@patch.object(local_bpm, 'ProcessPoolExecutor', ThreadPoolExecutor)
+class TestAnalyzeFolder(unittest.TestCase):
+    """Test cases for analyze_folder and its manifest."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.folder = Path(tmp.name)
+        for name in ("a.mp3", "b.wav", "c.flac"):
+            (self.folder / name).write_bytes(b"audio")
+        (self.folder / "notes.txt").write_text("not audio")
+        self.detector = LocalBPMDetector()
+
+    def _detect(self, file_path):
+        return {"bpm": 120.0, "file": file_path}
+
+    def test_unchanged_files_are_not_reanalyzed(self):
+        """Test a second run answers unchanged files from the manifest."""
+        with patch.object(LocalBPMDetector, 'detect_bpm', side_effect=self._detect) as mock_detect:
+            first = self.detector.analyze_folder(str(self.folder))
+            self.assertEqual(mock_detect.call_count, 3)
+            self.assertEqual(set(first), {"a.mp3", "b.wav", "c.flac"})
+
+            mock_detect.reset_mock()
+            second = self.detector.analyze_folder(str(self.folder))
+
+        mock_detect.assert_not_called()
+        self.assertEqual(second, first)
+
+    def test_changed_file_is_reanalyzed(self):
+        """Test only a file whose size or mtime changed is analyzed again."""
+        with patch.object(LocalBPMDetector, 'detect_bpm', side_effect=self._detect) as mock_detect:
+            self.detector.analyze_folder(str(self.folder))
+            (self.folder / "b.wav").write_bytes(b"longer audio")
+
+            mock_detect.reset_mock()
+            results = self.detector.analyze_folder(str(self.folder))
+
+        mock_detect.assert_called_once_with(str(self.folder / "b.wav"))
+        self.assertEqual(len(results), 3)
+
+    def test_failed_files_are_retried(self):
+        """Test files whose detection failed aren't recorded in the manifest."""
+        def detect(file_path):
+            return None if file_path.endswith(".wav") else self._detect(file_path)
+
+        with patch.object(LocalBPMDetector, 'detect_bpm', side_effect=detect) as mock_detect:
+            results = self.detector.analyze_folder(str(self.folder))
+            self.assertNotIn("b.wav", results)
+
+            mock_detect.reset_mock()
+            self.detector.analyze_folder(str(self.folder))
+
+        mock_detect.assert_called_once_with(str(self.folder / "b.wav"))
+        with open(self.folder / MANIFEST_NAME, encoding="utf-8") as f:
+            self.assertEqual(set(json.load(f)), {"a.mp3", "c.flac"})
+
+    def test_unreadable_manifest_is_ignored(self):
+        """Test a corrupt manifest means everything is analyzed again."""
+        (self.folder / MANIFEST_NAME).write_text("{not json")
+
+        with patch.object(LocalBPMDetector, 'detect_bpm', side_effect=self._detect) as mock_detect:
+            results = self.detector.analyze_folder(str(self.folder))
+
+        self.assertEqual(mock_detect.call_count, 3)
+        self.assertEqual(len(results), 3)
+        self.assertFalse((self.folder / (MANIFEST_NAME + ".tmp")).exists())
+
+    @patch.object(local_bpm, 'MANIFEST_SAVE_EVERY', 2)
+    def test_manifest_saved_as_results_arrive(self):
+        """Test the manifest is rewritten every MANIFEST_SAVE_EVERY results."""
+        saved = []
+        with patch.object(LocalBPMDetector, 'detect_bpm', side_effect=self._detect), \
+                patch.object(LocalBPMDetector, '_save_manifest',
+                             side_effect=lambda path, manifest: saved.append(len(manifest))):
+            self.detector.analyze_folder(str(self.folder))
+
+        self.assertEqual(saved, [2, 3])
+
+    @patch.object(local_bpm, 'MANIFEST_SAVE_EVERY', 1)
+    def test_interrupted_run_keeps_progress(self):
+        """Test results recorded before an interrupt survive it."""
+        two_saved = threading.Event()
+        save_manifest = LocalBPMDetector._save_manifest
+
+        def save(path, manifest):
+            save_manifest(path, manifest)
+            if len(manifest) == 2:
+                two_saved.set()
+
+        def detect(file_path):
+            if file_path.endswith(".flac"):
+                two_saved.wait(5)
+                raise KeyboardInterrupt
+            return self._detect(file_path)
+
+        with patch.object(LocalBPMDetector, 'detect_bpm', side_effect=detect), \
+                patch.object(LocalBPMDetector, '_save_manifest', side_effect=save), \
+                self.assertRaises(KeyboardInterrupt):
+            self.detector.analyze_folder(str(self.folder))
+
+        with open(self.folder / MANIFEST_NAME, encoding="utf-8") as f:
+            self.assertEqual(set(json.load(f)), {"a.mp3", "b.wav"})
+
+    def test_single_pending_file_skips_process_pool(self):
+        """Test one file to analyze doesn't start worker processes."""
+        for name in ("b.wav", "c.flac"):
+            (self.folder / name).unlink()
+
+        with patch.object(LocalBPMDetector, 'detect_bpm', side_effect=self._detect), \
+                patch.object(local_bpm, 'ProcessPoolExecutor') as mock_pool:
+            results = self.detector.analyze_folder(str(self.folder))
+
+        mock_pool.assert_not_called()
+        self.assertEqual(list(results), ["a.mp3"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -63,6 +63,53 @@ class TestBPMManager(unittest.TestCase):
         self.assertEqual(bpm, 140.0)
         self.manager.scraper.search.assert_called_once()
 
+    def test_get_bpm_hedges_slow_api_with_scraper(self):
+        """Test the scraper is started when the API is slow, and wins."""
+        import threading
+        release_api = threading.Event()
+        self.manager.HEDGE_DELAY = 0.01
+        self.manager.cache.get.return_value = None
+        self.manager.api_client.search.side_effect = lambda *args: release_api.wait(5) and None
+        self.manager.scraper.search.return_value = {"bpm": 140.0, "source": "scraper"}
+
+        try:
+            bpm = self.manager.get_bpm("Test Artist", "Test Song")
+        finally:
+            release_api.set()
+
+        self.assertEqual(bpm, 140.0)
+        self.manager.scraper.search.assert_called_once()
+
+    def test_get_bpm_cancels_losing_scraper(self):
+        """Test a late API hit cancels the scraper, reusing one executor."""
+        import threading
+        scraper_started = threading.Event()
+        release_api = threading.Event()
+        cancels = []
+
+        def slow_api(*args):
+            release_api.wait(5)
+            return {"bpm": 128.0, "source": "api"}
+
+        def scraper_search(artist, title, cancel=None):
+            cancels.append(cancel)
+            scraper_started.set()
+            cancel.wait(5)
+            return None
+
+        self.manager.HEDGE_DELAY = 0.01
+        self.manager.cache.get.return_value = None
+        self.manager.api_client.search.side_effect = slow_api
+        self.manager.scraper.search.side_effect = scraper_search
+        executor = self.manager._remote_executor
+
+        threading.Thread(target=lambda: scraper_started.wait(5) and release_api.set()).start()
+        bpm = self.manager.get_bpm("Test Artist", "Test Song")
+
+        self.assertEqual(bpm, 128.0)
+        self.assertTrue(cancels[0].is_set())
+        self.assertIs(self.manager._remote_executor, executor)
+
     def test_get_bpm_not_found(self):
         """Test when BPM cannot be found."""
         self.manager.cache.get.return_value = None
@@ -73,6 +120,24 @@ class TestBPMManager(unittest.TestCase):
 
         self.assertIsNone(bpm)
 
+    def test_get_bpm_many_prefetches_cache(self):
+        """Test batch lookup uses one cache query and only fetches misses."""
+        self.manager.cache.get_many.return_value = {
+            ("artist a", "song a"): {"bpm": 100.0}
+        }
+        self.manager.api_client.search.return_value = {"bpm": 128.0}
+
+        bpms = self.manager.get_bpm_many([("Artist A", "Song A"), ("Artist B", "Song B")])
+
+        self.assertEqual(bpms, [100.0, 128.0])
+        self.manager.cache.get_many.assert_called_once()
+        self.manager.cache.get.assert_not_called()
+        self.manager.api_client.search.assert_called_once_with("Artist B", "Song B")
+        self.manager.cache.set_many.assert_called_once_with(
+            [("Artist B", "Song B", 128.0, {"bpm": 128.0})]
+        )
+        self.manager.cache.set.assert_not_called()
+
     def test_sync_to_now_playing(self):
         """Test syncing to currently playing track."""
         self.manager.now_playing.get_current_track.return_value = {
@@ -0,0 +1,227 @@
+"""Tests for now playing detection."""
+
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+from src.detection import now_playing
+from src.detection.now_playing import NowPlayingDetector
+
+
+class TestNowPlayingDetector(unittest.TestCase):
+    """Test cases for platform dispatch and the polling memo."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.track = {"artist": "Test Artist", "title": "Test Song", "album": None, "player": "test"}
+        with patch('src.detection.now_playing.platform.system', return_value='Other'):
+            self.detector = NowPlayingDetector()
+        self.detector.has_media_support = True
+        self.detector._get_track = MagicMock(return_value=self.track)
+
+    def test_track_getter_chosen_at_init(self):
+        """Test each platform's getter is picked once, at construction."""
+        cases = [
+            ('Darwin', '_init_macos', '_get_macos_track'),
+            ('Windows', '_init_windows', '_get_windows_track'),
+            ('Linux', '_init_linux', '_get_linux_track'),
+        ]
+        for system, init, getter in cases:
+            with patch('src.detection.now_playing.platform.system', return_value=system), \
+                    patch.object(NowPlayingDetector, init) as mock_init:
+                detector = NowPlayingDetector()
+            mock_init.assert_called_once()
+            self.assertEqual(detector._get_track, getattr(detector, getter), system)
+
+    @patch('src.detection.now_playing.time.monotonic')
+    def test_track_reused_within_interval(self, mock_monotonic):
+        """Test polls less than _min_interval apart don't query the player."""
+        mock_monotonic.return_value = 100.0
+        self.assertEqual(self.detector.get_current_track(), self.track)
+
+        mock_monotonic.return_value = 100.9
+        self.assertEqual(self.detector.get_current_track(), self.track)
+        self.detector._get_track.assert_called_once()
+
+        mock_monotonic.return_value = 101.0
+        self.assertEqual(self.detector.get_current_track(), self.track)
+        self.assertEqual(self.detector._get_track.call_count, 2)
+
+    @patch('src.detection.now_playing.time.monotonic', return_value=100.0)
+    def test_reused_track_is_a_copy(self, mock_monotonic):
+        """Test callers can't change the remembered track."""
+        self.detector.get_current_track()["title"] = "Changed"
+
+        self.assertEqual(self.detector.get_current_track()["title"], "Test Song")
+
+    @patch('src.detection.now_playing.time.monotonic', return_value=100.0)
+    def test_miss_is_not_cached(self, mock_monotonic):
+        """Test nothing playing is asked again on the next poll."""
+        self.detector._get_track.side_effect = [None, self.track]
+
+        self.assertIsNone(self.detector.get_current_track())
+        self.assertEqual(self.detector.get_current_track(), self.track)
+        self.assertEqual(self.detector._get_track.call_count, 2)
+
+
+class TestWindowsDetection(unittest.TestCase):
+    """Test cases for WinRT session polling."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        async def result(value):
+            return value
+
+        self.info = MagicMock(artist="Test Artist", title="Test Song", album_title="Test Album")
+        self.session = MagicMock(source_app_user_model_id="Spotify.exe")
+        self.session.try_get_media_properties_async.side_effect = lambda: result(self.info)
+        session_mgr = MagicMock()
+        session_mgr.get_current_session.return_value = self.session
+
+        winrt = MagicMock()
+        self.manager = winrt.windows.media.control.GlobalSystemMediaTransportControlsSessionManager
+        self.manager.request_async.side_effect = lambda: result(session_mgr)
+        modules = {
+            'winrt': winrt,
+            'winrt.windows': winrt.windows,
+            'winrt.windows.media': winrt.windows.media,
+            'winrt.windows.media.control': winrt.windows.media.control,
+        }
+        patchers = [
+            patch.dict(sys.modules, modules),
+            patch('src.detection.now_playing.platform.system', return_value='Windows'),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_polls_reuse_loop_and_session_manager(self):
+        """Test polls await on the detector's loop and reuse its session manager."""
+        detector = NowPlayingDetector()
+        loop = detector._loop
+        self.addCleanup(loop.call_soon_threadsafe, loop.stop)
+
+        first = detector._get_windows_track()
+        second = detector._get_windows_track()
+
+        self.assertEqual(first, second)
+        self.assertEqual(first["player"], "Spotify.exe")
+        self.assertIs(detector._loop, loop)
+        self.assertTrue(loop.is_running())
+        self.manager.request_async.assert_called_once()
+        self.assertEqual(self.session.try_get_media_properties_async.call_count, 2)
+
+
+class TestTitleParsers(unittest.TestCase):
+    """Test cases for the window title parsers."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        with patch('src.detection.now_playing.platform.system', return_value='Other'):
+            self.detector = NowPlayingDetector()
+
+    def test_tidal_title(self):
+        """Test Tidal titles give the song and the first artist."""
+        track = self.detector._parse_tidal_title("Gang - Artist A, Artist B", "TIDAL")
+        self.assertEqual((track["artist"], track["title"]), ("Artist A", "Gang"))
+
+        track = self.detector._parse_tidal_title("Gang - Artist A - TIDAL", "TIDAL")
+        self.assertEqual((track["artist"], track["title"]), ("Artist A", "Gang"))
+
+    def test_tidal_browse_titles_are_not_tracks(self):
+        """Test idle/browse titles don't turn the app name into an artist."""
+        for title in ("TIDAL", "Home - TIDAL", "My Collection - TIDAL", "Home - Tidal"):
+            self.assertIsNone(self.detector._parse_tidal_title(title, "TIDAL"), title)
+
+    def test_generic_title(self):
+        """Test "Artist - Song - App" titles drop the app name."""
+        track = self.detector._parse_generic_title("Artist - Song - SoundCloud", "SoundCloud")
+        self.assertEqual((track["artist"], track["title"]), ("Artist", "Song"))
+
+        track = self.detector._parse_generic_title("Artist - Song - Remix", "SoundCloud")
+        self.assertEqual((track["artist"], track["title"]), ("Artist", "Song - Remix"))
+
+    def test_generic_browse_titles_are_not_tracks(self):
+        """Test idle/browse titles don't turn the app name into a song."""
+        for title in ("SoundCloud", "Stream - SoundCloud", "SoundCloud - Stream"):
+            self.assertIsNone(self.detector._parse_generic_title(title, "SoundCloud"), title)
+
+
+class TestLinuxDetection(unittest.TestCase):
+    """Test cases for MPRIS player tracking."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.dbus = MagicMock()
+        self.dbus.Interface.return_value.Get.return_value = {
+            'xesam:artist': ['Test Artist'],
+            'xesam:title': 'Test Song',
+        }
+        patchers = [
+            patch.dict(sys.modules, {'dbus': self.dbus}),
+            patch('src.detection.now_playing.platform.system', return_value='Linux'),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    @patch('src.detection.now_playing._mpris_signal_bus')
+    def test_name_owner_changed_tracks_players(self, mock_signal_bus):
+        """Test players are listed once, then tracked through signals."""
+        bus = mock_signal_bus.return_value
+        bus.list_names.return_value = [
+            'org.mpris.MediaPlayer2.spotify', 'org.freedesktop.Notifications'
+        ]
+
+        detector = NowPlayingDetector()
+        self.assertEqual(detector._mpris_players, {'org.mpris.MediaPlayer2.spotify'})
+
+        on_name_owner_changed = bus.add_signal_receiver.call_args[0][0]
+        on_name_owner_changed('org.mpris.MediaPlayer2.vlc', '', ':1.5')
+        on_name_owner_changed('org.mpris.MediaPlayer2.spotify', ':1.2', '')
+        on_name_owner_changed('org.example.Other', '', ':1.9')
+        self.assertEqual(detector._mpris_players, {'org.mpris.MediaPlayer2.vlc'})
+
+        track = detector._get_linux_track()
+
+        self.assertEqual(track["player"], "vlc")
+        self.assertEqual(track["title"], "Test Song")
+        bus.get_object.assert_called_once_with('org.mpris.MediaPlayer2.vlc', '/org/mpris/MediaPlayer2')
+        self.assertEqual(bus.list_names.call_count, 1)
+
+    @patch('src.detection.now_playing._mpris_signal_bus', side_effect=ImportError("no gi"))
+    def test_fallback_lists_players_each_poll(self, mock_signal_bus):
+        """Test polls list bus names when signals can't be received."""
+        bus = self.dbus.SessionBus.return_value
+        bus.list_names.return_value = ['org.mpris.MediaPlayer2.spotify']
+
+        detector = NowPlayingDetector()
+        self.assertIsNone(detector._mpris_players)
+
+        detector._get_linux_track()
+        track = detector._get_linux_track()
+
+        self.assertEqual(track["artist"], "Test Artist")
+        self.assertEqual(bus.list_names.call_count, 2)
+
+    @patch('src.detection.now_playing.threading.Thread')
+    @patch.object(now_playing, '_mpris_bus', None)
+    def test_signal_loop_is_shared(self, mock_thread):
+        """Test every detector shares one bus and one GLib loop thread."""
+        glib = MagicMock()
+        modules = {
+            'dbus.mainloop': MagicMock(),
+            'dbus.mainloop.glib': glib,
+            'gi': MagicMock(),
+            'gi.repository': MagicMock(),
+        }
+        with patch.dict(sys.modules, modules):
+            first = now_playing._mpris_signal_bus()
+            second = now_playing._mpris_signal_bus()
+
+        self.assertIs(first, second)
+        glib.threads_init.assert_called_once()
+        mock_thread.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,10 @@
 """Tests for SongBPM scraper."""
 
+import time
 import unittest
-from unittest.mock import Mock, patch
-from src.api.scraper import SongBPMScraper
+from unittest.mock import MagicMock, Mock, patch
+from bs4 import BeautifulSoup
+from src.api.scraper import SongBPMScraper, _HTML_PARSER, _slugify
 
 
 class TestSongBPMScraper(unittest.TestCase):
@@ -60,7 +62,7 @@ class TestSongBPMScraper(unittest.TestCase):
         from bs4 import BeautifulSoup
 
         html = '<html><body><div>Tempo: 140 BPM</div></body></html>'
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, _HTML_PARSER)
 
         bpm = self.scraper._extract_bpm(soup)
 
@@ -71,12 +73,279 @@ class TestSongBPMScraper(unittest.TestCase):
         from bs4 import BeautifulSoup
 
         html = '<html><body><div>No tempo information</div></body></html>'
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, _HTML_PARSER)
 
         bpm = self.scraper._extract_bpm(soup)
 
         self.assertIsNone(bpm)
 
+    @patch.object(SongBPMScraper, '_extract_bpm')
+    def test_extract_bpm_from_html_fast_path(self, mock_extract):
+        """Test raw HTML is matched without parsing, ignoring script text."""
+        html = ('<html><head><script>var x = "99 BPM";</script></head>'
+                '<body><p>Tempo <b>140</b> BPM</p></body></html>')
+
+        bpm = self.scraper._extract_bpm_from_html(html)
+
+        self.assertEqual(bpm, 140.0)
+        mock_extract.assert_not_called()
+
+    def test_extract_bpm_from_html_falls_back_to_parse(self):
+        """Test pages without a BPM label fall back to the DOM strategies."""
+        html = '<html><body><span class="tempo">128</span></body></html>'
+
+        bpm = self.scraper._extract_bpm_from_html(html)
+
+        self.assertEqual(bpm, 128.0)
+
+    @patch('src.api.scraper.BeautifulSoup')
+    def test_extract_bpm_from_html_skips_parse_without_tempo(self, mock_soup):
+        """Test pages with no BPM label or tempo element are never parsed."""
+        html = '<html><body><p>Page not found</p></body></html>'
+
+        self.assertIsNone(self.scraper._extract_bpm_from_html(html))
+        mock_soup.assert_not_called()
+
+    def test_extract_bpm_from_html_decodes_entities(self):
+        """Test labels written with entities match like get_text() would."""
+        html = '<html><body><p>120&nbsp;BPM</p></body></html>'
+
+        self.assertEqual(self.scraper._extract_bpm_from_html(html), 120.0)
+        self.assertEqual(self.scraper.extract_bpm_many([html]), [120.0])
+        self.assertEqual(self.scraper._extract_bpm(BeautifulSoup(html, _HTML_PARSER)), 120.0)
+
+    @patch.object(SongBPMScraper, '_bpm_from_text', return_value=None)
+    def test_extract_bpm_from_html_parses_bpm_element(self, mock_text):
+        """Test a "BPM" element without "tempo" still reaches the DOM strategies."""
+        html = '<html><body><p>120 BPM</p></body></html>'
+
+        self.assertEqual(self.scraper._extract_bpm_from_html(html), 120.0)
+
+    def test_stream_bpm_stops_early(self):
+        """Test streaming stops once the song BPM label has been read."""
+        chunks = [
+            b'<html><body><div>Genre avg 100 B',
+            b'PM</div><script>var t = "99 BPM";</script><p>Tempo 1',
+            b'24 BPM</p>',
+            b'<p>never read</p></body></html>',
+        ]
+        consumed = []
+
+        def iter_content(chunk_size):
+            for chunk in chunks:
+                consumed.append(chunk)
+                yield chunk
+
+        response = Mock()
+        response.encoding = 'utf-8'
+        response.iter_content = iter_content
+
+        bpm = self.scraper._stream_bpm(response)
+
+        self.assertEqual(bpm, 124.0)
+        self.assertEqual(len(consumed), 3)
+
+    def test_stream_bpm_skips_script_across_chunks(self):
+        """Test a script block split over chunks never contributes labels."""
+        chunks = [
+            b'<p>Caf\xc3', b'\xa9 100 BPM</p><scr', b'ipt>var a = "150 ',
+            b'BPM";</scr', b'ipt ><p>Tempo 1', b'24 BPM</p>',
+        ]
+        response = Mock()
+        response.encoding = 'utf-8'
+        response.iter_content = lambda chunk_size: iter(chunks)
+
+        bpm = self.scraper._stream_bpm(response)
+
+        self.assertEqual(bpm, 124.0)
+
+    def test_stream_bpm_reads_whole_page_without_two_labels(self):
+        """Test streaming falls back to full-page extraction."""
+        response = Mock()
+        response.encoding = None
+        response.iter_content = lambda chunk_size: iter([b'<div>Tempo: 9', b'0 BPM</div>'])
+
+        bpm = self.scraper._stream_bpm(response)
+
+        self.assertEqual(bpm, 90.0)
+
+    @patch('src.api.scraper._STREAM_READ_LIMIT', 16)
+    def test_stream_bpm_stops_at_read_limit(self):
+        """Test streaming gives up on the page tail past the read limit."""
+        consumed = []
+
+        def iter_content(chunk_size):
+            for chunk in [b'<p>Tempo 96 BPM</p>', b'<p>never read</p>']:
+                consumed.append(chunk)
+                yield chunk
+
+        response = Mock()
+        response.encoding = 'utf-8'
+        response.iter_content = iter_content
+
+        bpm = self.scraper._stream_bpm(response)
+
+        self.assertEqual(bpm, 96.0)
+        self.assertEqual(len(consumed), 1)
+
+    def test_slugify(self):
+        """Test slugs are lowercased, dashed and stripped in one pass."""
+        self.assertEqual(_slugify("The Weeknd"), "the-weeknd")
+        self.assertEqual(_slugify("AC/DC"), "acdc")
+        self.assertEqual(_slugify("Guns N' Roses"), "guns-n-roses")
+        self.assertEqual(_slugify("Beyoncé"), "beyonc")
+
+    def test_extract_bpm_many_matches_single_page_rule(self):
+        """Test batch extraction picks the same BPM as per-page extraction."""
+        pages = [
+            '<div>Genre 100 BPM</div><p>Tempo 124 BPM</p>',
+            '<div>Tempo: 90 BPM</div>',
+            '<div>Clip 999 BPM</div><span class="tempo">128</span>',
+            '<div>No tempo information</div>',
+        ]
+
+        bpms = self.scraper.extract_bpm_many(pages)
+
+        self.assertEqual(bpms, [124.0, 90.0, 128.0, None])
+        self.assertEqual(bpms, [self.scraper._extract_bpm_from_html(p) for p in pages])
+        self.assertEqual(self.scraper.extract_bpm_many([]), [])
+
+    def test_release_connection_drains_small_remainder(self):
+        """Test a small unread body is drained so the connection is reused."""
+        drained = []
+        response = Mock()
+        response.headers = {'Content-Length': '20000'}
+        response.raw.tell.return_value = 8192
+        response.iter_content = lambda chunk_size: iter(drained.append(chunk_size) or [b'x'])
+
+        SongBPMScraper._release_connection(response)
+        self.assertEqual(len(drained), 1)
+
+        response.headers = {}
+        SongBPMScraper._release_connection(response)
+        self.assertEqual(len(drained), 1)
+
+    @patch.object(SongBPMScraper, '_run_playwright_search')
+    def test_playwright_hits_are_memoized(self, mock_run):
+        """Test repeat Playwright lookups reuse a hit but retry a miss."""
+        mock_run.return_value = {"bpm": 120.0}
+
+        self.scraper._search_via_playwright("Artist", "Song")
+        result = self.scraper._search_via_playwright("ARTIST", "song")
+
+        self.assertEqual(result, {"bpm": 120.0})
+        self.assertEqual(mock_run.call_count, 1)
+
+        mock_run.return_value = None
+        self.scraper._search_via_playwright("Other", "Song")
+        self.scraper._search_via_playwright("Other", "Song")
+        self.assertEqual(mock_run.call_count, 3)
+
+    @patch('src.api.scraper.requests.Session.get')
+    def test_direct_url_hit_skips_artist_page(self, mock_get):
+        """Test a direct song URL hit returns before artist-page browsing."""
+        hit = {"bpm": 120.0, "source": "songbpm_scraper"}
+        with patch.object(self.scraper, '_search_via_playwright', return_value=None), \
+                patch.object(self.scraper, '_search_direct_urls', return_value=hit) as mock_direct, \
+                patch.object(self.scraper, '_search_artist_page') as mock_artist_page:
+            result = self.scraper._search_page("Test Artist", "Test Song")
+
+        self.assertEqual(result, hit)
+        mock_direct.assert_called_once_with("Test Artist", "Test Song", "test-artist")
+        mock_artist_page.assert_not_called()
+        # The unused prefetched artist page is closed once it arrives
+        for _ in range(100):
+            if mock_get.return_value.close.called:
+                break
+            time.sleep(0.01)
+        mock_get.return_value.close.assert_called_once()
+
+    @patch('src.api.scraper.requests.Session.get')
+    def test_playwright_hit_skips_other_requests(self, mock_get):
+        """Test a Playwright hit doesn't fetch the artist page or probe URLs."""
+        hit = {"bpm": 120.0, "source": "songbpm_scraper"}
+        with patch.object(self.scraper, '_search_via_playwright', return_value=hit), \
+                patch.object(self.scraper, '_search_direct_urls') as mock_direct:
+            result = self.scraper._search_page("Test Artist", "Test Song")
+
+        self.assertEqual(result, hit)
+        mock_get.assert_not_called()
+        mock_direct.assert_not_called()
+
+    @patch('src.api.scraper.requests.Session.get')
+    def test_cancelled_search_stops_after_playwright(self, mock_get):
+        """Test a cancelled search doesn't go on to the direct URLs."""
+        import threading
+        cancel = threading.Event()
+
+        def cancelled_miss(*args):
+            cancel.set()
+            return None
+
+        with patch.object(self.scraper, '_search_via_playwright', side_effect=cancelled_miss), \
+                patch.object(self.scraper, '_search_direct_urls') as mock_direct:
+            result = self.scraper.search("Test Artist", "Test Song", cancel=cancel)
+
+        self.assertIsNone(result)
+        mock_direct.assert_not_called()
+        mock_get.assert_not_called()
+
+    def test_artist_page_follows_pagination(self):
+        """Test artist pages are paged through until the song link shows up."""
+        first_page = Mock(status_code=200, content=(
+            b'<html><body><a href="/@test-artist/other-song">Other</a>'
+            b'<a href="/@test-artist?after=abc">Next</a></body></html>'
+        ))
+        second_page = Mock(status_code=200, content=(
+            b'<html><body><a href="/@test-artist/test-song">Test Song</a></body></html>'
+        ))
+        self.scraper.session = Mock()
+        self.scraper.session.get.side_effect = [second_page, MagicMock()]
+
+        with patch.object(self.scraper, '_stream_bpm', return_value=120.0):
+            result = self.scraper._search_artist_page("Test Artist", "Test Song", "test-artist", first_page)
+
+        self.assertEqual(result["bpm"], 120.0)
+        self.assertEqual(result["url"], "https://songbpm.com/@test-artist/test-song")
+        next_url = self.scraper.session.get.call_args_list[0].args[0]
+        self.assertEqual(next_url, "https://songbpm.com/@test-artist?after=abc")
+
+    def test_direct_url_feat_variants(self):
+        """Test direct URL candidates cover the featured-artist slug styles."""
+        with patch.object(self.scraper, '_probe_direct_url', return_value=None) as mock_probe:
+            result = self.scraper._search_direct_urls("Artist", "Gang (feat. Duke Deuce)", "artist")
+
+        self.assertIsNone(result)
+        slugs = [call.args[0].rsplit('/', 1)[-1] for call in mock_probe.call_args_list]
+        self.assertEqual(slugs, [
+            "gang-feat.-duke-deuce",
+            "gang-feat--duke-deuce",
+            "gang-feat-duke-deuce",
+            "gang",
+        ])
+
+    def test_playwright_runs_on_one_thread_and_closes(self):
+        """Test browser work stays on one thread whichever thread calls in."""
+        import threading
+        threads = []
+
+        def fake_search(artist, title, cancel):
+            threads.append(threading.current_thread().name)
+            return None
+
+        with patch.object(self.scraper, '_playwright_search', side_effect=fake_search), \
+                patch.object(self.scraper, '_shutdown_browser') as mock_shutdown:
+            caller = threading.Thread(target=self.scraper._run_playwright_search, args=("A", "B"))
+            caller.start()
+            caller.join()
+            self.scraper._run_playwright_search("C", "D")
+
+            self.scraper.close()
+
+        self.assertEqual(len(threads), 2)
+        self.assertEqual(threads[0], threads[1])
+        self.assertTrue(threads[0].startswith("scraper-playwright"))
+        mock_shutdown.assert_called_once()
 
 if __name__ == '__main__':
     unittest.main()